@@ -1 +1,84 @@
-# conftest.py - for pytest hooks
\ No newline at end of file
+# conftest.py - for pytest hooks
+import io
+import json
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from media_management_sdk.exceptions import ApiBadRequest
+
+
+@pytest.fixture
+def make_response():
+    """Returns a factory for responses to return from a patched session.
+
+    The body is the JSON encoded ``data`` if given, otherwise ``content``, and
+    can be read in full or streamed.
+    """
+
+    def make(status_code=200, data=None, headers=None, content=b"{}"):
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers or {})
+        body = json.dumps(data).encode() if data is not None else content
+        response.raw = io.BytesIO(body)
+        return response
+
+    return make
+
+
+@pytest.fixture
+def make_mock_api():
+    """Returns a factory for a Mock API with a course, collections and images.
+
+    Uploading a file named "image<n>.png" creates the image with ID 100 + n,
+    unless the file is named in ``fail_on``, and records the name in
+    ``api.uploaded``. Each collection holds the course images ``course_image_ids``.
+    """
+
+    def make(course_image_ids=(1, 2, 3), num_collections=3, fail_on=()):
+        api = Mock()
+        api.retry_policy = None
+        api.uploaded = []
+
+        def upload_images(course_id, upload_files, title=None, stream=False):
+            names = [name for (name, fp, content_type) in upload_files]
+            if any(name in fail_on for name in names):
+                raise ApiBadRequest("bad file")
+            api.uploaded.extend(names)
+            return [{"id": int(name[5:-4]) + 100, "title": name} for name in names]
+
+        api.upload_images.side_effect = upload_images
+        api.update_image.side_effect = lambda image_id, course_id, **changes: dict(
+            changes, id=image_id
+        )
+        api.get_course.return_value = {"id": 1, "title": "Art History"}
+        api.list_collections.return_value = [
+            {"id": i, "title": f"Week {i}"} for i in range(1, num_collections + 1)
+        ]
+        api.get_collection.return_value = {"id": 5, "course_id": 1, "title": "Week 1"}
+        api.get_collection_images.side_effect = lambda collection_id: [
+            {
+                "id": collection_id * 100 + i,
+                "collection_id": collection_id,
+                "course_image_id": i,
+            }
+            for i in course_image_ids
+        ]
+        return api
+
+    return make
+
+
+@pytest.fixture
+def make_async_api():
+    """Returns a factory for an AsyncAPI whose requests are answered by ``handler``."""
+    httpx = pytest.importorskip("httpx")
+    from media_management_sdk.async_api import AsyncAPI
+
+    def make(handler, **kwargs):
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncAPI(base_url="http://localhost:8000/api", session=session, **kwargs)
+
+    return make
@@ -1 +1 @@
-from media_management_sdk.client import Client
+from media_management_sdk.client import AsyncClient, Client
@@ -1,20 +1,135 @@
+import concurrent.futures
+import contextlib
+import contextvars
+import copy
+import itertools
 import logging
-import json
+import re
+import time
+import urllib.parse
 import requests
-from typing import Any, Dict, List, IO, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    IO,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
+from media_management_sdk.cache import ObjectCache
+from media_management_sdk.circuit import CircuitBreaker
+from media_management_sdk.codec import (
+    JSONCodec,
+    JSONPageDecoder,
+    default_codec,
+    split_page,
+)
+from media_management_sdk.dedup import DedupIndex, DedupPlan
 from media_management_sdk.exceptions import (
+    ApiDeadlineExceededError,
     ApiError,
     ApiHTTPError,
     ApiBadRequest,
     ApiForbiddenError,
     ApiNotFoundError,
 )
+from media_management_sdk.http_cache import CachedResponse, ResponseCache
+from media_management_sdk.models import parse_response
+from media_management_sdk.multipart import MultipartEncoder
+from media_management_sdk.progress import ProgressMultipartEncoder, UploadProgress
+from media_management_sdk.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from media_management_sdk.throttle import Throttle
+from media_management_sdk.timeouts import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    TimeoutConfig,
+    time_remaining,
+)
+from media_management_sdk.transform import ImageTransformer
 
 logger = logging.getLogger(__name__)
 
 GET, POST, PUT, DELETE = ("get", "post", "put", "delete")
-DEFAULT_TIMEOUT = 30
+HTTP_METHODS = (GET, POST, PUT, DELETE)
+DEFAULT_TIMEOUT = DEFAULT_READ_TIMEOUT
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Maps each endpoint URL (relative to the base URL) to the name of the API method that requests it.
+ENDPOINTS = [
+    (method, re.compile(pattern), name)
+    for (method, pattern, name) in (
+        (POST, r"/auth/authorize-user", "authorize_user"),
+        (GET, r"/courses", "list_courses"),
+        (GET, r"/courses/search", "search_courses"),
+        (GET, r"/courses/(?P<course_id>[^/]+)", "get_course"),
+        (POST, r"/courses", "create_course"),
+        (PUT, r"/courses/(?P<course_id>[^/]+)", "update_course"),
+        (DELETE, r"/courses/(?P<course_id>[^/]+)", "delete_course"),
+        (POST, r"/courses/(?P<course_id>[^/]+)/course_copy", "copy_course"),
+        (GET, r"/courses/(?P<course_id>[^/]+)/collections", "list_collections"),
+        (POST, r"/courses/(?P<course_id>[^/]+)/collections", "create_collection"),
+        (GET, r"/collections/(?P<collection_id>[^/]+)", "get_collection"),
+        (GET, r"/collections/(?P<collection_id>[^/]+)/images", "get_collection_images"),
+        (PUT, r"/collections/(?P<collection_id>[^/]+)", "update_collection"),
+        (DELETE, r"/collections/(?P<collection_id>[^/]+)", "delete_collection"),
+        (POST, r"/courses/(?P<course_id>[^/]+)/images", "upload_images"),
+        (GET, r"/images/(?P<image_id>[^/]+)", "get_image"),
+        (PUT, r"/images/(?P<image_id>[^/]+)", "update_image"),
+        (DELETE, r"/images/(?P<image_id>[^/]+)", "delete_image"),
+    )
+]
+
+# Limits on the size of the request details that are logged.
+LOG_MAX_ITEMS = 10
+LOG_MAX_STRING_LENGTH = 200
+
+
+def _truncate_for_log(value: Any, depth: int = 0) -> Any:
+    """Returns a copy of a value that is small enough to log.
+
+    Lists and dicts keep their first LOG_MAX_ITEMS items, strings their first
+    LOG_MAX_STRING_LENGTH characters, and bytes are replaced by their size.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        if len(value) <= LOG_MAX_STRING_LENGTH:
+            return value
+        return f"{value[:LOG_MAX_STRING_LENGTH]}... ({len(value)} chars)"
+    if isinstance(value, (bytes, bytearray)):
+        return f"<{len(value)} bytes>"
+    if depth >= 3:
+        return "..."
+    if isinstance(value, Mapping):
+        truncated = {
+            str(k): _truncate_for_log(v, depth + 1)
+            for (k, v) in itertools.islice(value.items(), LOG_MAX_ITEMS)
+        }
+        if len(value) > LOG_MAX_ITEMS:
+            truncated["..."] = f"{len(value) - LOG_MAX_ITEMS} more"
+        return truncated
+    if isinstance(value, (list, tuple)):
+        truncated_list = [
+            _truncate_for_log(v, depth + 1) for v in value[:LOG_MAX_ITEMS]
+        ]
+        if len(value) > LOG_MAX_ITEMS:
+            truncated_list.append(f"... ({len(value) - LOG_MAX_ITEMS} more)")
+        return truncated_list
+    return _truncate_for_log(repr(value), depth)
+
+
+def _file_name(file: Any) -> Any:
+    """Returns the file name from a requests-style ("field", (name, fp, type)) tuple."""
+    try:
+        return file[1][0]
+    except (IndexError, KeyError, TypeError):
+        return None
 
 
 class API(object):
@@ -23,18 +138,158 @@ class API(object):
     """
 
     def __init__(
-        self, base_url: Optional[str] = None, access_token: Optional[str] = None
+        self,
+        base_url: Optional[str] = None,
+        access_token: Optional[str] = None,
+        session: Optional[Any] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        response_cache: Optional[ResponseCache] = None,
+        object_cache: Optional[ObjectCache] = None,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        throttle: Optional[Throttle] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        timeouts: Optional[TimeoutConfig] = None,
+        codec: Optional[JSONCodec] = None,
+        return_models: bool = False,
+        dedup_index: Optional[DedupIndex] = None,
+        transformer: Optional[ImageTransformer] = None,
+        on_forbidden: Optional[Callable[[], Any]] = None,
     ) -> None:
         """API constructor.
 
+        All requests are sent through a single long-lived session so that
+        connections are pooled and reused between calls. The instance can be
+        used as a context manager, or closed explicitly with :meth:`close`.
+
         Args:
             base_url: The base URL that will prefix all
                 endpoint requests. Defaults to None.
             access_token: The access token to use for requests
                 that require authorization. Defaults to None.
+            session: An existing session to use for requests. When provided,
+                the pool settings are ignored and the caller remains
+                responsible for closing it. Defaults to None.
+            pool_connections: Number of host connection pools to cache. Defaults to 10.
+            pool_maxsize: Maximum number of connections to keep per host. Defaults to 10.
+            pool_block: Whether to block when no free connections are available
+                in the pool instead of opening a new one. Defaults to False.
+            keep_alive: Whether to keep connections open between requests. Defaults to True.
+            response_cache: Cache for GET responses that carry an ETag or
+                Last-Modified validator. Cached responses are revalidated with a
+                conditional request and reused when the server responds with
+                304 Not Modified. Defaults to None (no caching).
+            object_cache: Cache for the data returned by get_course, list_collections,
+                get_collection and get_image, which is reused without a request
+                until it expires or is invalidated by a successful update, delete
+                or create through this instance. Defaults to None (no caching).
+            retry_policy: Policy for retrying requests that fail with a connection
+                error, timeout or transient HTTP error. By default, idempotent
+                requests are attempted up to 3 times with exponential backoff.
+                None disables retries.
+            throttle: Limits the request rate and the number of concurrent
+                requests. May be shared with other instances. Defaults to None.
+            circuit_breaker: Fails requests fast with ApiCircuitOpenError while
+                the API is failing. May be shared with other instances. Defaults to None.
+            timeouts: Connect and read timeouts, with overrides per endpoint.
+                Defaults to a 10s connect and 30s read timeout, and a 300s read
+                timeout for upload_images and copy_course.
+            codec: Codec used to encode JSON request bodies and decode responses.
+                Defaults to orjson when installed, otherwise the standard library.
+            return_models: Return courses, collections and images as typed, slotted
+                models (see :mod:`media_management_sdk.models`) instead of dicts.
+                Defaults to False.
+            dedup_index: Index of the files uploaded to each course by content
+                hash. Files already in the course library are not uploaded again,
+                and their existing image records are returned instead (see
+                :mod:`media_management_sdk.dedup`). Defaults to None (no dedup).
+            transformer: Downscales and recompresses images before they are
+                uploaded, in a process pool (see :mod:`media_management_sdk.transform`).
+                Files skipped by the dedup index are not transformed. Defaults to None.
+            on_forbidden: Called when any request is forbidden (HTTP 403), before
+                ApiForbiddenError is raised. Defaults to None.
         """
         self.base_url = base_url
         self.access_token = access_token
+        self.response_cache = response_cache
+        self.object_cache = object_cache
+        self.retry_policy = retry_policy
+        self.throttle = throttle
+        self.circuit_breaker = circuit_breaker
+        self.timeouts = timeouts if timeouts is not None else TimeoutConfig()
+        self.codec = codec if codec is not None else default_codec()
+        self.return_models = return_models
+        self.dedup_index = dedup_index
+        self.transformer = transformer
+        self.on_forbidden = on_forbidden
+        self._owns_session = session is None
+        if session is None:
+            session = self._create_session(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+            )
+        self.session = session
+
+    def _create_session(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: bool,
+    ) -> Any:
+        """Creates a session with a connection pool mounted for HTTP and HTTPS."""
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self) -> None:
+        """Closes the underlying session and releases pooled connections.
+
+        Sessions passed in by the caller are left open.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def with_access_token(
+        self,
+        access_token: Optional[str],
+        on_forbidden: Optional[Callable[[], Any]] = None,
+    ) -> "API":
+        """Returns a view of the API that sends requests with another access token.
+
+        The view shares the session, caches and all other settings with this
+        instance, so a view per user can be used concurrently where setting
+        ``access_token`` on a shared instance would mix up the users' requests.
+        Closing the view leaves the session open.
+
+        Args:
+            access_token: The access token to use for requests.
+            on_forbidden: Called when any request of the view is forbidden
+                (HTTP 403), instead of the callback of this instance. Defaults to None.
+        """
+        api = copy.copy(self)
+        api.access_token = access_token
+        api.on_forbidden = on_forbidden
+        api._owns_session = False
+        return api
+
+    def __enter__(self) -> "API":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     @property
     def headers(self) -> Dict[str, str]:
@@ -52,7 +307,7 @@ class API(object):
         return f"Bearer {self.access_token}" if self.access_token is not None else ""
 
     def _do_request(self, method: str, url: str, **kwargs: Any) -> Any:
-        """Performs the HTTP request, delegating to the requests library for
+        """Performs the HTTP request, delegating to the pooled session for
         the actual request itself.
 
         This method centralizes exception handling and logging as
@@ -62,7 +317,7 @@ class API(object):
             method: A valid HTTP method (e.g. get, post, put, delete).
             url: The endpoint URL.
             **kwargs: Arbitrary keyword arguments. These are passed directly
-                to the underlying request method (e.g. requests.get).
+                to the underlying session method (e.g. Session.get).
 
         Raises:
             ValueError: If the request method is invalid.
@@ -74,46 +329,526 @@ class API(object):
         Returns:
             Response data.
         """
-        request_callable = getattr(requests, method)
-        if not request_callable:
+        endpoint = self._resolve_endpoint(method, url)
+        self._prepare_request(method, url, kwargs, endpoint[0])
+        data = self._lookup_object_cache(endpoint, kwargs)
+        if data is not None:
+            return self._parse_response(endpoint[0], data)
+
+        cache_key, cached = self._lookup_response_cache(method, url, kwargs)
+        r = self._send_request(method, url, kwargs)
+
+        if cached is not None and r.status_code == 304:
+            data = self._decode_response(200, lambda: self.codec.loads(cached.body))
+        else:
+            data = self._decode_response(
+                r.status_code, lambda: self.codec.loads(r.content)
+            )
+            if cache_key is not None:
+                self._store_response_cache(cache_key, r.content, r.headers)
+        self._update_object_cache(endpoint, kwargs, data)
+        self._update_dedup_index(endpoint)
+        return self._parse_response(endpoint[0], data)
+
+    def _send_request(self, method: str, url: str, kwargs: Dict[str, Any]) -> Any:
+        """Sends a prepared request, retrying transient failures.
+
+        Returns:
+            The response, which has a successful (or 304 Not Modified) status.
+
+        Raises:
+            ApiForbiddenError: If HTTP 403 response.
+            ApiNotFoundError: If HTTP 404 response.
+            ApiHTTPError: If any other 4xx or 5xx response
+            ApiError: If any other request exception
+        """
+        request_callable = getattr(self.session, method)
+        attempt = 0
+        while True:
+            attempt += 1
+            self._check_circuit_breaker()
+            recorded = False
+            try:
+                try:
+                    with self.throttle or contextlib.nullcontext():
+                        # after the throttle wait, which counts against the deadline
+                        timeout = self._get_attempt_timeout(kwargs["timeout"])
+                        r = request_callable(url, **dict(kwargs, timeout=timeout))
+                    r.raise_for_status()
+                except requests.exceptions.HTTPError as e:
+                    status_code = e.response.status_code
+                    self._record_attempt(status_code)
+                    recorded = True
+                    delay = self._get_retry_delay(
+                        method, kwargs, attempt, status_code, e.response.headers
+                    )
+                    if delay is not None:
+                        if kwargs.get("stream"):
+                            e.response.close()
+                        time.sleep(delay)
+                        continue
+                    logger.exception("HTTP error")
+                    self._raise_for_status(status_code, e.response.text)
+                except requests.exceptions.RequestException as e:
+                    retryable = isinstance(
+                        e,
+                        (
+                            requests.exceptions.ConnectionError,
+                            requests.exceptions.Timeout,
+                        ),
+                    )
+                    if retryable:
+                        self._record_attempt(None)
+                        recorded = True
+                        delay = self._get_retry_delay(method, kwargs, attempt)
+                        if delay is not None:
+                            time.sleep(delay)
+                            continue
+                    logger.exception("Request error")
+                    raise ApiError("Request exception: " + str(e))
+                self._record_attempt(r.status_code)
+                recorded = True
+                return r
+            finally:
+                # e.g. a request error that says nothing about the API's health
+                if not recorded:
+                    self._release_circuit_breaker()
+
+    def _iter_request(
+        self, method: str, url: str, prefetch: bool = False, **kwargs: Any
+    ) -> Iterator[Any]:
+        """Performs a request for a list and yields its items as they are decoded.
+
+        Paginated responses (``{"results": [...], "next": "<url>"}``, or a JSON
+        array with a ``Link: <url>; rel="next"`` header) are followed until the
+        last page. The request is sent when iteration starts, and the response
+        and object caches are bypassed.
+
+        Args:
+            method: A valid HTTP method.
+            url: The endpoint URL.
+            prefetch: Fetch the next page in a background thread while the
+                items of the current page are consumed. Each page is then read
+                in full before its items are yielded. Otherwise the response is
+                streamed, so memory use stays flat regardless of the number of
+                items. Defaults to False.
+            **kwargs: Arbitrary keyword arguments passed to the session method.
+
+        Raises:
+            ApiError: If a request fails or a response is not a list.
+        """
+        endpoint_name, _ = self._resolve_endpoint(method, url)
+        self._prepare_request(method, url, kwargs, endpoint_name)
+        if prefetch:
+            yield from self._iter_prefetched_pages(method, url, kwargs, endpoint_name)
+            return
+
+        page_url: Optional[str] = url
+        while page_url is not None:
+            r = self._send_request(method, page_url, dict(kwargs, stream=True))
+            decoder = JSONPageDecoder(self.codec.loads)
+            try:
+                if r.status_code != 204:
+                    for chunk in r.iter_content(DEFAULT_STREAM_CHUNK_SIZE):
+                        yield from self._parse_response(
+                            endpoint_name, decoder.feed(chunk)
+                        )
+                    yield from self._parse_response(endpoint_name, decoder.close())
+            except ValueError:
+                error_msg = "No JSON list could be decoded"
+                logger.exception(error_msg)
+                raise ApiError(error_msg)
+            except requests.exceptions.RequestException as e:
+                logger.exception("Request error")
+                raise ApiError("Request exception: " + str(e))
+            finally:
+                r.close()
+            page_url = self._next_page_url(page_url, decoder.next_url, r.links)
+            kwargs = self._next_page_kwargs(kwargs)
+
+    def _iter_prefetched_pages(
+        self,
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+        endpoint_name: Optional[str] = None,
+    ) -> Iterator[Any]:
+        """Yields the items of each page while the next page is fetched in a thread."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future: Optional[concurrent.futures.Future] = executor.submit(
+                contextvars.copy_context().run, self._fetch_page, method, url, kwargs
+            )
+            try:
+                while future is not None:
+                    items, next_url = future.result()
+                    future = None
+                    if next_url is not None:
+                        kwargs = self._next_page_kwargs(kwargs)
+                        future = executor.submit(
+                            contextvars.copy_context().run,
+                            self._fetch_page,
+                            method,
+                            next_url,
+                            kwargs,
+                        )
+                    yield from self._parse_response(endpoint_name, items)
+            finally:
+                if future is not None:
+                    future.cancel()
+
+    def _fetch_page(
+        self, method: str, url: str, kwargs: Dict[str, Any]
+    ) -> Tuple[List[Any], Optional[str]]:
+        """Fetches one page of a list in full.
+
+        Returns:
+            The items on the page and the URL of the next page, if any.
+        """
+        return self._read_page(url, self._send_request(method, url, kwargs))
+
+    def _read_page(self, url: str, r: Any) -> Tuple[List[Any], Optional[str]]:
+        """Decodes a page of a list from a response that has been read in full."""
+        if r.status_code == 204:
+            return [], None
+        page = self._decode_response(r.status_code, lambda: self.codec.loads(r.content))
+        try:
+            items, next_url = split_page(page)
+        except ValueError:
+            error_msg = "No JSON list could be decoded"
+            logger.exception(error_msg)
+            raise ApiError(error_msg)
+        return items, self._next_page_url(url, next_url, r.links)
+
+    @staticmethod
+    def _next_page_url(
+        url: str, next_url: Optional[str], links: Mapping[str, Dict[str, str]]
+    ) -> Optional[str]:
+        """Returns the absolute URL of the next page, from the page body or its Link header."""
+        if next_url is None:
+            next_url = (links.get("next") or {}).get("url")
+        return urllib.parse.urljoin(url, next_url) if next_url else None
+
+    @staticmethod
+    def _next_page_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Drops the query parameters, which are already part of the next page URL."""
+        return {k: v for (k, v) in kwargs.items() if k != "params"}
+
+    def _prepare_request(
+        self,
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+        endpoint_name: Optional[str] = None,
+    ) -> None:
+        """Validates the request, applies defaults to kwargs in place, and logs it.
+
+        The default timeout is the one configured for the endpoint. A ``json``
+        body is encoded to bytes with the codec and sent as ``data``.
+
+        Raises:
+            ValueError: If the request method or URL is invalid.
+        """
+        if method not in HTTP_METHODS:
             raise ValueError(f"Invalid request method: {method}")
         if not url:
             raise ValueError("URL must be provided for the request")
 
-        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        kwargs.setdefault(
+            "timeout", self.timeouts.for_endpoint(endpoint_name).as_tuple()
+        )
+
+        # The summary is only built when it will be logged, since it walks
+        # the request body.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "API request [%s %s]",
+                method,
+                url,
+                extra={
+                    "api_request": self._summarize_request(
+                        method, url, kwargs, endpoint_name
+                    )
+                },
+            )
+
+        if kwargs.get("json") is not None:
+            kwargs["data"] = self.codec.dumps(kwargs.pop("json"))
+            headers = dict(kwargs.get("headers") or {})
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["headers"] = headers
+
+    @staticmethod
+    def _summarize_request(
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+        endpoint_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Summarizes a request for logging, omitting a few items such as:
+        - headers, because they may contain auth credentials
+        - file contents and streamed bodies, because they may be large binary data
+
+        Long strings and collections in the parameters and body are truncated.
+        """
+        summary: Dict[str, Any] = dict(method=method, url=url, endpoint=endpoint_name)
+        for key in ("params", "json", "timeout"):
+            if key in kwargs:
+                summary[key] = _truncate_for_log(kwargs[key])
+        data = kwargs.get("data")
+        if isinstance(data, MultipartEncoder):
+            summary["data"] = f"<multipart body, {data.len} bytes>"
+        elif data is not None:
+            summary["data"] = _truncate_for_log(data)
+        if kwargs.get("files"):
+            summary["files"] = _truncate_for_log(
+                [_file_name(file) for file in kwargs["files"]]
+            )
+        return summary
+
+    def _check_circuit_breaker(self) -> None:
+        """Raises ApiCircuitOpenError if the circuit breaker does not allow a request."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+
+    def _release_circuit_breaker(self) -> None:
+        """Hands back the circuit breaker probe slot of an attempt that ended
+        without an outcome, so that a half-open breaker can send another probe."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release_probe()
+
+    def _record_attempt(self, status_code: Optional[int]) -> None:
+        """Records the outcome of an attempt with the circuit breaker.
+
+        Args:
+            status_code: The HTTP status code, or None if the request failed
+                with a connection error or timeout.
+        """
+        if self.circuit_breaker is None:
+            return
+        if status_code is None or status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+    def _get_retry_delay(
+        self,
+        method: str,
+        kwargs: Dict[str, Any],
+        attempt: int,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[float]:
+        """Returns the number of seconds to wait before retrying a failed attempt,
+        or None if it should not be retried.
+
+        Requests that upload files are never retried here, since the file
+        objects have already been consumed. Retries that would not start before
+        the current deadline are skipped.
+        """
+        if self.retry_policy is None:
+            return None
+        if "files" in kwargs or isinstance(kwargs.get("data"), MultipartEncoder):
+            return None
+        # encoded JSON bodies are passed to httpx as bytes, uploads as a stream
+        if not isinstance(kwargs.get("content", b""), bytes):
+            return None
+        if not self.retry_policy.should_retry(method, attempt, status_code):
+            return None
+
+        retry_after = headers.get("Retry-After") if headers is not None else None
+        delay = self.retry_policy.get_delay(attempt, retry_after)
+        remaining = time_remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+        logger.warning("Retrying request after attempt %d in %.2fs", attempt, delay)
+        return delay
+
+    def _get_attempt_timeout(self, timeout: Any) -> Any:
+        """Reduces the request timeout to the time remaining until the current deadline.
+
+        Raises:
+            ApiDeadlineExceededError: If the deadline has passed.
+        """
+        remaining = time_remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise ApiDeadlineExceededError("Deadline exceeded, request not sent")
+        if isinstance(timeout, tuple):
+            return tuple(
+                min(t, remaining) if t is not None else remaining for t in timeout
+            )
+        return min(timeout, remaining) if timeout is not None else remaining
+
+    def _resolve_endpoint(
+        self, method: str, url: str
+    ) -> Tuple[Optional[str], Dict[str, str]]:
+        """Finds the endpoint for a request.
 
-        # Log the request, omitting a few items such as:
-        # - headers, because they may contain auth credentials
-        # - file objects, because they may contain binary data
-        log_kwargs = json.dumps(
-            {k: kwargs[k] for k in kwargs if k != "headers" and k != "files"}
+        Returns:
+            The name of the API method for the endpoint (None if the URL is not
+            a known endpoint) and the parameters parsed from the URL path.
+        """
+        base_url = self.base_url or ""
+        if not url.startswith(base_url):
+            return None, {}
+        path = url[len(base_url) :]
+        for endpoint_method, pattern, name in ENDPOINTS:
+            if endpoint_method == method:
+                match = pattern.fullmatch(path)
+                if match:
+                    return name, match.groupdict()
+        return None, {}
+
+    def _lookup_object_cache(
+        self, endpoint: Tuple[Optional[str], Dict[str, str]], kwargs: Dict[str, Any]
+    ) -> Any:
+        """Returns cached data for a read endpoint, or None if not cached."""
+        name, path_params = endpoint
+        if self.object_cache is None or not self.object_cache.is_cacheable(name):
+            return None
+        return self.object_cache.get(
+            name,  # type: ignore
+            self._resource_id(path_params),
+            (kwargs.get("headers") or {}).get("Authorization", ""),
         )
-        logger.info(f"API request [{method} {url}] {log_kwargs}")
 
-        try:
-            r = request_callable(url, **kwargs)
-            r.raise_for_status()
-        except requests.exceptions.HTTPError as e:
-            logging.exception("HTTP error")
-            status_code = e.response.status_code
-            detail = e.response.text  ## TODO: this might be json
-            if status_code == 400:
-                raise ApiBadRequest(detail)
-            if status_code == 403:
-                raise ApiForbiddenError(detail)
-            elif status_code == 404:
-                raise ApiNotFoundError(detail)
-            else:
-                raise ApiHTTPError(f"HTTP error status code: {status_code}")
-        except requests.exceptions.RequestException as e:
-            logger.exception("Request error")
-            raise ApiError("Request exception: " + str(e))
+    def _update_object_cache(
+        self,
+        endpoint: Tuple[Optional[str], Dict[str, str]],
+        kwargs: Dict[str, Any],
+        data: Any,
+    ) -> None:
+        """Caches data from a read endpoint, or invalidates data made stale by a write."""
+        name, path_params = endpoint
+        if self.object_cache is None or name is None:
+            return
+        if self.object_cache.is_cacheable(name):
+            self.object_cache.set(
+                name,
+                self._resource_id(path_params),
+                (kwargs.get("headers") or {}).get("Authorization", ""),
+                data,
+            )
+        else:
+            self.object_cache.invalidate_for_write(name, path_params)
+
+    def _update_dedup_index(
+        self, endpoint: Tuple[Optional[str], Dict[str, str]]
+    ) -> None:
+        """Removes the dedup entries for a deleted image or course."""
+        name, path_params = endpoint
+        if self.dedup_index is None:
+            return
+        if name == "delete_image":
+            self.dedup_index.forget_image(path_params["image_id"])
+        elif name == "delete_course":
+            self.dedup_index.forget_course(path_params["course_id"])
+
+    def _plan_upload(
+        self, course_id: int, upload_files: List[Tuple[str, IO, str]]
+    ) -> Optional[DedupPlan]:
+        """Hashes the files to upload, if dedup is enabled."""
+        if self.dedup_index is None:
+            return None
+        plan = DedupPlan(self.dedup_index, course_id, upload_files)
+        if plan.skipped:
+            logger.info(
+                "Skipping upload of %d of %d files already in course %s",
+                plan.skipped,
+                len(upload_files),
+                course_id,
+            )
+        return plan
+
+    def _complete_upload(self, plan: DedupPlan, uploaded: List[Any]) -> List[Any]:
+        """Records the uploaded images and merges them with the existing ones."""
+        plan.images = [
+            self._parse_response("upload_images", image) for image in plan.images
+        ]
+        return plan.complete(uploaded)
 
-        if r.status_code == 204:
+    def _parse_response(self, endpoint_name: Optional[str], data: Any) -> Any:
+        """Converts response data to models if ``return_models`` is enabled."""
+        if not self.return_models:
+            return data
+        return parse_response(endpoint_name, data)
+
+    @staticmethod
+    def _resource_id(path_params: Dict[str, str]) -> str:
+        return next(iter(path_params.values()), "")
+
+    def _lookup_response_cache(
+        self, method: str, url: str, kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[CachedResponse]]:
+        """Looks up a cached response for a GET request.
+
+        When one is found, conditional headers are added to kwargs in place
+        so that the server can respond with 304 Not Modified.
+
+        Returns:
+            The cache key (None if the request is not cacheable) and the cached response.
+        """
+        if method != GET or self.response_cache is None:
+            return None, None
+
+        headers = dict(kwargs.get("headers") or {})
+        cache_key = self.response_cache.make_key(
+            url, kwargs.get("params"), headers.get("Authorization", "")
+        )
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            headers.update(cached.conditional_headers)
+            kwargs["headers"] = headers
+        return cache_key, cached
+
+    def _store_response_cache(
+        self, cache_key: str, body: bytes, headers: Mapping[str, str]
+    ) -> None:
+        """Caches a response body if the response has validators."""
+        assert self.response_cache is not None
+        cached = CachedResponse.from_response(body, headers)
+        if cached is None:
+            self.response_cache.delete(cache_key)
+        else:
+            self.response_cache.set(cache_key, cached)
+
+    def _raise_for_status(self, status_code: int, detail: str) -> None:
+        """Maps an HTTP error status code to the corresponding exception.
+
+        The ``on_forbidden`` callback, if any, is called before ApiForbiddenError
+        is raised.
+
+        Raises:
+            ApiBadRequest: If HTTP 400 response.
+            ApiForbiddenError: If HTTP 403 response.
+            ApiNotFoundError: If HTTP 404 response.
+            ApiHTTPError: If any other 4xx or 5xx response
+        """
+        # TODO: detail might be json
+        if status_code == 400:
+            raise ApiBadRequest(detail)
+        if status_code == 403:
+            if self.on_forbidden is not None:
+                self.on_forbidden()
+            raise ApiForbiddenError(detail)
+        elif status_code == 404:
+            raise ApiNotFoundError(detail)
+        else:
+            raise ApiHTTPError(f"HTTP error status code: {status_code}")
+
+    @staticmethod
+    def _decode_response(status_code: int, json_callable: Callable[[], Any]) -> Any:
+        """Decodes the JSON response body.
+
+        Raises:
+            ApiError: If the response body is not valid JSON.
+        """
+        if status_code == 204:
             return {}
 
         try:
-            data = r.json()
+            data = json_callable()
         except ValueError as e:
             error_msg = "No JSON object could be decoded"
             logger.exception(error_msg)
@@ -170,6 +905,46 @@ class API(object):
             method=GET, url=url, headers=self.headers, params=params
         )
 
+    def iter_courses(
+        self,
+        lti_context_id: Optional[str] = None,
+        lti_tool_consumer_instance_guid: Optional[str] = None,
+        canvas_course_id: Optional[int] = None,
+        sis_course_id: Optional[str] = None,
+        title: Optional[str] = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict]:
+        """Iterate over courses, decoding them one at a time as the response is received.
+
+        Like :meth:`list_courses`, but memory use stays flat for large listings,
+        and paginated responses are followed until the last page.
+
+        Args:
+            lti_context_id: LTI context ID. Defaults to None.
+            lti_tool_consumer_instance_guid: LTI consumer instance GUID. Defaults to None.
+            canvas_course_id: Canvas course ID. Defaults to None.
+            sis_course_id: SIS course ID. Defaults to None.
+            title: Course title. Defaults to None.
+            prefetch: Fetch the next page while the current page is consumed. Defaults to False.
+
+        Returns:
+            Iterator over the courses.
+
+        Raises:
+            ApiError: Raised on 4XX or 5XX error response.
+        """
+        url = f"{self.base_url}/courses"
+        params = dict(
+            lti_context_id=lti_context_id,
+            lti_tool_consumer_instance_guid=lti_tool_consumer_instance_guid,
+            canvas_course_id=canvas_course_id,
+            sis_course_id=sis_course_id,
+            title=title,
+        )
+        return self._iter_request(
+            method=GET, url=url, prefetch=prefetch, headers=self.headers, params=params
+        )
+
     def search_courses(self, text: str = "") -> List[dict]:
         """Search courses.
 
@@ -188,6 +963,28 @@ class API(object):
             method=GET, url=url, headers=self.headers, params=params
         )
 
+    def iter_search_courses(
+        self, text: str = "", prefetch: bool = False
+    ) -> Iterator[dict]:
+        """Iterate over course search results, decoding them one at a time and
+        following paginated responses.
+
+        Args:
+            text: Search text.
+            prefetch: Fetch the next page while the current page is consumed. Defaults to False.
+
+        Returns:
+            Iterator over the matching courses.
+
+        Raises:
+            ApiError: Raised on 4XX or 5XX error response.
+        """
+        url = f"{self.base_url}/courses/search"
+        params = dict(q=text)
+        return self._iter_request(
+            method=GET, url=url, prefetch=prefetch, headers=self.headers, params=params
+        )
+
     def get_course(self, course_id: int) -> dict:
         """Get a course.
 
@@ -367,6 +1164,27 @@ class API(object):
         url = f"{self.base_url}/collections/{collection_id}/images"
         return self._do_request(method=GET, url=url, headers=self.headers)
 
+    def iter_collection_images(
+        self, collection_id: int, prefetch: bool = False
+    ) -> Iterator[dict]:
+        """Iterate over collection images, decoding them one at a time and
+        following paginated responses.
+
+        Args:
+            collection_id: Collection ID.
+            prefetch: Fetch the next page while the current page is consumed. Defaults to False.
+
+        Returns:
+            Iterator over the collection images.
+
+        Raises:
+            ApiError: Raised on 4XX or 5XX error response.
+        """
+        url = f"{self.base_url}/collections/{collection_id}/images"
+        return self._iter_request(
+            method=GET, url=url, prefetch=prefetch, headers=self.headers
+        )
+
     def create_collection(
         self, course_id: int, title: str, description: Optional[str] = None
     ) -> dict:
@@ -446,6 +1264,8 @@ class API(object):
         file_name: str,
         content_type: str,
         title: str,
+        stream: bool = False,
+        progress: Optional[Callable[[UploadProgress], Any]] = None,
     ) -> List[dict]:
         """Upload a single image to the course.
 
@@ -456,6 +1276,9 @@ class API(object):
             content_type: The MIME type for the file.
             title: Title to use for the file. Note that if
                 not specified, the original file name will be used. Defaults to None.
+            stream: Stream the request body from the file instead of building
+                it in memory. Defaults to False.
+            progress: Called with the progress of the upload. Defaults to None.
 
         Returns:
             Response data.
@@ -464,7 +1287,11 @@ class API(object):
             ApiError: Raised on 4XX or 5XX error response.
         """
         return self.upload_images(
-            course_id, [(file_name, upload_file, content_type)], title=title
+            course_id,
+            [(file_name, upload_file, content_type)],
+            title=title,
+            stream=stream,
+            progress=progress,
         )
 
     def upload_images(
@@ -472,6 +1299,8 @@ class API(object):
         course_id: int,
         upload_files: List[Tuple[str, IO, str]],
         title: Optional[str] = None,
+        stream: bool = False,
+        progress: Optional[Callable[[UploadProgress], Any]] = None,
     ) -> List[dict]:
         """Upload images to the course.
 
@@ -480,13 +1309,51 @@ class API(object):
             upload_files: List of file tuples: (filename, file, content_type).
             title: Title to use for the file or list of files. Note that if
                 not specified, the original file name will be used. Defaults to None.
+            stream: Stream the multipart request body, reading each file in chunks
+                as it is sent, so that memory use stays constant regardless of the
+                size or number of files. With a ``transformer``, each file is still
+                read into memory in full to be transformed, so memory use grows with
+                the size of the files. Defaults to False.
+            progress: Called with an :class:`~media_management_sdk.progress.UploadProgress`
+                as the request body is sent: at most every 0.1s, after each file and
+                at the end. Implies ``stream``. Defaults to None.
 
         Returns:
-            Response data.
+            Response data. With a dedup index, the image records for the files
+            in the order given, including existing records for skipped files,
+            and None for any file whose record is missing from the response.
 
         Raises:
             ApiError: Raised on 4XX or 5XX error response.
         """
+        plan = self._plan_upload(course_id, upload_files)
+        if plan is None:
+            upload_files = self._transform_files(upload_files)
+            return self._upload_images(course_id, upload_files, title, stream, progress)
+        uploaded = []
+        if plan.pending_files:
+            upload_files = self._transform_files(plan.pending_files)
+            uploaded = self._upload_images(
+                course_id, upload_files, title, stream, progress
+            )
+        return self._complete_upload(plan, uploaded)
+
+    def _transform_files(
+        self, upload_files: List[Tuple[str, IO, str]]
+    ) -> List[Tuple[str, IO, str]]:
+        """Transforms the files to upload, if a transformer is configured."""
+        if self.transformer is None:
+            return upload_files
+        return self.transformer.transform_files(upload_files)
+
+    def _upload_images(
+        self,
+        course_id: int,
+        upload_files: List[Tuple[str, IO, str]],
+        title: Optional[str],
+        stream: bool,
+        progress: Optional[Callable[[UploadProgress], Any]] = None,
+    ) -> Any:
         url = f"{self.base_url}/courses/{course_id}/images"
         data = dict(title=title)
         post_files = [
@@ -494,8 +1361,18 @@ class API(object):
             for (name, fp, content_type) in upload_files
         ]
         post_headers = {"Authorization": self.authorization_header}
+        encoder: MultipartEncoder
+        if progress is not None:
+            encoder = ProgressMultipartEncoder(progress, fields=data, files=post_files)
+        elif stream:
+            encoder = MultipartEncoder(fields=data, files=post_files)
+        else:
+            return self._do_request(
+                method=POST, url=url, headers=post_headers, data=data, files=post_files
+            )
+        post_headers["Content-Type"] = encoder.content_type
         return self._do_request(
-            method=POST, url=url, headers=post_headers, data=data, files=post_files
+            method=POST, url=url, headers=post_headers, data=encoder
         )
 
     def update_image(
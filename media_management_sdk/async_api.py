@@ -0,0 +1,326 @@
+import asyncio
+import logging
+from typing import IO, Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from media_management_sdk.api import API, DEFAULT_STREAM_CHUNK_SIZE
+from media_management_sdk.codec import JSONPageDecoder
+from media_management_sdk.exceptions import ApiError
+from media_management_sdk.multipart import MultipartEncoder
+from media_management_sdk.progress import UploadProgress
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAPI(API):
+    """
+    This class mirrors :class:`~media_management_sdk.api.API`, except that every
+    endpoint method is a coroutine.
+
+    Requests are sent through a pooled ``httpx.AsyncClient``, so a single event
+    loop can issue many requests concurrently. Errors are mapped to the same
+    exceptions as the blocking API.
+
+    Requires the ``httpx`` package (``pip install media-management-sdk[async]``).
+    """
+
+    def _create_session(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: bool,
+    ) -> Any:
+        """Creates an async client with connection limits derived from the pool settings.
+
+        The ``pool_maxsize`` is the number of keep-alive connections retained, and
+        when ``pool_block`` is set, ``pool_connections * pool_maxsize`` caps the total
+        number of open connections (requests wait for a free connection).
+        """
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for AsyncAPI: pip install media-management-sdk[async]"
+            )
+        limits = httpx.Limits(
+            max_connections=pool_connections * pool_maxsize if pool_block else None,
+            max_keepalive_connections=pool_maxsize if keep_alive else 0,
+        )
+        return httpx.AsyncClient(limits=limits)
+
+    async def close(self) -> None:  # type: ignore[override]
+        """Closes the underlying async client and releases pooled connections.
+
+        Clients passed in by the caller are left open.
+        """
+        if self._owns_session:
+            await self.session.aclose()
+
+    def __enter__(self) -> "AsyncAPI":
+        raise TypeError("AsyncAPI must be used with 'async with', not 'with'")
+
+    def __exit__(self, *exc_info: Any) -> None:  # pragma: no cover
+        pass
+
+    async def __aenter__(self) -> "AsyncAPI":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _do_request(self, method: str, url: str, **kwargs: Any) -> Any:  # type: ignore[override]
+        """Performs the HTTP request asynchronously.
+
+        See :meth:`API._do_request <media_management_sdk.api.API._do_request>`
+        for the arguments and exceptions.
+        """
+        endpoint = self._resolve_endpoint(method, url)
+        self._prepare_request(method, url, kwargs, endpoint[0])
+        data = self._lookup_object_cache(endpoint, kwargs)
+        if data is not None:
+            return self._parse_response(endpoint[0], data)
+
+        cache_key, cached = self._lookup_response_cache(method, url, kwargs)
+        kwargs = self._to_httpx_kwargs(kwargs)
+        r = await self._send_request(method, url, kwargs)
+
+        if cached is not None and r.status_code == 304:
+            data = self._decode_response(200, lambda: self.codec.loads(cached.body))
+        else:
+            data = self._decode_response(
+                r.status_code, lambda: self.codec.loads(r.content)
+            )
+            if cache_key is not None:
+                self._store_response_cache(cache_key, r.content, r.headers)
+        self._update_object_cache(endpoint, kwargs, data)
+        self._update_dedup_index(endpoint)
+        return self._parse_response(endpoint[0], data)
+
+    async def _send_request(  # type: ignore[override]
+        self, method: str, url: str, kwargs: Dict[str, Any]
+    ) -> Any:
+        """Sends a prepared request, retrying transient failures.
+
+        See :meth:`API._send_request <media_management_sdk.api.API._send_request>`.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            self._check_circuit_breaker()
+            recorded = False
+            try:
+                try:
+                    if self.throttle is None:
+                        r = await self._send(method, url, kwargs)
+                    else:
+                        async with self.throttle:
+                            r = await self._send(method, url, kwargs)
+                    # unlike requests, httpx also raises for 3xx (e.g. 304 Not Modified)
+                    if r.is_error:
+                        await r.aread()  # the body of a streamed response is read on demand
+                        r.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    status_code = e.response.status_code
+                    self._record_attempt(status_code)
+                    recorded = True
+                    delay = self._get_retry_delay(
+                        method, kwargs, attempt, status_code, e.response.headers
+                    )
+                    if delay is not None:
+                        if kwargs.get("stream"):
+                            await e.response.aclose()
+                        await asyncio.sleep(delay)
+                        continue
+                    logger.exception("HTTP error")
+                    self._raise_for_status(status_code, e.response.text)
+                except httpx.HTTPError as e:
+                    retryable = isinstance(
+                        e, (httpx.NetworkError, httpx.TimeoutException)
+                    )
+                    if retryable:
+                        self._record_attempt(None)
+                        recorded = True
+                        delay = self._get_retry_delay(method, kwargs, attempt)
+                        if delay is not None:
+                            await asyncio.sleep(delay)
+                            continue
+                    logger.exception("Request error")
+                    raise ApiError("Request exception: " + str(e))
+                self._record_attempt(r.status_code)
+                recorded = True
+                return r
+            finally:
+                # e.g. cancelled, or a request error that says nothing about the API's health
+                if not recorded:
+                    self._release_circuit_breaker()
+
+    async def _send(self, method: str, url: str, kwargs: Dict[str, Any]) -> Any:
+        """Sends a single attempt, without reading the body if ``stream`` is set.
+
+        The timeout is reduced to the time remaining until the current deadline,
+        so this must be called after any throttle wait.
+        """
+        kwargs = dict(
+            kwargs,
+            timeout=self._to_httpx_timeout(
+                self._get_attempt_timeout(kwargs["timeout"])
+            ),
+        )
+        stream = kwargs.pop("stream", False)
+        if not stream:
+            return await self.session.request(method.upper(), url, **kwargs)
+        request = self.session.build_request(method.upper(), url, **kwargs)
+        return await self.session.send(request, stream=True)
+
+    async def _iter_request(  # type: ignore[override]
+        self, method: str, url: str, prefetch: bool = False, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        """Performs a request for a list and yields its items as they are decoded.
+
+        With ``prefetch``, the next page is fetched in a separate task. See
+        :meth:`API._iter_request <media_management_sdk.api.API._iter_request>`.
+        """
+        endpoint_name, _ = self._resolve_endpoint(method, url)
+        self._prepare_request(method, url, kwargs, endpoint_name)
+        kwargs = self._to_httpx_kwargs(kwargs)
+        if prefetch:
+            async for item in self._iter_prefetched_pages(
+                method, url, kwargs, endpoint_name
+            ):
+                yield item
+            return
+
+        page_url: Optional[str] = url
+        while page_url is not None:
+            r = await self._send_request(method, page_url, dict(kwargs, stream=True))
+            decoder = JSONPageDecoder(self.codec.loads)
+            try:
+                if r.status_code != 204:
+                    async for chunk in r.aiter_bytes(DEFAULT_STREAM_CHUNK_SIZE):
+                        for item in self._parse_response(
+                            endpoint_name, decoder.feed(chunk)
+                        ):
+                            yield item
+                    for item in self._parse_response(endpoint_name, decoder.close()):
+                        yield item
+            except ValueError:
+                error_msg = "No JSON list could be decoded"
+                logger.exception(error_msg)
+                raise ApiError(error_msg)
+            except httpx.HTTPError as e:
+                logger.exception("Request error")
+                raise ApiError("Request exception: " + str(e))
+            finally:
+                await r.aclose()
+            page_url = self._next_page_url(page_url, decoder.next_url, r.links)
+            kwargs = self._next_page_kwargs(kwargs)
+
+    async def _iter_prefetched_pages(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+        endpoint_name: Optional[str] = None,
+    ) -> AsyncIterator[Any]:
+        """Yields the items of each page while the next page is fetched in a task."""
+        task: Optional[asyncio.Task] = asyncio.ensure_future(
+            self._fetch_page(method, url, kwargs)
+        )
+        try:
+            while task is not None:
+                items, next_url = await task
+                task = None
+                if next_url is not None:
+                    kwargs = self._next_page_kwargs(kwargs)
+                    task = asyncio.ensure_future(
+                        self._fetch_page(method, next_url, kwargs)
+                    )
+                for item in self._parse_response(endpoint_name, items):
+                    yield item
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def _fetch_page(  # type: ignore[override]
+        self, method: str, url: str, kwargs: Dict[str, Any]
+    ) -> Tuple[List[Any], Optional[str]]:
+        """Fetches one page of a list in full.
+
+        Returns:
+            The items on the page and the URL of the next page, if any.
+        """
+        return self._read_page(url, await self._send_request(method, url, kwargs))
+
+    async def upload_images(  # type: ignore[override]
+        self,
+        course_id: int,
+        upload_files: List[Tuple[str, IO, str]],
+        title: Optional[str] = None,
+        stream: bool = False,
+        progress: Optional[Callable[[UploadProgress], Any]] = None,
+    ) -> List[dict]:
+        """Upload images to the course.
+
+        See :meth:`API.upload_images <media_management_sdk.api.API.upload_images>`
+        for the arguments.
+        """
+        plan = self._plan_upload(course_id, upload_files)
+        if plan is None:
+            upload_files = await self._transform_files(upload_files)
+            return await self._upload_images(
+                course_id, upload_files, title, stream, progress
+            )
+        uploaded = []
+        if plan.pending_files:
+            upload_files = await self._transform_files(plan.pending_files)
+            uploaded = await self._upload_images(
+                course_id, upload_files, title, stream, progress
+            )
+        return self._complete_upload(plan, uploaded)
+
+    async def _transform_files(  # type: ignore[override]
+        self, upload_files: List[Tuple[str, IO, str]]
+    ) -> List[Tuple[str, IO, str]]:
+        """Transforms the files to upload without blocking the event loop."""
+        if self.transformer is None:
+            return upload_files
+        results = await asyncio.gather(
+            *(
+                asyncio.wrap_future(self.transformer.submit(upload_file))
+                for upload_file in upload_files
+            )
+        )
+        return [self.transformer.record(result) for result in results]
+
+    @staticmethod
+    def _to_httpx_timeout(timeout: Any) -> Any:
+        """Converts a requests-style (connect, read) timeout tuple to httpx."""
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return timeout
+
+    @staticmethod
+    def _to_httpx_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Adapts requests-style keyword arguments to httpx.
+
+        The requests library silently drops ``None`` values from query params
+        and form data, whereas httpx would encode them, so they are removed here.
+        Encoded JSON bodies and streaming multipart bodies are passed to httpx
+        as raw content.
+        """
+        for key in ("params", "data"):
+            if isinstance(kwargs.get(key), dict):
+                kwargs[key] = {k: v for k, v in kwargs[key].items() if v is not None}
+        if isinstance(kwargs.get("data"), bytes):
+            kwargs["content"] = kwargs.pop("data")
+        if isinstance(kwargs.get("data"), MultipartEncoder):
+            encoder = kwargs.pop("data")
+            kwargs["content"] = encoder.aiter_chunks()
+            if encoder.len is not None:
+                kwargs["headers"] = dict(kwargs.get("headers") or {})
+                kwargs["headers"]["Content-Length"] = str(encoder.len)
+        return kwargs
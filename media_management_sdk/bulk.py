@@ -0,0 +1,548 @@
+import concurrent.futures
+import contextvars
+import functools
+import logging
+import time
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from media_management_sdk.api import API
+from media_management_sdk.exceptions import (
+    ApiBadRequest,
+    ApiCircuitOpenError,
+    ApiDeadlineExceededError,
+    ApiError,
+    ApiForbiddenError,
+    ApiNotFoundError,
+)
+from media_management_sdk.progress import UploadProgress
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_RETRIES = 2
+
+# Errors that will fail the same way no matter how many times the batch is sent,
+# or that mean the request should not be sent again yet.
+NON_RETRYABLE_ERRORS = (
+    ApiBadRequest,
+    ApiForbiddenError,
+    ApiNotFoundError,
+    ApiCircuitOpenError,
+    ApiDeadlineExceededError,
+)
+
+UploadFile = Tuple[str, IO, str]
+
+# The fields of an image that can be changed with a bulk update.
+UPDATABLE_IMAGE_FIELDS = ("title", "description", "sort_order", "metadata")
+
+
+def _retry_delay(api: API, attempt: int) -> float:
+    """Returns the number of seconds to wait before resending a failed request."""
+    if api.retry_policy is None:
+        return 0.0
+    return api.retry_policy.get_delay(attempt)
+
+
+def _call_after(delay: float, func: Callable, *args: Any) -> Any:
+    """Waits for the delay in the worker thread, then calls the function."""
+    if delay > 0:
+        time.sleep(delay)
+    return func(*args)
+
+
+class UploadResult(object):
+    """
+    The outcome of uploading a single file.
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        image: Optional[dict] = None,
+        error: Optional[Exception] = None,
+        attempts: int = 0,
+    ) -> None:
+        self.file_name = file_name
+        self.image = image
+        self.error = error
+        self.attempts = attempts
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.image is not None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"<UploadResult {self.file_name} {status}>"
+
+
+class BulkUploadReport(object):
+    """
+    Per-file results of a bulk upload, in the same order as the input files.
+    """
+
+    def __init__(self, results: List[UploadResult]) -> None:
+        self.results = results
+
+    @property
+    def succeeded(self) -> List[UploadResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[UploadResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def images(self) -> List[dict]:
+        """The uploaded image records, in input order."""
+        return [result.image for result in self.results if result.ok]  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"<BulkUploadReport succeeded={len(self.succeeded)} failed={len(self.failed)}>"
+
+
+class BulkUploader(object):
+    """
+    Uploads a large number of files by splitting them into batches that are
+    sent concurrently with :meth:`API.upload_images <media_management_sdk.api.API.upload_images>`.
+
+    A batch that fails with a transient error is retried on its own, after the
+    delay given by the API's retry policy, so one failure does not require
+    re-uploading every other file.
+    """
+
+    def __init__(
+        self,
+        api: API,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        stream: bool = False,
+        progress: Optional[Callable[[UploadProgress], Any]] = None,
+    ) -> None:
+        """BulkUploader constructor.
+
+        Args:
+            api: The API instance used to upload each batch.
+            batch_size: Maximum number of files sent in one request. Defaults to 10.
+            max_workers: Maximum number of batches uploaded concurrently. Defaults to 4.
+            max_retries: Number of times a failed batch is retried. Defaults to 2.
+            stream: Stream each batch request body instead of building it in memory.
+                Defaults to False.
+            progress: Called with the progress of each batch request, from the
+                worker threads. Defaults to None.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        if max_workers < 1:
+            raise ValueError("Max workers must be at least 1")
+
+        self.api = api
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.stream = stream
+        self.progress = progress
+
+    def upload(
+        self,
+        course_id: int,
+        upload_files: Sequence[UploadFile],
+        title: Optional[str] = None,
+        on_batch: Optional[Callable[[List[int], List[UploadResult]], None]] = None,
+    ) -> BulkUploadReport:
+        """Upload images to the course in concurrent batches.
+
+        Args:
+            course_id: Course ID.
+            upload_files: List of file tuples: (filename, file, content_type).
+            title: Title to use for every file. Note that if
+                not specified, the original file name will be used. Defaults to None.
+            on_batch: Called in the calling thread as each batch finishes, with
+                the indexes of its files and their results. Defaults to None.
+
+        Returns:
+            A report with the result of each file.
+        """
+        results = [
+            UploadResult(file_name=name) for (name, fp, content_type) in upload_files
+        ]
+        batches = [
+            list(range(start, min(start + self.batch_size, len(upload_files))))
+            for start in range(0, len(upload_files), self.batch_size)
+        ]
+        positions = {
+            i: self._tell(fp) for i, (name, fp, content_type) in enumerate(upload_files)
+        }
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            pending: Dict[concurrent.futures.Future, List[int]] = {}
+            for batch in batches:
+                future = self._submit(executor, course_id, upload_files, batch, title)
+                pending[future] = batch
+
+            while pending:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    batch = pending.pop(future)
+                    for i in batch:
+                        results[i].attempts += 1
+                    try:
+                        images = future.result()
+                    except Exception as e:
+                        # e.g. a file that was closed or cannot be read fails
+                        # this batch only, and is not retried
+                        attempts = results[batch[0]].attempts
+                        if (
+                            attempts <= self.max_retries
+                            and isinstance(e, ApiError)
+                            and not isinstance(e, NON_RETRYABLE_ERRORS)
+                        ):
+                            logger.warning(
+                                "Retrying batch of %s files after error: %s",
+                                len(batch),
+                                e,
+                            )
+                            for i in batch:
+                                self._seek(upload_files[i][1], positions[i])
+                            retry = self._submit(
+                                executor,
+                                course_id,
+                                upload_files,
+                                batch,
+                                title,
+                                delay=_retry_delay(self.api, attempts),
+                            )
+                            pending[retry] = batch
+                        else:
+                            for i in batch:
+                                results[i].error = e
+                            if on_batch is not None:
+                                on_batch(batch, [results[i] for i in batch])
+                        continue
+                    self._assign_images(results, batch, images)
+                    if on_batch is not None:
+                        on_batch(batch, [results[i] for i in batch])
+
+        return BulkUploadReport(results)
+
+    def _submit(
+        self,
+        executor: concurrent.futures.Executor,
+        course_id: int,
+        upload_files: Sequence[UploadFile],
+        batch: List[int],
+        title: Optional[str],
+        delay: float = 0.0,
+    ) -> concurrent.futures.Future:
+        kwargs: Dict[str, Any] = {}
+        if self.progress is not None:
+            kwargs["progress"] = self.progress
+        upload_images = functools.partial(
+            self.api.upload_images, title=title, stream=self.stream, **kwargs
+        )
+        # run in a copy of the caller's context so that deadlines apply
+        return executor.submit(
+            contextvars.copy_context().run,
+            _call_after,
+            delay,
+            upload_images,
+            course_id,
+            [upload_files[i] for i in batch],
+        )
+
+    @staticmethod
+    def _assign_images(
+        results: List[UploadResult], batch: List[int], images: List[dict]
+    ) -> None:
+        """Matches the returned images to the files in the batch, which the API returns in upload order."""
+        for n, i in enumerate(batch):
+            if n < len(images) and images[n] is not None:
+                results[i].image = images[n]
+                results[i].error = None
+            else:
+                results[i].error = ApiError("Uploaded image missing from response")
+
+    @staticmethod
+    def _tell(fp: IO) -> Optional[int]:
+        try:
+            return fp.tell()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _seek(fp: IO, position: Optional[int]) -> None:
+        if position is not None:
+            fp.seek(position)
+
+
+class UpdateResult(object):
+    """
+    The outcome of updating a single image.
+    """
+
+    def __init__(
+        self,
+        image_id: int,
+        changes: Dict[str, Any],
+        image: Optional[dict] = None,
+        error: Optional[Exception] = None,
+        attempts: int = 0,
+        skipped: bool = False,
+    ) -> None:
+        self.image_id = image_id
+        self.changes = changes
+        self.image = image
+        self.error = error
+        self.attempts = attempts
+        self.skipped = skipped
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.skipped:
+            status = "skipped"
+        else:
+            status = "ok" if self.ok else f"error={self.error!r}"
+        return f"<UpdateResult {self.image_id} {status}>"
+
+
+class BulkUpdateReport(object):
+    """
+    Per-image results of a bulk update, in the same order as the input updates.
+    """
+
+    def __init__(self, results: List[UpdateResult]) -> None:
+        self.results = results
+
+    @property
+    def updated(self) -> List[UpdateResult]:
+        return [result for result in self.results if result.ok and not result.skipped]
+
+    @property
+    def skipped(self) -> List[UpdateResult]:
+        """Updates that were not sent, because they would not change the image."""
+        return [result for result in self.results if result.skipped]
+
+    @property
+    def failed(self) -> List[UpdateResult]:
+        return [result for result in self.results if not result.ok]
+
+    def __repr__(self) -> str:
+        return (
+            f"<BulkUpdateReport updated={len(self.updated)} "
+            f"skipped={len(self.skipped)} failed={len(self.failed)}>"
+        )
+
+
+class BulkImageUpdater(object):
+    """
+    Updates the title, description, sort order or metadata of many images,
+    sending the :meth:`API.update_image <media_management_sdk.api.API.update_image>`
+    requests concurrently from a bounded pool of worker threads.
+
+    Updates that would not change the image are skipped, and updates that fail
+    with a transient error are retried after the delay given by the API's
+    retry policy. The updates are read from the input
+    as workers become free, so it may be a generator over a large import.
+    """
+
+    def __init__(
+        self,
+        api: API,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
+        """BulkImageUpdater constructor.
+
+        Args:
+            api: The API instance used to update each image.
+            max_workers: Maximum number of concurrent requests. Defaults to 4.
+            max_retries: Number of times a failed update is retried. Defaults to 2.
+        """
+        if max_workers < 1:
+            raise ValueError("Max workers must be at least 1")
+
+        self.api = api
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+
+    def update(
+        self,
+        course_id: int,
+        updates: Iterable[Tuple[int, Dict[str, Any]]],
+        current_images: Optional[Mapping[int, Any]] = None,
+        fetch_current: bool = False,
+    ) -> BulkUpdateReport:
+        """Update images in the course concurrently.
+
+        Args:
+            course_id: Course ID.
+            updates: Pairs of (image_id, changes), where changes maps any of
+                "title", "description", "sort_order" and "metadata" (a dict of
+                labels to values) to the new value. None values are ignored.
+            current_images: The current image data keyed by image ID, used to
+                skip unchanged fields and no-op updates without a request. It is
+                read as each update is, so it may be filled in as the input is
+                generated. Defaults to None.
+            fetch_current: Read images missing from ``current_images`` with
+                get_image before updating them, to skip no-op updates. This is
+                worthwhile when the API's object cache holds the images. Defaults to False.
+
+        Returns:
+            A report with the result of each update. Changes that include a
+            field that cannot be updated fail with a ValueError, without a
+            request being sent.
+        """
+        results: List[UpdateResult] = []
+        updates = iter(updates)
+        current_images = current_images if current_images is not None else {}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            pending: Dict[concurrent.futures.Future, UpdateResult] = {}
+
+            def fill() -> None:
+                # keep the workers busy without reading the whole input
+                while len(pending) < self.max_workers * 2:
+                    update = next(updates, None)
+                    if update is None:
+                        return
+                    image_id, changes = update
+                    result = UpdateResult(
+                        image_id, {k: v for (k, v) in changes.items() if v is not None}
+                    )
+                    results.append(result)
+                    try:
+                        self.check_changes(changes)
+                    except ValueError as e:
+                        result.error = e
+                        continue
+                    current = current_images.get(image_id)  # type: ignore
+                    if current is not None:
+                        result.changes = self.get_changes(result.changes, current)
+                    if not result.changes:
+                        result.skipped = True
+                        result.image = current
+                        continue
+                    future = self._submit(executor, course_id, result, fetch_current)
+                    pending[future] = result
+
+            fill()
+            while pending:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    result = pending.pop(future)
+                    result.attempts += 1
+                    try:
+                        result.image, result.skipped = future.result()
+                    except Exception as e:
+                        # e.g. a TypeError from invalid metadata fails this
+                        # update only, and is not retried
+                        if (
+                            result.attempts <= self.max_retries
+                            and isinstance(e, ApiError)
+                            and not isinstance(e, NON_RETRYABLE_ERRORS)
+                        ):
+                            logger.warning(
+                                "Retrying update of image %s after error: %s",
+                                result.image_id,
+                                e,
+                            )
+                            retry = self._submit(
+                                executor,
+                                course_id,
+                                result,
+                                fetch_current,
+                                delay=_retry_delay(self.api, result.attempts),
+                            )
+                            pending[retry] = result
+                        else:
+                            result.error = e
+                fill()
+
+        return BulkUpdateReport(results)
+
+    def _submit(
+        self,
+        executor: concurrent.futures.Executor,
+        course_id: int,
+        result: UpdateResult,
+        fetch_current: bool,
+        delay: float = 0.0,
+    ) -> concurrent.futures.Future:
+        # run in a copy of the caller's context so that deadlines apply
+        return executor.submit(
+            contextvars.copy_context().run,
+            _call_after,
+            delay,
+            self._update_image,
+            course_id,
+            result.image_id,
+            result.changes,
+            fetch_current,
+        )
+
+    def _update_image(
+        self,
+        course_id: int,
+        image_id: int,
+        changes: Dict[str, Any],
+        fetch_current: bool,
+    ) -> Tuple[Any, bool]:
+        """Updates one image.
+
+        Returns:
+            The image data, and whether the update was skipped as a no-op.
+        """
+        if fetch_current:
+            current = self.api.get_image(image_id)
+            changes = self.get_changes(changes, current)
+            if not changes:
+                return current, True
+        return self.api.update_image(image_id, course_id, **changes), False
+
+    @staticmethod
+    def check_changes(changes: Dict[str, Any]) -> None:
+        """Checks that the changes only include fields that can be updated.
+
+        Raises:
+            ValueError: If the changes include a field that cannot be updated.
+        """
+        invalid = set(changes) - set(UPDATABLE_IMAGE_FIELDS)
+        if invalid:
+            raise ValueError(f"Cannot update image fields: {sorted(invalid)}")
+
+    @staticmethod
+    def get_changes(changes: Dict[str, Any], current: Any) -> Dict[str, Any]:
+        """Returns the changes that differ from the current image data."""
+        effective = {}
+        for field, value in changes.items():
+            existing = current.get(field)
+            if field == "metadata":
+                existing = {item["label"]: item["value"] for item in existing or ()}
+            if value != existing:
+                effective[field] = value
+        return effective
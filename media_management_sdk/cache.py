@@ -0,0 +1,186 @@
+import collections
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAXSIZE = 128
+
+_MISSING = object()
+
+
+class TTLCache(object):
+    """
+    A thread-safe, size-bounded cache with least-recently-used eviction and
+    optional per-entry expiration.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """TTLCache constructor.
+
+        Args:
+            maxsize: Maximum number of entries. When full, the least recently
+                used entry is evicted. A size of 0 disables caching. Defaults to 128.
+            ttl: Default number of seconds an entry remains valid, or None for
+                no expiration. Defaults to None.
+            timer: Function returning the current time in seconds. Defaults to time.monotonic.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._data: "collections.OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value, or the default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= self.timer():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Caches a value, expiring after ``ttl`` seconds (or the cache default)."""
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self.timer() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_matching(self, predicate: Callable[[Any], bool]) -> int:
+        """Deletes every entry whose key satisfies the predicate.
+
+        Returns:
+            The number of entries deleted.
+        """
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+DEFAULT_OBJECT_CACHE_SIZE = 1024
+
+# Number of seconds that the data returned by each read endpoint is cached.
+DEFAULT_OBJECT_CACHE_TTLS = {
+    "get_course": 300,
+    "list_collections": 60,
+    "get_collection": 60,
+    "get_image": 300,
+}
+
+# Cached reads made stale by a successful write, keyed by the write endpoint.
+# Each entry names the read endpoint and the path parameter of the write that
+# identifies the stale resource, or None when every cached result is stale.
+# get_collection_images is not cached by default, but may be enabled with a TTL.
+INVALIDATIONS = {
+    "update_course": (("get_course", "course_id"), ("list_collections", "course_id")),
+    "delete_course": (("get_course", "course_id"), ("list_collections", "course_id")),
+    "copy_course": (("get_course", "course_id"), ("list_collections", "course_id")),
+    "create_collection": (("list_collections", "course_id"),),
+    "update_collection": (
+        ("get_collection", "collection_id"),
+        ("get_collection_images", "collection_id"),
+        ("list_collections", None),
+    ),
+    "delete_collection": (
+        ("get_collection", "collection_id"),
+        ("get_collection_images", "collection_id"),
+        ("list_collections", None),
+    ),
+    "update_image": (("get_image", "image_id"), ("get_collection_images", None)),
+    "delete_image": (("get_image", "image_id"), ("get_collection_images", None)),
+}
+
+
+class ObjectCache(object):
+    """
+    A read-through cache of API response data for read endpoints, with a TTL
+    per endpoint.
+
+    Entries are keyed by endpoint, resource ID and authorization, since the API
+    returns different data to different users. A successful write through the
+    same API instance invalidates the cached reads it affects, for all users.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        maxsize: int = DEFAULT_OBJECT_CACHE_SIZE,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """ObjectCache constructor.
+
+        Args:
+            ttls: Number of seconds to cache each endpoint, overriding
+                DEFAULT_OBJECT_CACHE_TTLS. A TTL of 0 disables caching for
+                that endpoint. Defaults to None.
+            maxsize: Maximum number of cached responses. Defaults to 1024.
+            timer: Function returning the current time in seconds. Defaults to time.monotonic.
+        """
+        self.ttls = dict(DEFAULT_OBJECT_CACHE_TTLS, **(ttls or {}))
+        self._cache = TTLCache(maxsize=maxsize, timer=timer)
+
+    def is_cacheable(self, endpoint: Optional[str]) -> bool:
+        return self.ttls.get(endpoint or "", 0) > 0
+
+    def get(self, endpoint: str, resource_id: str, authorization: str) -> Any:
+        """Returns a copy of the cached data, or None if missing or expired."""
+        data = self._cache.get((endpoint, resource_id, authorization))
+        return copy.deepcopy(data) if data is not None else None
+
+    def set(
+        self, endpoint: str, resource_id: str, authorization: str, data: Any
+    ) -> None:
+        if self.is_cacheable(endpoint):
+            self._cache.set(
+                (endpoint, resource_id, authorization),
+                copy.deepcopy(data),
+                ttl=self.ttls[endpoint],
+            )
+
+    def invalidate(self, endpoint: str, resource_id: Optional[str] = None) -> None:
+        """Removes cached data for an endpoint, optionally limited to one resource."""
+        self._cache.delete_matching(
+            lambda key: key[0] == endpoint
+            and (resource_id is None or key[1] == resource_id)
+        )
+
+    def invalidate_for_write(self, endpoint: str, path_params: Dict[str, str]) -> None:
+        """Removes the cached data made stale by a successful write to an endpoint."""
+        for read_endpoint, param in INVALIDATIONS.get(endpoint, ()):
+            self.invalidate(read_endpoint, path_params[param] if param else None)
+
+    def clear(self) -> None:
+        self._cache.clear()
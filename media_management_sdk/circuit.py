@@ -0,0 +1,174 @@
+import collections
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Optional
+
+from media_management_sdk.exceptions import ApiCircuitOpenError
+
+CLOSED, OPEN, HALF_OPEN = ("closed", "open", "half_open")
+
+DEFAULT_FAILURE_THRESHOLD = 0.5
+DEFAULT_WINDOW_SIZE = 20
+DEFAULT_MIN_CALLS = 10
+DEFAULT_RECOVERY_TIMEOUT = 30
+DEFAULT_HALF_OPEN_MAX_CALLS = 1
+
+
+class CircuitBreaker(object):
+    """
+    Stops sending requests to the API while it is failing.
+
+    The breaker tracks the outcome of the most recent requests. When the failure
+    rate reaches ``failure_threshold`` it opens, and requests fail immediately
+    with :class:`~media_management_sdk.exceptions.ApiCircuitOpenError` instead
+    of waiting for a timeout. After ``recovery_timeout`` seconds it half-opens
+    and lets up to ``half_open_max_calls`` probe requests through: if they all
+    succeed it closes again, and if any fails it re-opens.
+
+    Connection errors, timeouts and 5xx responses count as failures; other
+    responses count as successes since the API is answering.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = DEFAULT_FAILURE_THRESHOLD,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        min_calls: int = DEFAULT_MIN_CALLS,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+        half_open_max_calls: int = DEFAULT_HALF_OPEN_MAX_CALLS,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """CircuitBreaker constructor.
+
+        Args:
+            failure_threshold: Failure rate, between 0 and 1, at which the breaker
+                opens. Defaults to 0.5.
+            window_size: Number of recent requests used to compute the failure
+                rate. Defaults to 20.
+            min_calls: Minimum number of requests in the window before the breaker
+                can open. Defaults to 10.
+            recovery_timeout: Number of seconds the breaker stays open before
+                half-opening. Defaults to 30.
+            half_open_max_calls: Number of probe requests allowed while half-open.
+                Defaults to 1.
+            timer: Function returning the current time in seconds. Defaults to time.monotonic.
+        """
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("Failure threshold must be between 0 and 1")
+        if min_calls > window_size:
+            raise ValueError("Min calls must not exceed the window size")
+
+        self.failure_threshold = failure_threshold
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.timer = timer
+        self._state = CLOSED
+        self._opened_at: Optional[float] = None
+        self._outcomes: Deque[bool] = collections.deque(maxlen=window_size)
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if (
+            self._state == OPEN
+            and self.timer() - self._opened_at >= self.recovery_timeout  # type: ignore
+        ):
+            self._state = HALF_OPEN
+            self._probes = 0
+            self._probe_successes = 0
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        with self._lock:
+            return self._failure_rate()
+
+    def _failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def before_request(self) -> None:
+        """Checks that a request may be sent.
+
+        Raises:
+            ApiCircuitOpenError: If the breaker is open, or half-open with all
+                probe requests already in progress.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return
+        raise ApiCircuitOpenError("Circuit breaker is open, request not sent")
+
+    def release_probe(self) -> None:
+        """Hands back a probe slot taken by :meth:`before_request` for a request
+        that ended without an outcome being recorded (e.g. it was cancelled).
+        """
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    self._close()
+                return
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._open()
+                return
+            self._outcomes.append(False)
+            if (
+                self._state == CLOSED
+                and len(self._outcomes) >= self.min_calls
+                and self._failure_rate() >= self.failure_threshold
+            ):
+                self._open()
+
+    def reset(self) -> None:
+        """Closes the breaker and forgets recorded outcomes."""
+        with self._lock:
+            self._close()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self.timer()
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._opened_at = None
+        self._outcomes.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the breaker state for health checks."""
+        with self._lock:
+            state = self._current_state()
+            retry_in = None
+            if state == OPEN:
+                retry_in = max(
+                    0.0,
+                    self.recovery_timeout - (self.timer() - self._opened_at),  # type: ignore
+                )
+            return dict(
+                state=state,
+                failure_rate=self._failure_rate(),
+                calls=len(self._outcomes),
+                retry_in=retry_in,
+            )
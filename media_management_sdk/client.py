@@ -1,16 +1,64 @@
-from typing import Optional
+import functools
+from typing import Any, IO, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from media_management_sdk.api import API
+from media_management_sdk.async_api import AsyncAPI
+from media_management_sdk.bulk import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_WORKERS,
+    BulkImageUpdater,
+    BulkUpdateReport,
+    BulkUploader,
+    BulkUploadReport,
+)
+from media_management_sdk.cache import TTLCache
+from media_management_sdk.editor import CollectionEditor
 from media_management_sdk.exceptions import ApiError
-from media_management_sdk.jwt import create_jwt
+from media_management_sdk.journal import ImportJournal, ImportReport, JournaledImporter
+from media_management_sdk.jwt import TokenCache
+from media_management_sdk.pipeline import PipelineReport, UploadPipeline
+from media_management_sdk.progress import UploadProgress
+from media_management_sdk.snapshot import (
+    DEFAULT_MAX_WORKERS as DEFAULT_SNAPSHOT_WORKERS,
+    CourseSnapshot,
+    fetch_course_snapshot,
+)
 
+DEFAULT_AUTHORIZATION_TTL = 300
+DEFAULT_AUTHORIZATION_CACHE_SIZE = 1024
 
-class Client(object):
+
+class BaseClient(object):
     """
-    Client is a wrapper for interacting with the API.
+    Holds the client credentials and API instance shared by the client classes.
     """
 
-    def __init__(self, client_id: str, client_secret: str, base_url: str):
+    api_class: Any = API
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        base_url: str,
+        token_cache: Optional[TokenCache] = None,
+        authorization_ttl: float = DEFAULT_AUTHORIZATION_TTL,
+        **api_kwargs: Any,
+    ):
+        """Client constructor.
+
+        Args:
+            client_id: The client ID obtained from the API.
+            client_secret: The client secret obtained from the API.
+            base_url: The base URL of the API.
+            token_cache: Cache of access tokens. Defaults to a new TokenCache.
+            authorization_ttl: Number of seconds that a successful course
+                authorization is remembered, during which authenticating the same
+                user for the same course skips the authorization request.
+                A value of 0 disables this. Defaults to 300 seconds (5 minutes).
+            **api_kwargs: Additional keyword arguments for the API constructor
+                (e.g. object_cache, response_cache).
+        """
         if client_id is None or client_secret is None:
             raise ValueError("Missing client credentials")
         if base_url is None:
@@ -19,21 +67,66 @@ class Client(object):
         self.client_id = client_id
         self.client_secret = client_secret
         self.base_url = base_url
-        self.api = API(base_url=base_url)
+        self.token_cache = token_cache if token_cache is not None else TokenCache()
+        self.authorizations = TTLCache(
+            maxsize=DEFAULT_AUTHORIZATION_CACHE_SIZE if authorization_ttl > 0 else 0,
+            ttl=authorization_ttl,
+        )
+        self._authenticated: Optional[Tuple[str, Optional[int]]] = None
+        self.api = self.api_class(
+            base_url=base_url, on_forbidden=self._on_forbidden, **api_kwargs
+        )
 
-    def authenticate(
+    def invalidate_authorization(
+        self, user_id: Optional[str] = None, course_id: Optional[int] = None
+    ) -> None:
+        """
+        Forgets remembered course authorizations so that the next call to
+        authenticate sends the authorization request again.
+
+        This is done automatically for the authenticated user and course when
+        any request raises ApiForbiddenError. Omitting the user or course
+        matches all users or courses.
+        """
+        self.authorizations.delete_matching(
+            lambda key: (user_id is None or key[0] == user_id)
+            and (course_id is None or key[1] == course_id)
+        )
+
+    def _authenticate_api(
+        self, user_id: str, course_id: Optional[int], access_token: str
+    ) -> Any:
+        """Sets the access token of the shared API instance and returns a view
+        of the API bound to the token, whose forbidden requests invalidate the
+        authorization of this user only."""
+        self.api.access_token = access_token
+        self._authenticated = (user_id, course_id)
+        return self.api.with_access_token(
+            access_token,
+            on_forbidden=functools.partial(
+                self.invalidate_authorization, user_id, course_id
+            ),
+        )
+
+    def _on_forbidden(self) -> None:
+        """Forgets the authorization of the authenticated user when a request is forbidden."""
+        if self._authenticated is not None:
+            self.invalidate_authorization(*self._authenticated)
+
+    def _get_access_token(
         self,
         user_id: str,
         course_id: Optional[int] = None,
         course_permission: Optional[str] = None,
-    ) -> None:
+    ) -> str:
         """
-        Authenticates with the API and authorizes the user for the course.
+        Gets the access token used to authenticate the user, reusing a cached
+        token while it remains valid.
         """
         if not user_id:
             raise ValueError("User ID is required to authenticate")
 
-        self.api.access_token = create_jwt(
+        return self.token_cache.get_token(
             client_id=self.client_id,
             client_secret=self.client_secret,
             user_id=user_id,
@@ -41,8 +134,44 @@ class Client(object):
             course_permission=course_permission,
         )
 
+
+class Client(BaseClient):
+    """
+    Client is a wrapper for interacting with the API.
+    """
+
+    def authenticate(
+        self,
+        user_id: str,
+        course_id: Optional[int] = None,
+        course_permission: Optional[str] = None,
+    ) -> API:
+        """
+        Authenticates with the API and authorizes the user for the course.
+
+        Successful authorizations are remembered for ``authorization_ttl`` seconds.
+
+        The token is set on the shared ``api`` instance, which is only safe while
+        a single user is authenticated at a time. Threads that act for different
+        users should each use the returned API instead.
+
+        Returns:
+            A view of ``api`` bound to the user's access token (see
+            :meth:`API.with_access_token <media_management_sdk.api.API.with_access_token>`).
+        """
+        api = self._authenticate_api(
+            user_id,
+            course_id,
+            self._get_access_token(user_id, course_id, course_permission),
+        )
+
         if course_id is not None:
-            self.api.authorize_user()
+            key = (user_id, course_id, course_permission)
+            if key not in self.authorizations:
+                # a forbidden authorization is forgotten by the view's on_forbidden
+                api.authorize_user()
+                self.authorizations.set(key, True)
+        return api
 
     def find_or_create_course(
         self,
@@ -75,3 +204,218 @@ class Client(object):
             sis_course_id=sis_course_id,
             canvas_course_id=canvas_course_id,
         )
+
+    def bulk_upload_images(
+        self,
+        course_id: int,
+        upload_files: List[Tuple[str, IO, str]],
+        title: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        stream: bool = False,
+        progress: Optional[Callable[[UploadProgress], Any]] = None,
+    ) -> BulkUploadReport:
+        """
+        Helper method to upload many images in concurrent batches.
+
+        See :class:`~media_management_sdk.bulk.BulkUploader` for details.
+        """
+        uploader = BulkUploader(
+            self.api,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            max_retries=max_retries,
+            stream=stream,
+            progress=progress,
+        )
+        return uploader.upload(course_id, upload_files, title=title)
+
+    def import_images(
+        self,
+        course_id: int,
+        paths: Iterable[str],
+        journal_path: str,
+        title: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        stream: bool = False,
+    ) -> ImportReport:
+        """
+        Helper method to upload image files from disk, recording each upload in
+        a journal so that running the import again resumes where it stopped.
+
+        See :class:`~media_management_sdk.journal.JournaledImporter` for details.
+        """
+        with ImportJournal(journal_path) as journal:
+            importer = JournaledImporter(
+                self.api,
+                journal,
+                batch_size=batch_size,
+                max_workers=max_workers,
+                max_retries=max_retries,
+                stream=stream,
+            )
+            return importer.run(course_id, paths, title=title)
+
+    def upload_and_annotate(
+        self,
+        course_id: int,
+        items: List[Tuple[Tuple[str, IO, str], Dict[str, Any]]],
+        collection_id: Optional[int] = None,
+        title: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        stream: bool = False,
+    ) -> PipelineReport:
+        """
+        Helper method to upload images, update their descriptions and metadata
+        as each batch is uploaded, and add them all to a collection at the end.
+
+        See :class:`~media_management_sdk.pipeline.UploadPipeline` for details.
+        """
+        pipeline = UploadPipeline(
+            self.api,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            max_update_workers=max_workers,
+            max_retries=max_retries,
+            stream=stream,
+        )
+        return pipeline.run(course_id, items, collection_id=collection_id, title=title)
+
+    def bulk_update_images(
+        self,
+        course_id: int,
+        updates: Iterable[Tuple[int, Dict[str, Any]]],
+        current_images: Optional[Mapping[int, Any]] = None,
+        fetch_current: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> BulkUpdateReport:
+        """
+        Helper method to update the title, description, sort order or metadata
+        of many images concurrently, skipping updates that change nothing.
+
+        See :class:`~media_management_sdk.bulk.BulkImageUpdater` for details.
+        """
+        updater = BulkImageUpdater(
+            self.api, max_workers=max_workers, max_retries=max_retries
+        )
+        return updater.update(
+            course_id,
+            updates,
+            current_images=current_images,
+            fetch_current=fetch_current,
+        )
+
+    def edit_collection(self, collection_id: int) -> CollectionEditor:
+        """
+        Helper method to edit the images in a collection, batching the edits
+        into one update request that is only sent if the collection changes.
+
+        See :class:`~media_management_sdk.editor.CollectionEditor` for details.
+        """
+        return CollectionEditor(self.api, collection_id)
+
+    def sync_collection(self, collection_id: int, course_image_ids: List[int]) -> bool:
+        """
+        Helper method to set the images in a collection, in order, sending an
+        update request only if they differ from the current images.
+
+        Returns:
+            True if the collection was updated.
+        """
+        editor = CollectionEditor(self.api, collection_id)
+        editor.set_images(course_image_ids)
+        return editor.commit()
+
+    def get_course_snapshot(
+        self, course_id: int, max_workers: int = DEFAULT_SNAPSHOT_WORKERS
+    ) -> CourseSnapshot:
+        """
+        Helper method to fetch a course with its collections and the images in
+        each collection, issuing the per-collection requests concurrently.
+
+        See :func:`~media_management_sdk.snapshot.fetch_course_snapshot` for details.
+        """
+        return fetch_course_snapshot(self.api, course_id, max_workers=max_workers)
+
+
+class AsyncClient(BaseClient):
+    """
+    AsyncClient is a wrapper for interacting with the API from asyncio code.
+
+    The ``api`` attribute is an :class:`~media_management_sdk.async_api.AsyncAPI`
+    instance, so all of its endpoint methods must be awaited.
+    """
+
+    api_class = AsyncAPI
+
+    async def authenticate(
+        self,
+        user_id: str,
+        course_id: Optional[int] = None,
+        course_permission: Optional[str] = None,
+    ) -> AsyncAPI:
+        """
+        Authenticates with the API and authorizes the user for the course.
+
+        Successful authorizations are remembered for ``authorization_ttl`` seconds.
+
+        The token is set on the shared ``api`` instance, which is only safe while
+        a single user is authenticated at a time: concurrent tasks that act for
+        different users would send requests with each other's tokens. Such
+        tasks should each use the returned API instead.
+
+        Returns:
+            A view of ``api`` bound to the user's access token (see
+            :meth:`API.with_access_token <media_management_sdk.api.API.with_access_token>`).
+        """
+        api = self._authenticate_api(
+            user_id,
+            course_id,
+            self._get_access_token(user_id, course_id, course_permission),
+        )
+
+        if course_id is not None:
+            key = (user_id, course_id, course_permission)
+            if key not in self.authorizations:
+                # a forbidden authorization is forgotten by the view's on_forbidden
+                await api.authorize_user()
+                self.authorizations.set(key, True)
+        return api
+
+    async def find_or_create_course(
+        self,
+        lti_context_id: str,
+        lti_tool_consumer_instance_guid: str,
+        title: str = "",
+        lti_context_title: Optional[str] = None,
+        lti_context_label: Optional[str] = None,
+        sis_course_id: Optional[str] = None,
+        canvas_course_id: Optional[int] = None,
+    ) -> dict:
+        """
+        Helper method to find or create a course.
+        """
+        courses = await self.api.list_courses(
+            lti_context_id=lti_context_id,
+            lti_tool_consumer_instance_guid=lti_tool_consumer_instance_guid,
+        )
+        if len(courses) > 1:
+            raise ApiError("Multiple courses found")
+        elif len(courses) == 1:
+            return courses[0]
+
+        return await self.api.create_course(
+            title=title,
+            lti_context_id=lti_context_id,
+            lti_tool_consumer_instance_guid=lti_tool_consumer_instance_guid,
+            lti_context_title=lti_context_title,
+            lti_context_label=lti_context_label,
+            sis_course_id=sis_course_id,
+            canvas_course_id=canvas_course_id,
+        )
@@ -0,0 +1,233 @@
+import codecs
+import json
+import re
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+class JSONCodec(object):
+    """
+    Encodes request bodies and decodes response bodies using the standard
+    library ``json`` module.
+
+    Subclasses may use a faster JSON library. Bodies are encoded to bytes once
+    per request, and responses are decoded directly from the raw response body.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes an object as a UTF-8 JSON document."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decodes a JSON document.
+
+        Raises:
+            ValueError: If the data is not valid JSON.
+        """
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name}>"
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Encodes and decodes JSON with the ``orjson`` package, which is several times
+    faster than the standard library for large documents.
+
+    Requires the ``orjson`` package (``pip install media-management-sdk[fast-json]``).
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "orjson is required for OrjsonCodec: pip install media-management-sdk[fast-json]"
+            )
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+def default_codec() -> JSONCodec:
+    """Returns the fastest available codec: orjson if installed, otherwise the standard library."""
+    if orjson is not None:
+        return OrjsonCodec()
+    return JSONCodec()
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_TERMINATORS = frozenset(" \t\n\r,]")
+
+# States of a JSONArrayDecoder.
+_START, _FIRST_ITEM, _ITEM, _SEPARATOR, _END = range(5)
+
+
+class JSONArrayDecoder(object):
+    """
+    Incrementally decodes the items of a JSON array from chunks of a document,
+    so that large responses can be processed without holding them in memory.
+
+    Only the undecoded remainder of the document is buffered. An item is
+    returned once the data following it shows that it is complete.
+    """
+
+    def __init__(self) -> None:
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._state = _START
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Adds a chunk of the document.
+
+        Returns:
+            The items completed by the chunk.
+
+        Raises:
+            ValueError: If the document is not a JSON array.
+        """
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._decode_items(final=False)
+
+    def close(self) -> List[Any]:
+        """Signals the end of the document.
+
+        Returns:
+            The remaining items.
+
+        Raises:
+            ValueError: If the document is not a complete JSON array.
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        items = self._decode_items(final=True)
+        if self._state != _END:
+            raise ValueError("Unexpected end of JSON array")
+        return items
+
+    def _decode_items(self, final: bool) -> List[Any]:
+        items = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if self._state == _START:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._state = _FIRST_ITEM
+                pos += 1
+            elif self._state == _SEPARATOR or (
+                self._state == _FIRST_ITEM and char == "]"
+            ):
+                if char == "]":
+                    self._state = _END
+                elif char == "," and self._state == _SEPARATOR:
+                    self._state = _ITEM
+                else:
+                    raise ValueError(f"Expected ',' or ']' at position {pos}")
+                pos += 1
+            elif self._state == _END:
+                raise ValueError("Extra data after JSON array")
+            else:
+                try:
+                    item, end = self._raw_decode(buffer, pos)
+                except ValueError:
+                    if final:
+                        raise
+                    break
+                # the item may continue in the next chunk, e.g. a number "4." that
+                # has only been decoded as far as "4"
+                if not final and (
+                    end == len(buffer)
+                    or (_is_number(item) and buffer[end] not in _NUMBER_TERMINATORS)
+                ):
+                    break
+                items.append(item)
+                self._state = _SEPARATOR
+                pos = end
+        self._buffer = buffer[pos:]
+        return items
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yields the items of a JSON array as they are decoded from chunks of the document.
+
+    Raises:
+        ValueError: If the document is not a JSON array.
+    """
+    decoder = JSONArrayDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+def split_page(page: Any) -> Tuple[List[Any], Optional[str]]:
+    """Splits one page of a list response into its items and the URL of the next page.
+
+    A page is either a JSON array, or a paginated object such as
+    ``{"results": [...], "next": "<url>"}``.
+
+    Raises:
+        ValueError: If the page is neither.
+    """
+    if isinstance(page, list):
+        return page, None
+    if isinstance(page, dict) and isinstance(page.get("results"), list):
+        return page["results"], page.get("next")
+    raise ValueError("Expected a JSON array or a paginated object with results")
+
+
+class JSONPageDecoder(object):
+    """
+    Incrementally decodes one page of a list response (see :func:`split_page`).
+
+    The items of a JSON array are returned as they are decoded. A paginated
+    object is buffered and decoded when complete, after which ``next_url`` is
+    the URL of the next page, if any.
+    """
+
+    def __init__(self, loads: Callable[[bytes], Any] = json.loads) -> None:
+        self.loads = loads
+        self.next_url: Optional[str] = None
+        self._array_decoder: Optional[JSONArrayDecoder] = None
+        self._chunks: List[bytes] = []
+        self._paginated = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        if self._array_decoder is not None:
+            return self._array_decoder.feed(chunk)
+        self._chunks.append(chunk)
+        if self._paginated:
+            return []
+        head = b"".join(self._chunks).lstrip()
+        if not head:
+            return []
+        if head.startswith(b"{"):
+            self._paginated = True
+            return []
+        self._array_decoder = JSONArrayDecoder()
+        self._chunks = []
+        return self._array_decoder.feed(head)
+
+    def close(self) -> List[Any]:
+        if self._array_decoder is not None:
+            return self._array_decoder.close()
+        items, self.next_url = split_page(self.loads(b"".join(self._chunks)))
+        return items
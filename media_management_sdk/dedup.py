@@ -0,0 +1,204 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def hash_file(fp: IO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """Returns the SHA-256 hex digest of a file's contents.
+
+    The file is read in chunks from its current position, which is restored
+    afterwards so that the file can then be uploaded.
+    """
+    position = fp.tell()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: fp.read(chunk_size), b""):
+        digest.update(chunk)
+    fp.seek(position)
+    return digest.hexdigest()
+
+
+class DedupIndex(object):
+    """
+    Base class for indexes of the images uploaded to each course, keyed by the
+    hash of their contents, used by :class:`~media_management_sdk.api.API` to
+    skip uploading files that are already in a course library.
+    """
+
+    def get(self, course_id: Any, digest: str) -> Optional[dict]:
+        """Returns the image record for a file uploaded to the course, if any."""
+        raise NotImplementedError
+
+    def set(self, course_id: Any, digest: str, image: dict) -> None:
+        raise NotImplementedError
+
+    def forget_image(self, image_id: Any) -> None:
+        """Removes the entries for a deleted image."""
+        raise NotImplementedError
+
+    def forget_course(self, course_id: Any) -> None:
+        """Removes the entries for a deleted course."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryDedupIndex(DedupIndex):
+    """
+    An in-memory dedup index, for the lifetime of the process.
+    """
+
+    def __init__(self) -> None:
+        self._data: Dict[Tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+
+    def get(self, course_id: Any, digest: str) -> Optional[dict]:
+        return self._data.get((str(course_id), digest))
+
+    def set(self, course_id: Any, digest: str, image: dict) -> None:
+        with self._lock:
+            self._data[(str(course_id), digest)] = image
+
+    def forget_image(self, image_id: Any) -> None:
+        with self._lock:
+            for key in [
+                k for (k, v) in self._data.items() if str(v.get("id")) == str(image_id)
+            ]:
+                del self._data[key]
+
+    def forget_course(self, course_id: Any) -> None:
+        with self._lock:
+            for key in [k for k in self._data if k[0] == str(course_id)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteDedupIndex(DedupIndex):
+    """
+    A persistent dedup index stored in a SQLite database, so that files
+    uploaded in earlier runs are recognized.
+    """
+
+    def __init__(self, path: str) -> None:
+        """SQLiteDedupIndex constructor.
+
+        Args:
+            path: Path of the database file. Created if needed.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS uploaded_images ("
+                " course_id TEXT NOT NULL,"
+                " digest TEXT NOT NULL,"
+                " image_id TEXT,"
+                " image TEXT NOT NULL,"
+                " PRIMARY KEY (course_id, digest))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS uploaded_images_image_id"
+                " ON uploaded_images (image_id)"
+            )
+
+    def get(self, course_id: Any, digest: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT image FROM uploaded_images WHERE course_id = ? AND digest = ?",
+                (str(course_id), digest),
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def set(self, course_id: Any, digest: str, image: dict) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO uploaded_images VALUES (?, ?, ?, ?)",
+                (str(course_id), digest, str(image.get("id")), json.dumps(image)),
+            )
+
+    def forget_image(self, image_id: Any) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM uploaded_images WHERE image_id = ?", (str(image_id),)
+            )
+
+    def forget_course(self, course_id: Any) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM uploaded_images WHERE course_id = ?", (str(course_id),)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM uploaded_images")
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class DedupPlan(object):
+    """
+    Splits the files of an upload into those already in the course library,
+    according to the index, and those that must be uploaded.
+
+    Files with the same contents are uploaded once.
+    """
+
+    def __init__(
+        self,
+        index: DedupIndex,
+        course_id: Any,
+        upload_files: Sequence[Tuple[str, IO, str]],
+    ) -> None:
+        self.index = index
+        self.course_id = course_id
+        self.digests = [hash_file(fp) for (name, fp, content_type) in upload_files]
+        self.images: List[Any] = [
+            index.get(course_id, digest) for digest in self.digests
+        ]
+        first_seen: Dict[str, int] = {}
+        self.pending: List[int] = []
+        for i, digest in enumerate(self.digests):
+            if self.images[i] is None and digest not in first_seen:
+                first_seen[digest] = i
+                self.pending.append(i)
+        self.pending_files = [upload_files[i] for i in self.pending]
+
+    def complete(self, uploaded: Sequence[Any]) -> List[Any]:
+        """Records the uploaded images in the index.
+
+        Args:
+            uploaded: The image records returned for the pending files, in order.
+
+        Returns:
+            The image records for all of the files, in input order, with None
+            for any file whose record is missing from the response.
+        """
+        by_digest = {}
+        for n, i in enumerate(self.pending):
+            if n >= len(uploaded):
+                break
+            image = uploaded[n]
+            by_digest[self.digests[i]] = image
+            record = image.to_dict() if hasattr(image, "to_dict") else image
+            self.index.set(self.course_id, self.digests[i], record)
+        return [
+            image if image is not None else by_digest.get(digest)
+            for (image, digest) in zip(self.images, self.digests)
+        ]
+
+    @property
+    def skipped(self) -> int:
+        """The number of files that do not need to be uploaded."""
+        return len(self.digests) - len(self.pending)
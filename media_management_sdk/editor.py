@@ -0,0 +1,141 @@
+import logging
+from typing import Any, Iterable, List, Optional
+
+from media_management_sdk.api import API
+
+logger = logging.getLogger(__name__)
+
+
+class CollectionEditor(object):
+    """
+    Edits the images in a collection, sending a single
+    :meth:`API.update_collection <media_management_sdk.api.API.update_collection>`
+    request for any number of edits, and none at all if the edits leave the
+    collection unchanged.
+
+    The current images are read with ``get_collection_images`` when first
+    needed, which is served from the API's object cache if it is configured
+    with a TTL for that endpoint. Edits are applied locally and sent by
+    :meth:`commit`, or on leaving the ``with`` block without an exception.
+    """
+
+    def __init__(
+        self,
+        api: API,
+        collection_id: int,
+        course_image_ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        """CollectionEditor constructor.
+
+        Args:
+            api: The API instance used for the requests.
+            collection_id: Collection ID.
+            course_image_ids: The current course image IDs in the collection,
+                in order, if already known. Defaults to None (fetched when needed).
+        """
+        self.api = api
+        self.collection_id = collection_id
+        self._current: Optional[List[int]] = (
+            list(course_image_ids) if course_image_ids is not None else None
+        )
+        self._pending: Optional[List[int]] = None
+
+    @property
+    def current(self) -> List[int]:
+        """The course image IDs in the collection, as last read or committed."""
+        if self._current is None:
+            images = self.api.get_collection_images(self.collection_id)
+            self._current = [image["course_image_id"] for image in images]
+        return list(self._current)
+
+    @property
+    def images(self) -> List[int]:
+        """The course image IDs in the collection, including uncommitted edits."""
+        return list(self._pending) if self._pending is not None else self.current
+
+    @property
+    def has_changes(self) -> bool:
+        return self._pending is not None and self._pending != self.current
+
+    def set_images(self, course_image_ids: Iterable[int]) -> None:
+        """Replaces the images in the collection with the given images, in order."""
+        self._pending = _unique(course_image_ids)
+
+    def add_images(
+        self, course_image_ids: Iterable[int], position: Optional[int] = None
+    ) -> None:
+        """Adds images that are not already in the collection.
+
+        Args:
+            course_image_ids: Course image IDs to add.
+            position: Index to insert the images at. Defaults to None (the end).
+        """
+        images = self.images
+        existing = set(images)
+        added = [i for i in _unique(course_image_ids) if i not in existing]
+        if position is None:
+            position = len(images)
+        images[position:position] = added
+        self._pending = images
+
+    def remove_images(self, course_image_ids: Iterable[int]) -> None:
+        removed = set(course_image_ids)
+        self._pending = [i for i in self.images if i not in removed]
+
+    def move_image(self, course_image_id: int, position: int) -> None:
+        """Moves an image in the collection to a new index.
+
+        Raises:
+            ValueError: If the image is not in the collection.
+        """
+        images = self.images
+        images.remove(course_image_id)
+        images.insert(position, course_image_id)
+        self._pending = images
+
+    def discard(self) -> None:
+        """Discards the uncommitted edits."""
+        self._pending = None
+
+    def commit(self) -> bool:
+        """Sends the edits, if they change the collection.
+
+        The collection's title and course are read with ``get_collection``,
+        since the update request requires them.
+
+        Returns:
+            True if an update request was sent.
+
+        Raises:
+            ApiError: Raised on 4XX or 5XX error response.
+        """
+        if not self.has_changes:
+            logger.debug("Collection %s unchanged, skipping update", self.collection_id)
+            self._pending = None
+            return False
+
+        pending: List[int] = self._pending  # type: ignore
+        collection = self.api.get_collection(self.collection_id)
+        self.api.update_collection(
+            self.collection_id,
+            course_id=collection["course_id"],
+            title=collection["title"],
+            course_image_ids=pending,
+        )
+        self._current = pending
+        self._pending = None
+        return True
+
+    def __enter__(self) -> "CollectionEditor":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+
+def _unique(values: Iterable[int]) -> List[int]:
+    """Returns the values in order, without duplicates."""
+    return list(dict.fromkeys(values))
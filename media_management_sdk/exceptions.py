@@ -16,3 +16,11 @@ class ApiForbiddenError(ApiHTTPError):
 
 class ApiNotFoundError(ApiHTTPError):
     pass
+
+
+class ApiCircuitOpenError(ApiError):
+    pass
+
+
+class ApiDeadlineExceededError(ApiError):
+    pass
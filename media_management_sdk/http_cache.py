@@ -0,0 +1,237 @@
+import collections
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Mapping, Optional
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class CachedResponse(object):
+    """
+    A response body together with the validators used to revalidate it.
+    """
+
+    def __init__(
+        self,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        """The headers that ask the server to return 304 if the response is unchanged."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @classmethod
+    def from_response(
+        cls, body: bytes, headers: Mapping[str, str]
+    ) -> Optional["CachedResponse"]:
+        """Creates an entry from a response, or returns None if it has no validators."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return None
+        return cls(body, etag=etag, last_modified=last_modified)
+
+
+class ResponseCache(object):
+    """
+    Base class for response cache backends used by
+    :class:`~media_management_sdk.api.API` for conditional GET requests.
+    """
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        raise NotImplementedError
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @staticmethod
+    def make_key(
+        url: str, params: Optional[Mapping] = None, authorization: str = ""
+    ) -> str:
+        """Builds a cache key for a request.
+
+        The authorization header is part of the key because the API returns
+        different data to different users. It is hashed rather than stored.
+        """
+        query = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+        raw = json.dumps([url, query, authorization])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class MemoryResponseCache(ResponseCache):
+    """
+    An in-memory response cache that evicts the least recently used entries
+    when either the number of entries or total body size exceeds its limits.
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """MemoryResponseCache constructor.
+
+        Args:
+            max_entries: Maximum number of cached responses. Defaults to 256.
+            max_bytes: Maximum total size of the cached bodies. Defaults to 32MiB.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._data: "collections.OrderedDict[str, CachedResponse]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            response = self._data.get(key)
+            if response is not None:
+                self._data.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        if response.size > self.max_bytes:
+            self.delete(key)
+            return
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous.size
+            self._data[key] = response
+            self.total_bytes += response.size
+            while (
+                len(self._data) > self.max_entries or self.total_bytes > self.max_bytes
+            ):
+                _, evicted = self._data.popitem(last=False)
+                self.total_bytes -= evicted.size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class FileResponseCache(ResponseCache):
+    """
+    An on-disk response cache that stores one file per response in a directory,
+    so cached responses survive restarts and can be shared between processes.
+
+    When the total size of the directory exceeds ``max_bytes``, the least
+    recently used files are removed.
+    """
+
+    SUFFIX = ".cache"
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """FileResponseCache constructor.
+
+        Args:
+            directory: Directory to store the cached responses in. Created if needed.
+            max_bytes: Maximum total size of the cache files. Defaults to 32MiB.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline().decode("utf-8"))
+                body = f.read()
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(
+            body, etag=header.get("etag"), last_modified=header.get("last_modified")
+        )
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        header = json.dumps(
+            dict(etag=response.etag, last_modified=response.last_modified)
+        )
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(header.encode("utf-8") + b"\n")
+                f.write(response.body)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        self._evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        for path, _, _ in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _entries(self) -> list:
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda entry: entry[2])
+            total = sum(size for (_, size, _) in entries)
+            for path, size, _ in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
@@ -0,0 +1,248 @@
+import contextlib
+import json
+import logging
+import mimetypes
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from media_management_sdk.api import API
+from media_management_sdk.bulk import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_WORKERS,
+    BulkUploader,
+    UploadResult,
+)
+from media_management_sdk.dedup import hash_file
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+
+class ImportJournal(object):
+    """
+    An append-only journal of the files uploaded by an import, with one JSON
+    object per line, so that an interrupted import can be resumed.
+
+    Each entry records the course, the file path, size, modification time and
+    SHA-256 hash, and the ID of the uploaded image. A file is considered done
+    when it has an entry for the course and its size and modification time are
+    unchanged, or failing that, its hash is unchanged.
+    """
+
+    def __init__(self, path: str) -> None:
+        """ImportJournal constructor.
+
+        Existing entries are loaded from the file. A partially written last
+        line, left by a crash, is ignored.
+
+        Args:
+            path: Path of the journal file. Created if needed.
+        """
+        self.path = path
+        self._entries: Dict[tuple, dict] = {}
+        self._lock = threading.Lock()
+        needs_newline = False
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                for line in f:
+                    needs_newline = not line.endswith(b"\n")
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        logger.warning("Ignoring corrupt line in %s", path)
+                        continue
+                    self._entries[(str(entry["course_id"]), entry["path"])] = entry
+        self._file = open(path, "a", encoding="utf-8")
+        if needs_newline:
+            self._file.write("\n")
+
+    def get(self, course_id: Any, path: str) -> Optional[dict]:
+        return self._entries.get((str(course_id), os.path.abspath(path)))
+
+    def is_done(self, course_id: Any, path: str) -> bool:
+        """Returns True if the file at ``path`` was uploaded to the course as it is now.
+
+        A file that is missing or cannot be read is not done.
+        """
+        entry = self.get(course_id, path)
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(path)
+            if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                return True
+            with open(path, "rb") as fp:
+                return entry["sha256"] == hash_file(fp)
+        except OSError:
+            return False
+
+    def record(self, entries: Iterable[dict]) -> None:
+        """Appends entries and flushes them to disk."""
+        with self._lock:
+            for entry in entries:
+                self._entries[(str(entry["course_id"]), entry["path"])] = entry
+                self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ImportJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ImportReport(object):
+    """
+    The results of the files uploaded by an import, and the paths skipped
+    because the journal shows that they were already uploaded.
+    """
+
+    def __init__(self, results: List[UploadResult], skipped: List[str]) -> None:
+        self.results = results
+        self.skipped = skipped
+
+    @property
+    def succeeded(self) -> List[UploadResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[UploadResult]:
+        return [result for result in self.results if not result.ok]
+
+    def __repr__(self) -> str:
+        return (
+            f"<ImportReport succeeded={len(self.succeeded)} "
+            f"failed={len(self.failed)} skipped={len(self.skipped)}>"
+        )
+
+
+class JournaledImporter(object):
+    """
+    Uploads files from disk with :class:`~media_management_sdk.bulk.BulkUploader`,
+    recording each batch in an :class:`ImportJournal` as soon as it is uploaded.
+
+    Running the same import again skips the files that were uploaded, so an
+    interrupted import resumes where it stopped, and failed files are retried.
+    Files are opened a group at a time, so any number of paths can be imported.
+    """
+
+    def __init__(
+        self,
+        api: API,
+        journal: ImportJournal,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        stream: bool = False,
+    ) -> None:
+        """JournaledImporter constructor.
+
+        Args:
+            api: The API instance used to upload each batch.
+            journal: The journal of uploaded files.
+            batch_size: Maximum number of files sent in one request. Defaults to 10.
+            max_workers: Maximum number of batches uploaded concurrently. Defaults to 4.
+            max_retries: Number of times a failed batch is retried. Defaults to 2.
+            stream: Stream each batch request body instead of building it in memory.
+                Defaults to False.
+        """
+        self.journal = journal
+        self.uploader = BulkUploader(
+            api,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            max_retries=max_retries,
+            stream=stream,
+        )
+
+    def run(
+        self, course_id: int, paths: Iterable[str], title: Optional[str] = None
+    ) -> ImportReport:
+        """Uploads the files that are not in the journal.
+
+        Args:
+            course_id: Course ID.
+            paths: Paths of the files to upload. Content types are guessed
+                from the file names.
+            title: Title to use for every file. Note that if
+                not specified, the original file name will be used. Defaults to None.
+
+        Returns:
+            A report with the result of each uploaded file and the skipped paths.
+        """
+        results: List[UploadResult] = []
+        skipped: List[str] = []
+        group: List[str] = []
+        group_size = self.uploader.batch_size * self.uploader.max_workers
+        for path in paths:
+            path = os.path.abspath(path)
+            if self.journal.is_done(course_id, path):
+                skipped.append(path)
+                continue
+            group.append(path)
+            if len(group) == group_size:
+                results.extend(self._upload(course_id, group, title))
+                group = []
+        if group:
+            results.extend(self._upload(course_id, group, title))
+        if skipped:
+            logger.info("Skipped %d files already imported", len(skipped))
+        return ImportReport(results, skipped)
+
+    def _upload(
+        self, course_id: int, paths: List[str], title: Optional[str]
+    ) -> List[UploadResult]:
+        """Uploads a group of files, journaling each batch as it completes.
+
+        A file that is missing or cannot be read is reported as failed.
+        """
+        unreadable: Dict[int, UploadResult] = {}
+        with contextlib.ExitStack() as stack:
+            files = []
+            entries = []
+            for n, path in enumerate(paths):
+                try:
+                    fp = stack.enter_context(open(path, "rb"))
+                    stat = os.fstat(fp.fileno())
+                    digest = hash_file(fp)
+                except OSError as e:
+                    logger.warning("Cannot read %s: %s", path, e)
+                    unreadable[n] = UploadResult(os.path.basename(path), error=e)
+                    continue
+                content_type = mimetypes.guess_type(path)[0] or DEFAULT_CONTENT_TYPE
+                files.append((os.path.basename(path), fp, content_type))
+                entries.append(
+                    {
+                        "course_id": course_id,
+                        "path": path,
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "sha256": digest,
+                    }
+                )
+
+            def on_batch(batch: List[int], batch_results: List[UploadResult]) -> None:
+                self.journal.record(
+                    dict(entries[i], image_id=result.image["id"])  # type: ignore
+                    for i, result in zip(batch, batch_results)
+                    if result.ok
+                )
+
+            report = self.uploader.upload(
+                course_id, files, title=title, on_batch=on_batch
+            )
+        uploaded = iter(report.results)
+        return [
+            unreadable[n] if n in unreadable else next(uploaded)
+            for n in range(len(paths))
+        ]
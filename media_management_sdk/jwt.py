@@ -3,12 +3,18 @@ from typing import Optional
 
 import jwt
 
+from media_management_sdk.cache import TTLCache
+
+DEFAULT_EXPIRES_IN = 3600
+DEFAULT_REFRESH_MARGIN = 300
+DEFAULT_TOKEN_CACHE_SIZE = 1024
+
 
 def create_jwt(
     client_id: str,
     client_secret: str,
     user_id: str,
-    expires_in: float = 3600,
+    expires_in: float = DEFAULT_EXPIRES_IN,
     course_id: Optional[int] = None,
     course_permission: Optional[str] = None,
 ) -> str:
@@ -50,3 +56,65 @@ def create_jwt(
         pass
 
     return token
+
+
+class TokenCache(object):
+    """
+    Caches JSON web tokens so that repeated authentication of the same user
+    does not re-sign a token each time.
+
+    Tokens are keyed by client, user, course and permission. A cached token is
+    reused until ``refresh_margin`` seconds before it expires, after which a new
+    token is minted, so a token handed out is always valid for at least that long.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_TOKEN_CACHE_SIZE,
+        expires_in: float = DEFAULT_EXPIRES_IN,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+    ) -> None:
+        """TokenCache constructor.
+
+        Args:
+            maxsize: Maximum number of tokens to cache, evicting the least recently
+                used. A size of 0 disables caching. Defaults to 1024.
+            expires_in: Number of seconds until each token expires. Defaults to 3600 seconds (1 hour).
+            refresh_margin: Number of seconds before expiration that a token is
+                replaced. Defaults to 300 seconds (5 minutes).
+        """
+        if refresh_margin >= expires_in:
+            raise ValueError("Refresh margin must be less than the token expiration")
+
+        self.expires_in = expires_in
+        self.refresh_margin = refresh_margin
+        self._cache = TTLCache(maxsize=maxsize, ttl=expires_in - refresh_margin)
+
+    def get_token(
+        self,
+        client_id: str,
+        client_secret: str,
+        user_id: str,
+        course_id: Optional[int] = None,
+        course_permission: Optional[str] = None,
+    ) -> str:
+        """Returns a cached token for the user, creating one if needed.
+
+        See :func:`create_jwt` for the arguments.
+        """
+        key = (client_id, user_id, course_id, course_permission)
+        token = self._cache.get(key)
+        if token is None:
+            token = create_jwt(
+                client_id=client_id,
+                client_secret=client_secret,
+                user_id=user_id,
+                expires_in=self.expires_in,
+                course_id=course_id,
+                course_permission=course_permission,
+            )
+            self._cache.set(key, token)
+        return token
+
+    def clear(self) -> None:
+        self._cache.clear()
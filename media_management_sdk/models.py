@@ -0,0 +1,247 @@
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type
+
+
+class Nested(object):
+    """
+    A model field holding another model, or a list of models, that is parsed
+    from the raw response data on first access.
+    """
+
+    def __init__(self, model: Callable[[], Type["Model"]]) -> None:
+        """Nested constructor.
+
+        Args:
+            model: Function returning the model class, so that classes defined
+                later in the module can be referenced.
+        """
+        self.model = model
+        self.slot = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = "_" + name
+
+    def __get__(self, obj: Optional["Model"], objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if isinstance(value, list):
+            value = tuple(self.model().from_dict(item) for item in value)
+            setattr(obj, self.slot, value)
+        elif isinstance(value, dict):
+            value = self.model().from_dict(value)
+            setattr(obj, self.slot, value)
+        return value
+
+    def __set__(self, obj: "Model", value: Any) -> None:
+        setattr(obj, self.slot, value)
+
+
+class Model(object):
+    """
+    Base class for the typed models returned by :class:`~media_management_sdk.api.API`
+    when ``return_models`` is enabled.
+
+    Fields are stored in ``__slots__``, so a model takes much less memory than
+    the equivalent dict. Fields declared with :class:`Nested` are parsed when
+    first accessed. Fields returned by the API that are not declared on the
+    model are kept in ``extra`` and are also available as attributes.
+
+    Models support read-only item access (``course["title"]``) so that code
+    written for dicts keeps working.
+    """
+
+    __slots__ = ("extra",)
+
+    # Names of the fields, derived from __slots__ for each subclass.
+    fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)  # type: ignore
+        cls.fields = cls.fields + tuple(
+            slot.lstrip("_") for slot in cls.__dict__.get("__slots__", ())
+        )
+
+    def __init__(self, **data: Any) -> None:
+        for name in self.fields:
+            setattr(self, name, data.pop(name, None))
+        self.extra = data or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Model":
+        """Creates a model from response data."""
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the model back to response data."""
+        data = {name: _to_data(getattr(self, name)) for name in self.fields}
+        data.update(self.extra or {})
+        return data
+
+    def keys(self) -> Iterator[str]:
+        yield from self.fields
+        yield from self.extra or ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.fields:
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.fields or (self.extra is not None and key in self.extra)
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for names that are not slots, i.e. undeclared fields
+        if name != "extra" and self.extra is not None and name in self.extra:
+            return self.extra[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Model) or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} id={self.get('id')}>"
+
+
+def _to_data(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_to_data(item) for item in value]
+    return value
+
+
+class ImageMetadata(Model):
+    """A label and value describing an image."""
+
+    __slots__ = ("label", "value")
+
+    def __repr__(self) -> str:
+        return f"<ImageMetadata {self.label}={self.value!r}>"
+
+
+class Image(Model):
+    """
+    An image in a course library, or in a collection.
+
+    Images returned by ``get_collection_images`` also have the ``collection_id``
+    and the ``course_image_id`` of the image in the course library.
+    """
+
+    __slots__ = (
+        "id",
+        "url",
+        "type",
+        "course_id",
+        "collection_id",
+        "course_image_id",
+        "title",
+        "description",
+        "sort_order",
+        "upload_file_name",
+        "is_upload",
+        "image_type",
+        "image_width",
+        "image_height",
+        "image_url",
+        "thumb_url",
+        "thumb_width",
+        "thumb_height",
+        "iiif_base_url",
+        "created",
+        "updated",
+        "_metadata",
+    )
+
+    metadata = Nested(lambda: ImageMetadata)
+
+
+class Collection(Model):
+    """A collection of images in a course."""
+
+    __slots__ = (
+        "id",
+        "url",
+        "type",
+        "course_id",
+        "title",
+        "description",
+        "sort_order",
+        "course_image_ids",
+        "images_url",
+        "created",
+        "updated",
+        "_images",
+    )
+
+    images = Nested(lambda: Image)
+
+
+class Course(Model):
+    """A course, with its image library and collections."""
+
+    __slots__ = (
+        "id",
+        "url",
+        "type",
+        "title",
+        "lti_context_id",
+        "lti_tool_consumer_instance_guid",
+        "lti_context_title",
+        "lti_context_label",
+        "canvas_course_id",
+        "sis_course_id",
+        "collections_url",
+        "images_url",
+        "created",
+        "updated",
+        "_collections",
+    )
+
+    collections = Nested(lambda: Collection)
+
+
+# The model for the data returned by each endpoint, keyed by API method name.
+RESPONSE_MODELS: Dict[str, Type[Model]] = {
+    "list_courses": Course,
+    "search_courses": Course,
+    "get_course": Course,
+    "create_course": Course,
+    "update_course": Course,
+    "copy_course": Course,
+    "list_collections": Collection,
+    "get_collection": Collection,
+    "create_collection": Collection,
+    "update_collection": Collection,
+    "get_collection_images": Image,
+    "upload_images": Image,
+    "get_image": Image,
+    "update_image": Image,
+}
+
+
+def parse_response(endpoint: Optional[str], data: Any) -> Any:
+    """Converts the data returned by an endpoint to models.
+
+    Lists are converted item by item. Data from endpoints without a model, and
+    empty responses, are returned unchanged.
+    """
+    model = RESPONSE_MODELS.get(endpoint or "")
+    if model is None or not data:
+        return data
+    if isinstance(data, list):
+        return [model.from_dict(item) for item in data]
+    if isinstance(data, dict):
+        return model.from_dict(data)
+    return data
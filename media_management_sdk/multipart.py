@@ -0,0 +1,149 @@
+import binascii
+import os
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# (field_name, (filename, file, content_type)), where the file may be any object
+# with a read method, such as a wrapper that counts the bytes read.
+FileField = Tuple[str, Tuple[str, Any, str]]
+
+
+class MultipartEncoder(object):
+    """
+    Encodes a multipart/form-data request body lazily.
+
+    The body is produced a chunk at a time as it is read, so file contents are
+    never loaded into memory all at once. Instances are file-like (``read``)
+    and iterable, which lets the requests library stream them to the socket;
+    :meth:`aiter_chunks` provides the same stream to async HTTP clients.
+
+    When the size of every file can be determined by seeking, :attr:`len` is the
+    total body length and the request is sent with a ``Content-Length`` header;
+    otherwise it is ``None`` and the body is sent with chunked transfer encoding.
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Mapping[str, Optional[str]]] = None,
+        files: Optional[List[FileField]] = None,
+        boundary: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """MultipartEncoder constructor.
+
+        Args:
+            fields: Form fields to include before the files. Fields with a
+                value of None are omitted. Defaults to None.
+            files: List of file fields: (field_name, (filename, file, content_type)).
+                Defaults to None.
+            boundary: The multipart boundary. Defaults to a random boundary.
+            chunk_size: Maximum number of bytes read from a file at a time. Defaults to 64KiB.
+        """
+        self.boundary = boundary or binascii.hexlify(os.urandom(16)).decode("ascii")
+        self.chunk_size = chunk_size
+        self._parts: List[Union[bytes, IO]] = []
+        self._current = 0
+        self._buffer = b""
+
+        for name, value in (fields or {}).items():
+            if value is None:
+                continue
+            self._parts.append(self._part_header(name) + str(value).encode("utf-8"))
+            self._parts.append(b"\r\n")
+        for name, (file_name, fp, content_type) in files or []:
+            self._parts.append(self._part_header(name, file_name, content_type))
+            self._parts.append(fp)
+            self._parts.append(b"\r\n")
+        self._parts.append(f"--{self.boundary}--\r\n".encode("ascii"))
+
+        self.len = self._compute_length()
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _part_header(
+        self,
+        name: str,
+        file_name: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> bytes:
+        disposition = f'form-data; name="{self._quote(name)}"'
+        if file_name is not None:
+            disposition += f'; filename="{self._quote(file_name)}"'
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        return (header + "\r\n").encode("utf-8")
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+    def _compute_length(self) -> Optional[int]:
+        total = 0
+        for part in self._parts:
+            if isinstance(part, bytes):
+                total += len(part)
+                continue
+            try:
+                position = part.tell()
+                total += part.seek(0, os.SEEK_END) - position
+                part.seek(position)
+            except (AttributeError, OSError, ValueError):
+                return None
+        return total
+
+    def _read_part(self, size: int) -> bytes:
+        """Reads up to ``size`` bytes from the current part, advancing when it is exhausted."""
+        while self._current < len(self._parts):
+            part = self._parts[self._current]
+            if isinstance(part, bytes):
+                self._current += 1
+                if part:
+                    return part
+                continue
+            chunk = part.read(size)
+            if chunk:
+                return chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            self._current += 1
+        return b""
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads up to ``size`` bytes of the encoded body.
+
+        A negative size reads the remaining body in ``chunk_size`` pieces, which
+        should be avoided for large files.
+        """
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(self.chunk_size), b""))
+
+        while len(self._buffer) < size:
+            chunk = self._read_part(min(size - len(self._buffer), self.chunk_size))
+            if not chunk:
+                break
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(lambda: self.read(self.chunk_size), b"")
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Yields the encoded body in chunks for async HTTP clients."""
+        for chunk in self:
+            yield chunk
+
+    def __repr__(self) -> str:
+        return f"<MultipartEncoder boundary={self.boundary} len={self.len}>"
@@ -0,0 +1,169 @@
+import concurrent.futures
+import contextvars
+import logging
+import queue
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from media_management_sdk.api import API
+from media_management_sdk.bulk import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_WORKERS,
+    BulkImageUpdater,
+    BulkUpdateReport,
+    BulkUploader,
+    BulkUploadReport,
+    UploadFile,
+    UploadResult,
+)
+from media_management_sdk.editor import CollectionEditor
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the updates queue.
+_DONE = object()
+
+
+class PipelineReport(object):
+    """
+    The results of an upload pipeline: the upload of each file, the update of
+    each uploaded image, and whether the collection was updated.
+    """
+
+    def __init__(
+        self,
+        uploads: BulkUploadReport,
+        updates: BulkUpdateReport,
+        collection_updated: bool = False,
+    ) -> None:
+        self.uploads = uploads
+        self.updates = updates
+        self.collection_updated = collection_updated
+
+    def __repr__(self) -> str:
+        return (
+            f"<PipelineReport uploaded={len(self.uploads.succeeded)} "
+            f"updated={len(self.updates.updated)} "
+            f"failed={len(self.uploads.failed) + len(self.updates.failed)}>"
+        )
+
+
+class UploadPipeline(object):
+    """
+    Uploads images, updates their descriptions and metadata, and adds them to
+    a collection, overlapping the stages.
+
+    Files are uploaded in concurrent batches by
+    :class:`~media_management_sdk.bulk.BulkUploader`. As soon as a batch is
+    uploaded, the updates for its images are handed to a
+    :class:`~media_management_sdk.bulk.BulkImageUpdater` running alongside, so
+    they are sent while the next batches upload. Fields already set by the
+    upload (such as the title) are not sent again. Finally, the uploaded images
+    are added to the collection with a single update request.
+    """
+
+    def __init__(
+        self,
+        api: API,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_update_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        stream: bool = False,
+    ) -> None:
+        """UploadPipeline constructor.
+
+        Args:
+            api: The API instance used for the requests.
+            batch_size: Maximum number of files sent in one upload request. Defaults to 10.
+            max_workers: Maximum number of batches uploaded concurrently. Defaults to 4.
+            max_update_workers: Maximum number of concurrent update requests. Defaults to 4.
+            max_retries: Number of times a failed upload or update is retried. Defaults to 2.
+            stream: Stream each batch request body instead of building it in memory.
+                Defaults to False.
+        """
+        self.api = api
+        self.uploader = BulkUploader(
+            api,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            max_retries=max_retries,
+            stream=stream,
+        )
+        self.updater = BulkImageUpdater(
+            api, max_workers=max_update_workers, max_retries=max_retries
+        )
+
+    def run(
+        self,
+        course_id: int,
+        items: Sequence[Tuple[UploadFile, Dict[str, Any]]],
+        collection_id: Optional[int] = None,
+        title: Optional[str] = None,
+    ) -> PipelineReport:
+        """Uploads the files, updates the images and adds them to the collection.
+
+        Args:
+            course_id: Course ID.
+            items: Pairs of (upload_file, changes), where upload_file is a file
+                tuple (filename, file, content_type) and changes maps any of
+                "title", "description", "sort_order" and "metadata" to the
+                new value, as for BulkImageUpdater.
+            collection_id: Collection to add the uploaded images to, after any
+                images already in it. Defaults to None.
+            title: Title to use for every file when uploading. Note that if
+                not specified, the original file name will be used. Defaults to None.
+
+        Returns:
+            A report with the results of each stage.
+
+        Raises:
+            ValueError: If any changes include a field that cannot be updated,
+                in which case nothing is uploaded.
+            ApiError: If the collection update fails.
+        """
+        items = list(items)
+        for upload_file, changes in items:
+            self.updater.check_changes(changes)
+        upload_files = [upload_file for (upload_file, changes) in items]
+        updates: queue.Queue = queue.Queue()
+        uploaded: Dict[int, Any] = {}
+        editor = (
+            CollectionEditor(self.api, collection_id)
+            if collection_id is not None
+            else None
+        )
+
+        def on_batch(batch: List[int], results: List[UploadResult]) -> None:
+            for i, result in zip(batch, results):
+                if result.ok:
+                    image = result.image
+                    uploaded[image["id"]] = image  # type: ignore
+                    updates.put((image["id"], items[i][1]))  # type: ignore
+
+        def run_updater() -> BulkUpdateReport:
+            return self.updater.update(
+                course_id, iter(updates.get, _DONE), current_images=uploaded
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            # run in copies of the caller's context so that deadlines apply
+            update_future = executor.submit(contextvars.copy_context().run, run_updater)
+            if editor is not None:
+                # read the collection while the files upload
+                executor.submit(
+                    contextvars.copy_context().run, lambda: editor.current  # type: ignore
+                )
+            try:
+                upload_report = self.uploader.upload(
+                    course_id, upload_files, title=title, on_batch=on_batch
+                )
+            finally:
+                updates.put(_DONE)
+            update_report = update_future.result()
+
+        collection_updated = False
+        if editor is not None and upload_report.images:
+            editor.add_images(image["id"] for image in upload_report.images)
+            collection_updated = editor.commit()
+        return PipelineReport(upload_report, update_report, collection_updated)
@@ -0,0 +1,250 @@
+import os
+import time
+from typing import IO, Any, Callable, List, Optional, Tuple
+
+from media_management_sdk.multipart import FileField, MultipartEncoder
+
+DEFAULT_MIN_INTERVAL = 0.1
+
+
+class UploadProgress(object):
+    """
+    A snapshot of the progress of an upload request.
+
+    Byte counts are of the request body as it is read by the HTTP client, so
+    the total includes the multipart headers, and ``total_bytes`` and
+    ``file_size`` are None when the sizes cannot be determined by seeking.
+    """
+
+    def __init__(
+        self,
+        file_name: Optional[str],
+        file_index: int,
+        file_bytes_sent: int,
+        file_size: Optional[int],
+        bytes_sent: int,
+        total_bytes: Optional[int],
+        elapsed: float,
+        throughput: float,
+        done: bool = False,
+    ) -> None:
+        """UploadProgress constructor.
+
+        Args:
+            file_name: Name of the file being sent, or None before the first file.
+            file_index: Index of the file being sent in the request.
+            file_bytes_sent: Number of bytes of the file sent.
+            file_size: Size of the file in bytes.
+            bytes_sent: Number of bytes of the request body sent.
+            total_bytes: Length of the request body in bytes.
+            elapsed: Number of seconds since the body started to be sent.
+            throughput: Bytes per second since the previous snapshot.
+            done: Whether the whole body has been sent.
+        """
+        self.file_name = file_name
+        self.file_index = file_index
+        self.file_bytes_sent = file_bytes_sent
+        self.file_size = file_size
+        self.bytes_sent = bytes_sent
+        self.total_bytes = total_bytes
+        self.elapsed = elapsed
+        self.throughput = throughput
+        self.done = done
+
+    @property
+    def average_throughput(self) -> float:
+        """Bytes per second since the body started to be sent."""
+        return self.bytes_sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """The fraction of the body sent, from 0 to 1."""
+        if not self.total_bytes:
+            return None
+        return self.bytes_sent / self.total_bytes
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated number of seconds until the body is sent, at the average throughput."""
+        if self.done:
+            return 0.0
+        if self.total_bytes is None or self.average_throughput <= 0:
+            return None
+        return (self.total_bytes - self.bytes_sent) / self.average_throughput
+
+    def __repr__(self) -> str:
+        return (
+            f"<UploadProgress {self.bytes_sent}/{self.total_bytes} bytes "
+            f"file={self.file_name} {self.throughput:.0f}B/s>"
+        )
+
+
+class ProgressTracker(object):
+    """
+    Counts the bytes of an upload request body as they are read and reports
+    :class:`UploadProgress` snapshots to a callback.
+
+    Snapshots are reported at most every ``min_interval`` seconds, and always
+    when a file has been read and when the body is complete.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[UploadProgress], Any],
+        total_bytes: Optional[int],
+        files: List[Tuple[str, Optional[int]]],
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """ProgressTracker constructor.
+
+        Args:
+            callback: Called with each snapshot.
+            total_bytes: Length of the request body, if known.
+            files: The name and size, if known, of each file in the body.
+            min_interval: Minimum number of seconds between snapshots. Defaults to 0.1.
+            timer: Function returning the current time in seconds. Defaults to time.monotonic.
+        """
+        self.callback = callback
+        self.total_bytes = total_bytes
+        self.files = files
+        self.min_interval = min_interval
+        self.timer = timer
+        self.bytes_sent = 0
+        self.file_index = 0
+        self.file_bytes_sent = [0] * len(files)
+        self._started: Optional[float] = None
+        self._last_time = 0.0
+        self._last_bytes = 0
+        self._force = False
+        self._finished = False
+
+    def file_read(self, file_index: int, size: int) -> None:
+        """Counts bytes read from a file. A size of 0 means the file has been read."""
+        self.file_index = file_index
+        if size:
+            self.file_bytes_sent[file_index] += size
+        else:
+            self._force = True
+
+    def body_read(self, size: int) -> None:
+        """Counts bytes of the body read by the HTTP client, and reports progress if due."""
+        if self._finished:
+            return
+        now = self.timer()
+        if self._started is None:
+            self._started = self._last_time = now
+        self.bytes_sent += size
+        done = size == 0 or self.bytes_sent == self.total_bytes
+        if done or self._force or now - self._last_time >= self.min_interval:
+            self._report(now, done)
+
+    def _report(self, now: float, done: bool) -> None:
+        interval = now - self._last_time
+        throughput = (
+            (self.bytes_sent - self._last_bytes) / interval if interval else 0.0
+        )
+        file_name, file_size = (
+            self.files[self.file_index] if self.files else (None, None)
+        )
+        self._last_time = now
+        self._last_bytes = self.bytes_sent
+        self._force = False
+        self._finished = done
+        self.callback(
+            UploadProgress(
+                file_name=file_name,
+                file_index=self.file_index,
+                file_bytes_sent=(
+                    self.file_bytes_sent[self.file_index] if self.files else 0
+                ),
+                file_size=file_size,
+                bytes_sent=self.bytes_sent,
+                total_bytes=self.total_bytes,
+                elapsed=now - self._started,  # type: ignore
+                throughput=throughput,
+                done=done,
+            )
+        )
+
+
+class _ProgressReader(object):
+    """Wraps a file to count the bytes read from it."""
+
+    def __init__(self, fp: IO, file_index: int) -> None:
+        self.fp = fp
+        self.file_index = file_index
+        self.tracker: Optional[ProgressTracker] = None
+
+    def read(self, size: int = -1) -> Any:
+        chunk = self.fp.read(size)
+        self.tracker.file_read(self.file_index, len(chunk))  # type: ignore
+        return chunk
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.fp, name)
+
+
+class ProgressMultipartEncoder(MultipartEncoder):
+    """
+    A :class:`~media_management_sdk.multipart.MultipartEncoder` that reports
+    the progress of the body as it is read.
+
+    The counting is done by this subclass, so requests without a progress
+    callback use the plain encoder and pay nothing for it.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[UploadProgress], Any],
+        fields: Optional[Any] = None,
+        files: Optional[List[FileField]] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        **kwargs: Any,
+    ) -> None:
+        """ProgressMultipartEncoder constructor.
+
+        Args:
+            callback: Called with :class:`UploadProgress` snapshots.
+            fields: Form fields to include before the files. Defaults to None.
+            files: List of file fields: (field_name, (filename, file, content_type)).
+                Defaults to None.
+            min_interval: Minimum number of seconds between snapshots. Defaults to 0.1.
+            **kwargs: Other arguments for MultipartEncoder.
+        """
+        readers = []
+        wrapped_files = []
+        for i, (name, (file_name, fp, content_type)) in enumerate(files or []):
+            reader = _ProgressReader(fp, i)
+            readers.append(reader)
+            wrapped_files.append((name, (file_name, reader, content_type)))
+        super().__init__(fields=fields, files=wrapped_files, **kwargs)
+        self.tracker = ProgressTracker(
+            callback,
+            self.len,
+            [
+                (file_name, self._file_size(fp))
+                for (name, (file_name, fp, content_type)) in files or []
+            ],
+            min_interval=min_interval,
+        )
+        for reader in readers:
+            reader.tracker = self.tracker
+
+    @staticmethod
+    def _file_size(fp: IO) -> Optional[int]:
+        try:
+            position = fp.tell()
+            size = fp.seek(0, os.SEEK_END) - position
+            fp.seek(position)
+            return size
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            # reads in chunks through this method, which counts them
+            return super().read(size)
+        data = super().read(size)
+        self.tracker.body_read(len(data))
+        return data
@@ -0,0 +1,113 @@
+import datetime
+import email.utils
+import random
+from typing import Callable, Iterable, Optional
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 30
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = ("get", "put", "delete")
+
+
+class RetryPolicy(object):
+    """
+    Decides whether a failed request is retried and how long to wait first.
+
+    Requests are retried after connection errors, timeouts and the HTTP status
+    codes in ``retry_status_codes``. The delay grows exponentially with each
+    attempt and, with jitter enabled, is chosen at random between zero and that
+    value ("full jitter") so that many clients do not retry in lockstep. A
+    ``Retry-After`` header sent by the server takes precedence.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        jitter: bool = True,
+        retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        retry_status_codes: Iterable[int] = RETRY_STATUS_CODES,
+        respect_retry_after: bool = True,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        """RetryPolicy constructor.
+
+        Args:
+            max_attempts: Maximum number of attempts, including the first. Defaults to 3.
+            backoff_factor: Delay in seconds before the first retry, doubled for
+                each subsequent retry. Defaults to 0.5.
+            max_backoff: Maximum delay in seconds, including delays requested
+                by a Retry-After header. Defaults to 30.
+            jitter: Whether to randomize the delay. Defaults to True.
+            retry_methods: HTTP methods that may be retried. Defaults to the
+                idempotent methods: get, put and delete.
+            retry_status_codes: HTTP status codes that are retried.
+                Defaults to 429, 500, 502, 503 and 504.
+            respect_retry_after: Whether to wait as long as the Retry-After
+                header asks. Defaults to True.
+            rand: Function returning a random float in [0, 1). Defaults to random.random.
+        """
+        if max_attempts < 1:
+            raise ValueError("Max attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_methods = frozenset(retry_methods)
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.respect_retry_after = respect_retry_after
+        self.rand = rand
+
+    def should_retry(
+        self, method: str, attempt: int, status_code: Optional[int] = None
+    ) -> bool:
+        """Returns True if the request should be retried.
+
+        Args:
+            method: The HTTP method.
+            attempt: The number of the attempt that failed, starting at 1.
+            status_code: The HTTP status code of the response, or None if
+                no response was received.
+        """
+        if attempt >= self.max_attempts or method not in self.retry_methods:
+            return False
+        return status_code is None or status_code in self.retry_status_codes
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Returns the number of seconds to wait before the next attempt.
+
+        Args:
+            attempt: The number of the attempt that failed, starting at 1.
+            retry_after: The value of the Retry-After response header, if any.
+        """
+        if retry_after is not None and self.respect_retry_after:
+            delay = self.parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+
+        delay = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        if self.jitter:
+            delay *= self.rand()
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: str) -> Optional[float]:
+        """Parses a Retry-After header given in seconds or as an HTTP date."""
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return max(0.0, (retry_at - now).total_seconds())
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
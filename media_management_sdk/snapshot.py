@@ -0,0 +1,110 @@
+import concurrent.futures
+import contextvars
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from media_management_sdk.api import API
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class CourseSnapshot(object):
+    """
+    A course together with its collections and the images in each collection,
+    fetched at about the same time.
+    """
+
+    def __init__(
+        self,
+        course: Any,
+        collections: List[Any],
+        images: Dict[Any, List[Any]],
+        timings: Dict[str, Any],
+    ) -> None:
+        """CourseSnapshot constructor.
+
+        Args:
+            course: The course data.
+            collections: The collections in the course.
+            images: The images in each collection, keyed by collection ID.
+            timings: Number of seconds taken by each request ("get_course",
+                "list_collections", and "get_collection_images" keyed by
+                collection ID) and by the whole snapshot ("total").
+        """
+        self.course = course
+        self.collections = collections
+        self.images = images
+        self.timings = timings
+
+    def __repr__(self) -> str:
+        return (
+            f"<CourseSnapshot course={self.course['id']} "
+            f"collections={len(self.collections)} total={self.timings['total']:.3f}s>"
+        )
+
+
+def fetch_course_snapshot(
+    api: API,
+    course_id: int,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timer: Callable[[], float] = time.perf_counter,
+) -> CourseSnapshot:
+    """Fetches a course, its collections and the images in every collection.
+
+    The course and its collections are requested concurrently, followed by
+    the images of all collections at once, so the snapshot takes two rounds
+    of requests instead of one per collection. The API's session is shared by
+    the worker threads, so ``max_workers`` should not exceed its pool size.
+
+    Args:
+        api: The API instance used for the requests.
+        course_id: Course ID.
+        max_workers: Maximum number of concurrent requests. Defaults to 8.
+        timer: Function returning the current time in seconds. Defaults to time.perf_counter.
+
+    Returns:
+        The course snapshot.
+
+    Raises:
+        ApiError: If any request fails.
+    """
+    if max_workers < 1:
+        raise ValueError("Max workers must be at least 1")
+
+    def timed(func: Callable, *args: Any) -> Tuple[Any, float]:
+        started = timer()
+        result = func(*args)
+        return result, timer() - started
+
+    def submit(func: Callable, *args: Any) -> concurrent.futures.Future:
+        # run in a copy of the caller's context so that deadlines apply
+        future = executor.submit(contextvars.copy_context().run, timed, func, *args)
+        futures.append(future)
+        return future
+
+    started = timer()
+    timings: Dict[str, Any] = {}
+    futures: List[concurrent.futures.Future] = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        course_future = submit(api.get_course, course_id)
+        collections_future = submit(api.list_collections, course_id)
+        try:
+            collections, timings["list_collections"] = collections_future.result()
+            image_futures = {
+                collection["id"]: submit(api.get_collection_images, collection["id"])
+                for collection in collections
+            }
+            course, timings["get_course"] = course_future.result()
+            images: Dict[Any, List[Any]] = {}
+            timings["get_collection_images"] = {}
+            for collection_id, future in image_futures.items():
+                images[collection_id], duration = future.result()
+                timings["get_collection_images"][collection_id] = duration
+        except BaseException:
+            # don't wait for requests that have not started
+            for future in futures:
+                future.cancel()
+            raise
+
+    timings["total"] = timer() - started
+    return CourseSnapshot(course, collections, images, timings)
@@ -0,0 +1,152 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class Throttle(object):
+    """
+    Limits the rate and concurrency of API requests.
+
+    The rate is enforced with a token bucket that allows short bursts of up to
+    ``burst`` requests and otherwise spaces requests ``1 / rate`` seconds apart.
+    ``max_in_flight`` caps the number of requests being sent at once.
+
+    A single instance may be shared between API instances, threads and event
+    loops so that they are governed together, whether requests are blocking or
+    async. Use it as a context manager around each request
+    (``with throttle:`` or ``async with throttle:``).
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        timer: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> None:
+        """Throttle constructor.
+
+        Args:
+            rate: Maximum sustained number of requests per second, or None for
+                no rate limit. Defaults to None.
+            burst: Maximum number of requests that may be sent back to back
+                before the rate applies. Defaults to max(1, rate).
+            max_in_flight: Maximum number of concurrent requests, or None for
+                no limit. Defaults to None.
+            timer: Function returning the current time in seconds. Defaults to time.monotonic.
+            sleep: Function used to wait in blocking code. Defaults to time.sleep.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("Rate must be positive")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("Max in flight must be at least 1")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.max_in_flight = max_in_flight
+        self.timer = timer
+        self.sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated_at = timer()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._in_flight_changed = threading.Condition()
+        self._async_waiters: List[
+            Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]
+        ] = []
+
+    def reserve(self) -> float:
+        """Takes a token from the bucket.
+
+        Returns:
+            The number of seconds to wait before the request may be sent.
+        """
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            now = self.timer()
+            elapsed = max(0.0, now - self._updated_at)
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def _try_start(self) -> bool:
+        # must be called holding self._in_flight_changed
+        if self.max_in_flight is not None and self._in_flight >= self.max_in_flight:
+            return False
+        self._in_flight += 1
+        return True
+
+    def acquire(self) -> None:
+        """Blocks until a request may be sent."""
+        if self.max_in_flight is not None:
+            with self._in_flight_changed:
+                while not self._try_start():
+                    self._in_flight_changed.wait()
+        delay = self.reserve()
+        if delay > 0:
+            self.sleep(delay)
+
+    def release(self) -> None:
+        """Ends a request started with acquire() or acquire_async()."""
+        if self.max_in_flight is None:
+            return
+        with self._in_flight_changed:
+            self._in_flight -= 1
+            self._in_flight_changed.notify()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                pass  # the waiter's event loop has been closed
+
+    async def acquire_async(self) -> None:
+        """Waits until a request may be sent, without blocking the event loop.
+
+        In-flight requests are counted together with blocking requests and
+        requests made from other event loops.
+        """
+        if self.max_in_flight is not None:
+            loop = asyncio.get_running_loop()
+            while True:
+                with self._in_flight_changed:
+                    if self._try_start():
+                        break
+                    waiter = loop.create_future()
+                    self._async_waiters.append((loop, waiter))
+                try:
+                    await waiter
+                finally:
+                    with self._in_flight_changed:
+                        if (loop, waiter) in self._async_waiters:
+                            self._async_waiters.remove((loop, waiter))
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def release_async(self) -> None:
+        """Ends a request started with acquire_async()."""
+        self.release()
+
+    def __enter__(self) -> "Throttle":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    async def __aenter__(self) -> "Throttle":
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.release_async()
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,123 @@
+import contextlib
+import contextvars
+import time
+from typing import Dict, Iterator, Mapping, Optional, Tuple, Union
+
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 30
+DEFAULT_LONG_READ_TIMEOUT = 300
+
+_deadline: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar(
+    "media_management_sdk_deadline", default=None
+)
+
+
+class Timeout(object):
+    """
+    Connect and read timeouts, in seconds, for a request.
+
+    The connect timeout bounds establishing the connection, and the read timeout
+    bounds each wait for data from the server. A timeout of None is inherited
+    from the default timeout of the :class:`TimeoutConfig`.
+    """
+
+    def __init__(
+        self, connect: Optional[float] = None, read: Optional[float] = None
+    ) -> None:
+        self.connect = connect
+        self.read = read
+
+    def merge(self, fallback: "Timeout") -> "Timeout":
+        """Returns a timeout with unset values taken from the fallback."""
+        return Timeout(
+            connect=self.connect if self.connect is not None else fallback.connect,
+            read=self.read if self.read is not None else fallback.read,
+        )
+
+    def as_tuple(self) -> Tuple[Optional[float], Optional[float]]:
+        return (self.connect, self.read)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Timeout) and self.as_tuple() == other.as_tuple()
+
+    def __repr__(self) -> str:
+        return f"<Timeout connect={self.connect} read={self.read}>"
+
+
+# Endpoints that routinely take longer than a metadata request.
+DEFAULT_TIMEOUT_OVERRIDES = {
+    "upload_images": Timeout(read=DEFAULT_LONG_READ_TIMEOUT),
+    "copy_course": Timeout(read=DEFAULT_LONG_READ_TIMEOUT),
+}
+
+
+class TimeoutConfig(object):
+    """
+    The timeouts used by :class:`~media_management_sdk.api.API`, with overrides
+    per endpoint.
+    """
+
+    def __init__(
+        self,
+        default: Optional[Union[Timeout, float]] = None,
+        overrides: Optional[Mapping[str, Union[Timeout, float]]] = None,
+    ) -> None:
+        """TimeoutConfig constructor.
+
+        Args:
+            default: Timeout for endpoints without an override. A number sets both
+                the connect and read timeouts. Defaults to a 10s connect and 30s
+                read timeout.
+            overrides: Timeouts keyed by API method name (e.g. "get_image",
+                "upload_images"), merged over DEFAULT_TIMEOUT_OVERRIDES. Defaults to None.
+        """
+        self.default = self._coerce(default if default is not None else Timeout())
+        self.default = self.default.merge(
+            Timeout(connect=DEFAULT_CONNECT_TIMEOUT, read=DEFAULT_READ_TIMEOUT)
+        )
+        self.overrides: Dict[str, Timeout] = dict(DEFAULT_TIMEOUT_OVERRIDES)
+        for name, timeout in (overrides or {}).items():
+            self.overrides[name] = self._coerce(timeout)
+
+    @staticmethod
+    def _coerce(timeout: Union[Timeout, float]) -> Timeout:
+        if isinstance(timeout, Timeout):
+            return timeout
+        return Timeout(connect=timeout, read=timeout)
+
+    def for_endpoint(self, name: Optional[str]) -> Timeout:
+        """Returns the timeout for an API method name."""
+        override = self.overrides.get(name or "")
+        return override.merge(self.default) if override is not None else self.default
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Sets an overall deadline for the API requests made within the block.
+
+    Each attempt's connect and read timeouts are reduced to the time remaining,
+    retries that cannot finish in time are skipped, and requests started after
+    the deadline raise ApiDeadlineExceededError. Nested deadlines can only
+    shorten the time remaining. The deadline applies to the current thread or
+    asyncio task.
+
+    Args:
+        seconds: Number of seconds from now until the deadline.
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_remaining() -> Optional[float]:
+    """Returns the number of seconds until the current deadline, or None if there is none."""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
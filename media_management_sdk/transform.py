@@ -0,0 +1,287 @@
+import concurrent.futures
+import io
+import logging
+import os
+import threading
+from typing import IO, Any, List, Optional, Tuple
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover
+    Image = None  # type: ignore[assignment]
+    ImageOps = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUALITY = 85
+
+# The formats that are re-encoded, with their content type and file extension.
+FORMATS = {
+    "JPEG": ("image/jpeg", ".jpg"),
+    "PNG": ("image/png", ".png"),
+    "WEBP": ("image/webp", ".webp"),
+}
+
+UploadFile = Tuple[str, IO, str]
+
+
+class ImageTransform(object):
+    """
+    Settings for downscaling and recompressing images before they are uploaded.
+    """
+
+    def __init__(
+        self,
+        max_width: Optional[int] = None,
+        max_height: Optional[int] = None,
+        quality: int = DEFAULT_QUALITY,
+        format: Optional[str] = None,
+        strip_exif: bool = True,
+    ) -> None:
+        """ImageTransform constructor.
+
+        Args:
+            max_width: Maximum width in pixels. Larger images are scaled down,
+                keeping their aspect ratio. Defaults to None (no limit).
+            max_height: Maximum height in pixels. Defaults to None (no limit).
+            quality: Encoder quality for JPEG and WebP images, from 1 to 100. Defaults to 85.
+            format: Format to convert images to ("JPEG", "PNG" or "WEBP").
+                Defaults to None (keep the original format).
+            strip_exif: Remove EXIF metadata, such as the camera and GPS position.
+                The EXIF orientation is applied to the pixels first. Defaults to True.
+        """
+        if format is not None:
+            format = format.upper()
+            if format not in FORMATS:
+                raise ValueError(f"Unsupported image format: {format}")
+        if not 1 <= quality <= 100:
+            raise ValueError("Quality must be between 1 and 100")
+        self.max_width = max_width
+        self.max_height = max_height
+        self.quality = quality
+        self.format = format
+        self.strip_exif = strip_exif
+
+    def needs_resize(self, size: Tuple[int, int]) -> bool:
+        width, height = size
+        return (self.max_width is not None and width > self.max_width) or (
+            self.max_height is not None and height > self.max_height
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ImageTransform max={self.max_width}x{self.max_height} "
+            f"quality={self.quality} format={self.format}>"
+        )
+
+
+class TransformResult(object):
+    """
+    A transformed file, or the original file if it could not be made smaller.
+    """
+
+    def __init__(
+        self, file_name: str, content_type: str, data: bytes, original_size: int
+    ) -> None:
+        self.file_name = file_name
+        self.content_type = content_type
+        self.data = data
+        self.original_size = original_size
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_size - self.size
+
+    def __repr__(self) -> str:
+        return f"<TransformResult {self.file_name} {self.original_size} -> {self.size} bytes>"
+
+
+def transform_image(
+    data: bytes, file_name: str, content_type: str, transform: ImageTransform
+) -> TransformResult:
+    """Downscales and recompresses an image.
+
+    Files that are not images in a supported format are returned unchanged, as
+    are images that would only get larger when nothing else requires them to be
+    re-encoded (resizing, a format conversion or EXIF to strip).
+
+    Pillow's decompression bomb limit (``PIL.Image.MAX_IMAGE_PIXELS``) is left
+    in place, since it guards against malicious files. It is high enough for
+    camera originals; images above it are uploaded unchanged.
+
+    Args:
+        data: The contents of the file.
+        file_name: The name of the file.
+        content_type: The MIME type for the file.
+        transform: The transform settings.
+
+    Returns:
+        The transformed file.
+    """
+    original = TransformResult(file_name, content_type, data, len(data))
+    try:
+        image: Image.Image = Image.open(io.BytesIO(data))
+        source_format = image.format
+        target_format = transform.format or source_format
+        if target_format not in FORMATS:
+            return original
+
+        exif = image.info.get("exif")
+        icc_profile = image.info.get("icc_profile")
+        resize = transform.needs_resize(image.size)
+        if transform.strip_exif:
+            image = ImageOps.exif_transpose(image)
+        if resize:
+            image.thumbnail(
+                (
+                    transform.max_width or image.width,
+                    transform.max_height or image.height,
+                ),
+                Image.Resampling.LANCZOS,
+            )
+        if target_format == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        options: dict = {"format": target_format}
+        if target_format in ("JPEG", "WEBP"):
+            options["quality"] = transform.quality
+        if target_format in ("JPEG", "PNG"):
+            options["optimize"] = True
+        if icc_profile:
+            options["icc_profile"] = icc_profile
+        if exif and not transform.strip_exif:
+            options["exif"] = exif
+        output = io.BytesIO()
+        image.save(output, **options)
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        logger.warning("Not transforming %s: %s", file_name, e)
+        return original
+
+    required = resize or target_format != source_format
+    required = required or bool(exif and transform.strip_exif)
+    if not required and output.tell() >= len(data):
+        return original
+
+    content_type, extension = FORMATS[target_format]
+    if target_format != source_format:
+        file_name = os.path.splitext(file_name)[0] + extension
+    return TransformResult(file_name, content_type, output.getvalue(), len(data))
+
+
+class ImageTransformer(object):
+    """
+    Applies an :class:`ImageTransform` to files before they are uploaded, in a
+    pool of worker processes so that the work is spread across CPU cores.
+
+    When files are uploaded from several threads, such as by
+    :class:`~media_management_sdk.bulk.BulkUploader`, the next batches are
+    transformed while earlier batches upload. Each file is read into memory to
+    be sent to a worker. The total bytes saved are kept in :attr:`bytes_saved`.
+
+    Requires the ``Pillow`` package (``pip install media-management-sdk[images]``).
+    """
+
+    def __init__(
+        self,
+        transform: ImageTransform,
+        max_workers: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        """ImageTransformer constructor.
+
+        Args:
+            transform: The transform settings.
+            max_workers: Number of worker processes. Defaults to None (the number of CPUs).
+            executor: An existing executor to run the transforms in. When provided,
+                ``max_workers`` is ignored and the caller remains responsible for
+                shutting it down. Defaults to None.
+        """
+        if Image is None:
+            raise ImportError(
+                "Pillow is required for ImageTransformer: pip install media-management-sdk[images]"
+            )
+        self.transform = transform
+        self.max_workers = max_workers
+        self.files = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        """The executor, with the process pool started on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            return self._executor
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_in - self.bytes_out
+
+    def submit(self, upload_file: UploadFile) -> concurrent.futures.Future:
+        """Starts transforming a file.
+
+        Args:
+            upload_file: File tuple: (filename, file, content_type).
+
+        Returns:
+            A future for the :class:`TransformResult`.
+        """
+        name, fp, content_type = upload_file
+        return self.executor.submit(
+            transform_image, fp.read(), name, content_type, self.transform
+        )
+
+    def record(self, result: TransformResult) -> UploadFile:
+        """Adds a transformed file to the totals.
+
+        Returns:
+            A file tuple for uploading the transformed file.
+        """
+        with self._lock:
+            self.files += 1
+            self.bytes_in += result.original_size
+            self.bytes_out += result.size
+        logger.debug(
+            "Transformed %s from %d to %d bytes",
+            result.file_name,
+            result.original_size,
+            result.size,
+        )
+        return (result.file_name, io.BytesIO(result.data), result.content_type)
+
+    def transform_files(self, upload_files: List[UploadFile]) -> List[UploadFile]:
+        """Transforms files concurrently.
+
+        Args:
+            upload_files: List of file tuples: (filename, file, content_type).
+
+        Returns:
+            File tuples for the transformed files, in the same order.
+        """
+        futures = [self.submit(upload_file) for upload_file in upload_files]
+        return [self.record(future.result()) for future in futures]
+
+    def close(self) -> None:
+        """Shuts down the process pool, unless the executor was passed in."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "ImageTransformer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<ImageTransformer files={self.files} bytes_saved={self.bytes_saved}>"
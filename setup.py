@@ -22,7 +22,13 @@ setup(
     long_description_content_type="text/markdown",
     license="License :: OSI Approved :: BSD License",
     packages=find_packages(),
+    python_requires='>=3.7',
     install_requires=['requests', 'PyJWT>=1.7.1'],
+    extras_require={
+        'async': ['httpx'],
+        'fast-json': ['orjson'],
+        'images': ['Pillow>=9.1'],
+    },
     include_package_data=True,
     classifiers=[
         'Environment :: Web Environment',
@@ -1,8 +1,16 @@
+import io
+import json
+import logging
 from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
 
-from media_management_sdk.api import API, DEFAULT_TIMEOUT
+from media_management_sdk.api import (
+    API,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    LOG_MAX_ITEMS,
+)
 from media_management_sdk.exceptions import (
     ApiError,
     ApiForbiddenError,
@@ -46,11 +54,14 @@ def test_do_request_with_method(http_method, status_code):
 
     mock_resp = Mock()
     mock_resp.status_code = status_code
-    mock_resp.json = Mock(return_value=expected_response)
+    mock_resp.content = json.dumps(expected_response).encode()
 
-    with patch(f"requests.{http_method}", return_value=mock_resp) as mock_method:
-        actual_response = API()._do_request(method=http_method, url=url)
-        mock_method.assert_called_once_with(url, timeout=DEFAULT_TIMEOUT)
+    api = API()
+    with patch.object(api.session, http_method, return_value=mock_resp) as mock_method:
+        actual_response = api._do_request(method=http_method, url=url)
+        mock_method.assert_called_once_with(
+            url, timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_TIMEOUT)
+        )
         assert actual_response == expected_response
 
 
@@ -71,9 +82,41 @@ def test_do_request_raises_exception_for_status(http_method, status_code, error_
     mock_resp.status_code = status_code
     mock_resp.raise_for_status = Mock(side_effect=error_class)
     mock_resp.json = Mock(return_value=None)
-    with patch(f"requests.{http_method}", return_value=mock_resp) as mock_method:
+    api = API()
+    with patch.object(api.session, http_method, return_value=mock_resp) as mock_method:
         with pytest.raises(error_class):
-            API()._do_request(method=http_method, url=expected_url)
+            api._do_request(method=http_method, url=expected_url)
+
+
+def test_do_request_rejects_invalid_method():
+    with pytest.raises(ValueError):
+        API()._do_request(method="patch", url=f"{TEST_BASE_URL}/test/123")
+
+
+def test_session_is_shared_between_requests():
+    mock_resp = Mock()
+    mock_resp.status_code = 200
+    mock_resp.content = b"{}"
+
+    api = API(base_url=TEST_BASE_URL, pool_maxsize=4)
+    adapter = api.session.get_adapter(TEST_BASE_URL)
+    assert adapter._pool_maxsize == 4
+    with patch.object(api.session, "get", return_value=mock_resp) as mock_get:
+        api.get_course(1)
+        api.get_image(2)
+        assert mock_get.call_count == 2
+
+
+def test_close_only_closes_owned_session():
+    api = API()
+    with patch.object(api.session, "close") as mock_close:
+        with api:
+            pass
+        mock_close.assert_called_once_with()
+
+    session = Mock()
+    API(session=session).close()
+    session.close.assert_not_called()
 
 
 
@@ -148,3 +191,47 @@ def test_api_implements_required_methods():
     for method in methods:
         assert hasattr(api, method)
         assert callable(getattr(api, method))
+
+
+def test_request_logging_is_skipped_when_disabled(caplog):
+    caplog.set_level(logging.WARNING, logger="media_management_sdk.api")
+    api = API(TEST_BASE_URL)
+    with patch.object(API, "_summarize_request") as mock_summarize:
+        api._prepare_request("get", f"{TEST_BASE_URL}/courses", {})
+    mock_summarize.assert_not_called()
+    assert caplog.records == []
+
+
+def test_request_logging_is_structured_and_truncated(caplog):
+    caplog.set_level(logging.INFO, logger="media_management_sdk.api")
+    api = API(TEST_BASE_URL)
+    url = f"{TEST_BASE_URL}/collections/9"
+    kwargs = dict(
+        headers={"Authorization": "Bearer secret"},
+        json=dict(course_image_ids=list(range(1000)), title="x" * 1000),
+    )
+    api._prepare_request("put", url, kwargs, "update_collection")
+
+    [record] = caplog.records
+    assert record.getMessage() == f"API request [put {url}]"
+    summary = record.api_request
+    assert summary["endpoint"] == "update_collection"
+    assert "headers" not in summary
+    image_ids = summary["json"]["course_image_ids"]
+    assert image_ids[:LOG_MAX_ITEMS] == list(range(LOG_MAX_ITEMS))
+    assert image_ids[-1] == f"... ({1000 - LOG_MAX_ITEMS} more)"
+    assert summary["json"]["title"].endswith("... (1000 chars)")
+
+
+def test_request_logging_omits_file_contents(caplog):
+    caplog.set_level(logging.INFO, logger="media_management_sdk.api")
+    api = API(TEST_BASE_URL)
+    kwargs = dict(
+        data=dict(title=None),
+        files=[("file", ("a.jpg", io.BytesIO(b"jpeg"), "image/jpeg"))],
+    )
+    api._prepare_request("post", f"{TEST_BASE_URL}/courses/1/images", kwargs)
+
+    summary = caplog.records[0].api_request
+    assert summary["files"] == ["a.jpg"]
+    assert summary["data"] == dict(title=None)
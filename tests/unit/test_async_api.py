@@ -0,0 +1,247 @@
+import asyncio
+import io
+import json
+
+import httpx
+import pytest
+
+from media_management_sdk import AsyncClient
+from media_management_sdk.async_api import AsyncAPI
+from media_management_sdk.exceptions import (
+    ApiBadRequest,
+    ApiError,
+    ApiForbiddenError,
+    ApiHTTPError,
+    ApiNotFoundError,
+)
+from media_management_sdk.retry import RetryPolicy
+
+TEST_BASE_URL = "http://localhost:8000/api"
+TEST_CLIENT_ID = "myapp"
+TEST_CLIENT_SECRET = "07c91feb29b393e9418416aef05b433d9de7f638"
+
+
+def test_endpoint_methods_are_coroutines(make_async_api):
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json=[{"id": 1}])
+
+    async def run():
+        api = make_async_api(handler, access_token="token123")
+        result = await api.list_courses(lti_context_id="abc")
+        await api.session.aclose()
+        return result
+
+    assert asyncio.run(run()) == [{"id": 1}]
+    request = requests_seen[0]
+    assert request.method == "GET"
+    assert request.url.path == "/api/courses"
+    assert dict(request.url.params) == {"lti_context_id": "abc"}
+    assert request.headers["Authorization"] == "Bearer token123"
+
+
+def test_json_body_is_sent(make_async_api):
+    def handler(request):
+        return httpx.Response(201, json=json.loads(request.content))
+
+    async def run():
+        api = make_async_api(handler)
+        return await api.create_collection(1, title="Test")
+
+    assert asyncio.run(run()) == {"title": "Test", "description": None, "course_id": 1}
+
+
+def test_sync_context_manager_is_rejected():
+    api = AsyncAPI(base_url=TEST_BASE_URL)
+    with pytest.raises(TypeError, match="async with"):
+        with api:
+            pass
+
+
+def test_no_content_response(make_async_api):
+    async def run():
+        api = make_async_api(lambda request: httpx.Response(204))
+        return await api.delete_image(1)
+
+    assert asyncio.run(run()) == {}
+
+
+@pytest.mark.parametrize(
+    "status_code,error_class",
+    [
+        (400, ApiBadRequest),
+        (403, ApiForbiddenError),
+        (404, ApiNotFoundError),
+        (500, ApiHTTPError),
+    ],
+)
+def test_errors_are_mapped_like_api(status_code, error_class, make_async_api):
+    async def run():
+        api = make_async_api(
+            lambda request: httpx.Response(status_code, text="error"),
+            retry_policy=None,
+        )
+        await api.get_course(1)
+
+    with pytest.raises(error_class):
+        asyncio.run(run())
+
+
+def test_transport_error_raises_api_error(make_async_api):
+    def handler(request):
+        raise httpx.ConnectError("connection refused")
+
+    async def run():
+        api = make_async_api(handler, retry_policy=None)
+        await api.get_course(1)
+
+    with pytest.raises(ApiError):
+        asyncio.run(run())
+
+
+def test_client_authenticate_authorizes_user():
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"success": True})
+
+    async def run():
+        client = AsyncClient(TEST_CLIENT_ID, TEST_CLIENT_SECRET, TEST_BASE_URL)
+        await client.api.session.aclose()
+        client.api.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        await client.authenticate("user1", course_id=1, course_permission="read")
+        await client.api.close()
+        return client
+
+    client = asyncio.run(run())
+    assert client.api.access_token
+    assert paths == ["/api/auth/authorize-user"]
+
+
+def test_forbidden_request_invalidates_authorization():
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        if request.url.path.startswith("/api/courses"):
+            return httpx.Response(403, text="forbidden")
+        return httpx.Response(200, json={"success": True})
+
+    async def run():
+        client = AsyncClient(
+            TEST_CLIENT_ID,
+            TEST_CLIENT_SECRET,
+            TEST_BASE_URL,
+            session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        await client.authenticate("user1", course_id=1, course_permission="read")
+        with pytest.raises(ApiForbiddenError):
+            await client.api.get_course(1)
+        await client.authenticate("user1", course_id=1, course_permission="read")
+        await client.api.session.aclose()
+
+    asyncio.run(run())
+    assert paths.count("/api/auth/authorize-user") == 2
+
+
+def test_concurrent_users_send_their_own_tokens():
+    tokens = []
+
+    def handler(request):
+        if request.url.path.startswith("/api/courses/2"):
+            return httpx.Response(403, text="forbidden")
+        tokens.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"success": True})
+
+    async def run_as(client, user_id, course_id):
+        api = await client.authenticate(user_id, course_id=course_id)
+        await asyncio.sleep(0)  # let the other user authenticate
+        try:
+            await api.get_course(course_id)
+        except ApiForbiddenError:
+            pass
+        return api.access_token
+
+    async def run():
+        client = AsyncClient(
+            TEST_CLIENT_ID,
+            TEST_CLIENT_SECRET,
+            TEST_BASE_URL,
+            session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        user_tokens = await asyncio.gather(
+            run_as(client, "user1", 1), run_as(client, "user2", 2)
+        )
+        await client.api.session.aclose()
+        return client, user_tokens
+
+    client, (token1, token2) = asyncio.run(run())
+    assert token1 != token2
+    assert tokens.count(f"Bearer {token1}") == 2
+    assert tokens.count(f"Bearer {token2}") == 1, "only authorize-user succeeds"
+    assert ("user1", 1, None) in client.authorizations
+    assert ("user2", 2, None) not in client.authorizations
+
+
+def test_iterator_streams_response(make_async_api):
+    def handler(request):
+        assert request.url.params["q"] == "art"
+        return httpx.Response(200, content=b'[{"id": 1}, {"id": 2}]')
+
+    async def run():
+        api = make_async_api(handler)
+        return [course async for course in api.iter_search_courses("art")]
+
+    assert asyncio.run(run()) == [{"id": 1}, {"id": 2}]
+
+
+def test_iterator_raises_for_status(make_async_api):
+    def handler(request):
+        return httpx.Response(404, text="Not found")
+
+    async def run():
+        api = make_async_api(handler)
+        return [image async for image in api.iter_collection_images(1)]
+
+    with pytest.raises(ApiNotFoundError):
+        asyncio.run(run())
+
+
+def test_json_put_is_retried(make_async_api):
+    attempts = []
+
+    def handler(request):
+        attempts.append(json.loads(request.content))
+        if len(attempts) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"id": 1})
+
+    async def run():
+        api = make_async_api(handler, retry_policy=RetryPolicy(backoff_factor=0))
+        return await api.update_image(1, course_id=2, title="Cat")
+
+    assert asyncio.run(run()) == {"id": 1}
+    assert attempts == [{"course_id": 2, "title": "Cat"}] * 3
+
+
+def test_streamed_upload_is_not_retried(make_async_api):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(503)
+
+    async def run():
+        # uploads are only retried when POST is, and never when streamed
+        policy = RetryPolicy(backoff_factor=0, retry_methods=["post"])
+        api = make_async_api(handler, retry_policy=policy)
+        await api.upload_image(
+            1, io.BytesIO(b"data"), "a.jpg", "image/jpeg", "A", stream=True
+        )
+
+    with pytest.raises(ApiHTTPError):
+        asyncio.run(run())
+    assert len(attempts) == 1
@@ -0,0 +1,267 @@
+import io
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from media_management_sdk.api import API
+from media_management_sdk.bulk import BulkImageUpdater, BulkUploader
+from media_management_sdk.exceptions import (
+    ApiBadRequest,
+    ApiCircuitOpenError,
+    ApiHTTPError,
+)
+from media_management_sdk.retry import RetryPolicy
+
+
+def make_files(count):
+    return [
+        (f"image{i}.png", io.BytesIO(f"data{i}".encode()), "image/png")
+        for i in range(count)
+    ]
+
+
+def fake_upload_images(course_id, upload_files, title=None, stream=False):
+    return [{"id": int(name[5:-4]), "title": name} for (name, fp, ct) in upload_files]
+
+
+def test_upload_splits_files_into_batches():
+    api = API()
+    api.upload_images = Mock(side_effect=fake_upload_images)
+
+    report = BulkUploader(api, batch_size=3, max_workers=2).upload(1, make_files(7))
+
+    assert api.upload_images.call_count == 3
+    batch_sizes = sorted(len(call.args[1]) for call in api.upload_images.call_args_list)
+    assert batch_sizes == [1, 3, 3]
+    assert [image["id"] for image in report.images] == list(range(7))
+    assert report.failed == []
+
+
+def test_upload_retries_only_failed_batches():
+    api = API()
+    lock = threading.Lock()
+    failures = {"image2.png": 1}
+    files = make_files(4)
+
+    def flaky_upload_images(course_id, upload_files, title=None, stream=False):
+        for name, fp, ct in upload_files:
+            fp.read()
+        with lock:
+            if failures.get(upload_files[0][0]):
+                failures[upload_files[0][0]] -= 1
+                raise ApiHTTPError("HTTP error status code: 503")
+        return fake_upload_images(course_id, upload_files, title, stream)
+
+    api.upload_images = Mock(side_effect=flaky_upload_images)
+
+    report = BulkUploader(api, batch_size=2, max_retries=1).upload(1, files)
+
+    assert api.upload_images.call_count == 3
+    assert len(report.succeeded) == 4
+    assert [result.attempts for result in report.results] == [1, 1, 2, 2]
+    assert files[2][1].tell() == len(b"data2"), "file rewound before the retry"
+
+
+def test_upload_retries_wait_for_the_retry_policy():
+    api = API(retry_policy=RetryPolicy(backoff_factor=1, jitter=False))
+    api.upload_images = Mock(
+        side_effect=[ApiHTTPError("HTTP error status code: 503")] * 2
+        + [[{"id": 0, "title": "image0.png"}]]
+    )
+
+    with patch("media_management_sdk.bulk.time.sleep") as sleep:
+        report = BulkUploader(api, max_retries=2).upload(1, make_files(1))
+
+    assert [image["id"] for image in report.images] == [0]
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2]
+
+
+def test_upload_reports_failures_per_file():
+    api = API()
+
+    def failing_upload_images(course_id, upload_files, title=None, stream=False):
+        if upload_files[0][0] == "image0.png":
+            raise ApiBadRequest("invalid image")
+        return fake_upload_images(course_id, upload_files, title, stream)
+
+    api.upload_images = Mock(side_effect=failing_upload_images)
+
+    report = BulkUploader(api, batch_size=2, max_retries=3).upload(1, make_files(3))
+
+    assert api.upload_images.call_count == 2, "bad requests are not retried"
+    assert [result.file_name for result in report.failed] == [
+        "image0.png",
+        "image1.png",
+    ]
+    assert isinstance(report.failed[0].error, ApiBadRequest)
+    assert [image["id"] for image in report.images] == [2]
+
+
+def test_upload_reports_unreadable_files_per_batch():
+    api = API()
+
+    def reading_upload_images(course_id, upload_files, title=None, stream=False):
+        for name, fp, ct in upload_files:
+            fp.read()
+        return fake_upload_images(course_id, upload_files, title, stream)
+
+    api.upload_images = Mock(side_effect=reading_upload_images)
+    files = make_files(4)
+    files[3][1].close()
+
+    report = BulkUploader(api, batch_size=2, max_retries=3).upload(1, files)
+
+    assert api.upload_images.call_count == 2, "unreadable files are not retried"
+    assert [image["id"] for image in report.images] == [0, 1]
+    assert [result.file_name for result in report.failed] == [
+        "image2.png",
+        "image3.png",
+    ]
+    assert isinstance(report.failed[0].error, ValueError)
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError):
+        BulkUploader(API(), batch_size=0)
+
+
+def fake_update_image(image_id, course_id, **changes):
+    return dict(id=image_id, course_id=course_id, **changes)
+
+
+def test_update_skips_no_op_updates():
+    api = API()
+    api.update_image = Mock(side_effect=fake_update_image)
+    current_images = {
+        1: {"id": 1, "title": "Same", "metadata": [{"label": "Artist", "value": "A"}]},
+        2: {"id": 2, "title": "Old", "metadata": []},
+    }
+    updates = [
+        (1, {"title": "Same", "metadata": {"Artist": "A"}}),
+        (2, {"title": "New", "metadata": {}}),
+        (3, {"title": None}),
+        (4, {"description": "Added"}),
+    ]
+
+    report = BulkImageUpdater(api).update(9, updates, current_images=current_images)
+
+    assert [r.image_id for r in report.skipped] == [1, 3]
+    assert [r.image_id for r in report.updated] == [2, 4]
+    api.update_image.assert_any_call(2, 9, title="New")
+    api.update_image.assert_any_call(4, 9, description="Added")
+    assert api.update_image.call_count == 2
+
+
+def test_update_fetches_current_images():
+    api = API()
+    api.get_image = Mock(return_value={"id": 1, "title": "Same"})
+    api.update_image = Mock(side_effect=fake_update_image)
+
+    report = BulkImageUpdater(api).update(
+        9, [(1, {"title": "Same"})], fetch_current=True
+    )
+
+    api.update_image.assert_not_called()
+    assert report.results[0].skipped
+    assert report.results[0].image == {"id": 1, "title": "Same"}
+
+
+def test_update_retries_transient_errors():
+    api = API()
+    failures = {2: 1, 3: 5}
+    lock = threading.Lock()
+
+    def flaky_update_image(image_id, course_id, **changes):
+        with lock:
+            if failures.get(image_id, 0) > 0:
+                failures[image_id] -= 1
+                raise ApiHTTPError("HTTP error status code: 503")
+        return fake_update_image(image_id, course_id, **changes)
+
+    api.update_image = Mock(side_effect=flaky_update_image)
+    updates = ((i, {"title": f"Image {i}"}) for i in range(1, 5))
+
+    report = BulkImageUpdater(api, max_workers=2, max_retries=2).update(9, updates)
+
+    assert [r.image_id for r in report.results] == [1, 2, 3, 4]
+    assert [r.attempts for r in report.results] == [1, 2, 3, 1]
+    assert [r.image_id for r in report.failed] == [3]
+    assert report.results[1].image == {"id": 2, "course_id": 9, "title": "Image 2"}
+
+
+def test_update_retries_wait_for_the_retry_policy():
+    api = API(retry_policy=RetryPolicy(backoff_factor=1, jitter=False))
+    api.update_image = Mock(
+        side_effect=[ApiHTTPError("HTTP error status code: 503")] * 2
+        + [{"id": 1, "title": "New"}]
+    )
+
+    with patch("media_management_sdk.bulk.time.sleep") as sleep:
+        report = BulkImageUpdater(api, max_retries=2).update(9, [(1, {"title": "New"})])
+
+    assert report.results[0].ok
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2]
+
+
+def test_update_does_not_retry_when_circuit_is_open():
+    api = API()
+    api.update_image = Mock(side_effect=ApiCircuitOpenError("circuit open"))
+
+    report = BulkImageUpdater(api, max_retries=2).update(9, [(1, {"title": "New"})])
+
+    assert api.update_image.call_count == 1
+    assert isinstance(report.results[0].error, ApiCircuitOpenError)
+
+
+def test_update_reads_input_lazily():
+    api = API()
+    api.update_image = Mock(side_effect=fake_update_image)
+    consumed = []
+
+    def updates():
+        for i in range(100):
+            consumed.append(i)
+            yield i, {"title": str(i)}
+
+    updater = BulkImageUpdater(api, max_workers=2)
+    original_submit = updater._submit
+
+    def submit(*args):
+        assert len(consumed) - api.update_image.call_count <= 2 * 2 + 1
+        return original_submit(*args)
+
+    updater._submit = submit
+    report = updater.update(9, updates())
+    assert len(report.updated) == 100
+
+
+def test_update_reports_unknown_fields_as_failed():
+    api = API()
+    api.update_image = Mock(side_effect=fake_update_image)
+    updates = [(1, {"title": "a"}), (3, {"titel": "c"}), (4, {"title": "d"})]
+
+    report = BulkImageUpdater(api).update(9, iter(updates))
+
+    assert [r.image_id for r in report.updated] == [1, 4]
+    assert [r.image_id for r in report.failed] == [3]
+    assert isinstance(report.failed[0].error, ValueError)
+    assert api.update_image.call_count == 2
+
+
+def test_update_reports_unexpected_errors_per_image():
+    api = API()
+
+    def update_image(image_id, course_id, **changes):
+        if image_id == 2:
+            raise TypeError("metadata must be a dict")
+        return fake_update_image(image_id, course_id, **changes)
+
+    api.update_image = Mock(side_effect=update_image)
+    updates = [(i, {"title": f"Image {i}"}) for i in range(1, 4)]
+
+    report = BulkImageUpdater(api, max_retries=2).update(9, updates)
+
+    assert [r.image_id for r in report.updated] == [1, 3]
+    assert isinstance(report.results[1].error, TypeError)
+    assert report.results[1].attempts == 1, "unexpected errors are not retried"
@@ -0,0 +1,52 @@
+from media_management_sdk.cache import TTLCache
+
+
+class FakeTimer(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    timer = FakeTimer()
+    cache = TTLCache(ttl=10, timer=timer)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=20)
+
+    timer.now = 9
+    assert cache.get("a") == 1
+    timer.now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert "a" not in cache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_zero_maxsize_disables_caching():
+    cache = TTLCache(maxsize=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_delete_matching():
+    cache = TTLCache()
+    for key in ("course:1", "course:2", "image:1"):
+        cache.set(key, True)
+
+    assert cache.delete_matching(lambda key: key.startswith("course:")) == 2
+    assert "image:1" in cache
+    assert "course:1" not in cache
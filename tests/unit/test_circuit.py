@@ -0,0 +1,157 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from media_management_sdk.api import API
+from media_management_sdk.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from media_management_sdk.exceptions import (
+    ApiCircuitOpenError,
+    ApiDeadlineExceededError,
+    ApiError,
+    ApiNotFoundError,
+)
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+@pytest.fixture
+def timer():
+    return Mock(return_value=0)
+
+
+@pytest.fixture
+def breaker(timer):
+    return CircuitBreaker(
+        failure_threshold=0.5,
+        window_size=4,
+        min_calls=4,
+        recovery_timeout=10,
+        timer=timer,
+    )
+
+
+def test_opens_when_failure_rate_reached(breaker):
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    with pytest.raises(ApiCircuitOpenError):
+        breaker.before_request()
+
+
+def test_half_open_probe_closes_on_success(breaker, timer):
+    for _ in range(4):
+        breaker.record_failure()
+    timer.return_value = 10
+
+    assert breaker.state == HALF_OPEN
+    breaker.before_request()
+    with pytest.raises(ApiCircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.snapshot() == dict(
+        state=CLOSED, failure_rate=0.0, calls=0, retry_in=None
+    )
+
+
+def test_half_open_probe_reopens_on_failure(breaker, timer):
+    for _ in range(4):
+        breaker.record_failure()
+    timer.return_value = 10
+    breaker.before_request()
+    breaker.record_failure()
+
+    assert breaker.snapshot()["state"] == OPEN
+    assert breaker.snapshot()["retry_in"] == 10
+
+
+def test_api_fails_fast_while_open(breaker, make_response):
+    api = API(base_url=TEST_BASE_URL, retry_policy=None, circuit_breaker=breaker)
+    side_effect = [requests.exceptions.ConnectTimeout("timed out")] * 2 + [
+        make_response(503)
+    ] * 2
+    with patch.object(api.session, "get", side_effect=side_effect) as mock_get:
+        for _ in range(4):
+            with pytest.raises(ApiError):
+                api.get_course(1)
+        with pytest.raises(ApiCircuitOpenError):
+            api.get_course(1)
+
+    assert mock_get.call_count == 4
+
+
+def test_client_errors_are_not_failures(breaker, make_response):
+    api = API(base_url=TEST_BASE_URL, circuit_breaker=breaker)
+    with patch.object(api.session, "get", return_value=make_response(404)):
+        for _ in range(5):
+            with pytest.raises(ApiNotFoundError):
+                api.get_course(1)
+
+    assert breaker.state == CLOSED
+    assert breaker.failure_rate == 0
+
+
+def open_breaker(breaker, timer):
+    for _ in range(4):
+        breaker.record_failure()
+    timer.return_value = 10
+    assert breaker.state == HALF_OPEN
+
+
+def test_probe_is_released_after_unrecorded_error(breaker, timer, make_response):
+    open_breaker(breaker, timer)
+    api = API(base_url=TEST_BASE_URL, retry_policy=None, circuit_breaker=breaker)
+    side_effect = [requests.exceptions.InvalidURL("bad url"), make_response(200)]
+    with patch.object(api.session, "get", side_effect=side_effect):
+        with pytest.raises(ApiError):
+            api.get_course(1)
+        assert breaker.state == HALF_OPEN
+        api.get_course(1)  # the probe slot was handed back
+    assert breaker.state == CLOSED
+
+
+def test_deadline_exceeded_does_not_take_probe(breaker, timer, make_response):
+    from media_management_sdk.timeouts import deadline
+
+    open_breaker(breaker, timer)
+    api = API(base_url=TEST_BASE_URL, circuit_breaker=breaker)
+    with patch.object(api.session, "get", return_value=make_response(200)):
+        with deadline(0):
+            with pytest.raises(ApiDeadlineExceededError):
+                api.get_course(1)
+        api.get_course(1)
+    assert breaker.state == CLOSED
+
+
+def test_async_probe_is_released_when_cancelled(breaker, timer, make_async_api):
+    import asyncio
+
+    import httpx
+
+    open_breaker(breaker, timer)
+
+    async def run():
+        in_flight = asyncio.Event()
+
+        async def handler(request):
+            if not in_flight.is_set():
+                in_flight.set()
+                await asyncio.sleep(10)
+            return httpx.Response(200, json={})
+
+        api = make_async_api(handler, circuit_breaker=breaker)
+        task = asyncio.ensure_future(api.get_course(1))
+        await in_flight.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await api.get_course(1)
+        await api.session.aclose()
+
+    asyncio.run(run())
+    assert breaker.state == CLOSED
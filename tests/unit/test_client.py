@@ -0,0 +1,135 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from media_management_sdk import Client
+from media_management_sdk.exceptions import ApiForbiddenError
+from media_management_sdk.jwt import TokenCache
+
+TEST_BASE_URL = "http://localhost:8000/api"
+TEST_CLIENT_ID = "myapp"
+TEST_CLIENT_SECRET = "07c91feb29b393e9418416aef05b433d9de7f638"
+TEST_USER_ID = "x123456x"
+
+
+@pytest.fixture
+def client():
+    client = Client(TEST_CLIENT_ID, TEST_CLIENT_SECRET, TEST_BASE_URL)
+    client.api.authorize_user = Mock(return_value={"success": True})
+    return client
+
+
+def test_authenticate_reuses_cached_token(client):
+    with patch(
+        "media_management_sdk.jwt.create_jwt", return_value="token"
+    ) as mock_create_jwt:
+        client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+        client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+        client.authenticate(TEST_USER_ID, course_id=1, course_permission="write")
+
+    assert mock_create_jwt.call_count == 2
+    assert client.api.access_token == "token"
+
+
+def test_authenticate_returns_api_bound_to_user(client):
+    client.api.session.close = Mock()
+    api1 = client.authenticate("user1")
+    api2 = client.authenticate("user2")
+    api1.close()
+
+    assert api1.access_token != api2.access_token
+    assert client.api.access_token == api2.access_token
+    assert api1.session is client.api.session
+    client.api.session.close.assert_not_called()
+
+
+def test_token_is_refreshed_before_expiration():
+    cache = TokenCache(expires_in=100, refresh_margin=10)
+    cache._cache.timer = Mock(return_value=0)
+    first = cache.get_token(TEST_CLIENT_ID, TEST_CLIENT_SECRET, TEST_USER_ID)
+
+    cache._cache.timer.return_value = 89
+    assert cache.get_token(TEST_CLIENT_ID, TEST_CLIENT_SECRET, TEST_USER_ID) == first
+
+    cache._cache.timer.return_value = 90
+    with patch(
+        "media_management_sdk.jwt.create_jwt", return_value="new"
+    ) as mock_create_jwt:
+        assert (
+            cache.get_token(TEST_CLIENT_ID, TEST_CLIENT_SECRET, TEST_USER_ID) == "new"
+        )
+    mock_create_jwt.assert_called_once()
+
+
+def test_token_cache_rejects_invalid_margin():
+    with pytest.raises(ValueError):
+        TokenCache(expires_in=60, refresh_margin=60)
+
+
+def test_authenticate_requires_user_id(client):
+    with pytest.raises(ValueError):
+        client.authenticate("")
+
+
+def test_authenticate_remembers_authorization(client):
+    client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+    client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+    client.authenticate(TEST_USER_ID, course_id=2, course_permission="read")
+    client.authenticate(TEST_USER_ID)
+
+    assert client.api.authorize_user.call_count == 2
+
+
+def test_authorization_expires(client):
+    client.authorizations.timer = Mock(return_value=0)
+    client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+    client.authorizations.timer.return_value = client.authorizations.ttl
+    client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+
+    assert client.api.authorize_user.call_count == 2
+
+
+def test_invalidate_authorization(client):
+    client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+    client.authenticate("other", course_id=1, course_permission="read")
+    client.invalidate_authorization(course_id=1)
+    client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+
+    assert client.api.authorize_user.call_count == 3
+
+
+def test_forbidden_authorization_is_not_remembered(client):
+    client.api.authorize_user.side_effect = ApiForbiddenError("forbidden")
+    for _ in range(2):
+        with pytest.raises(ApiForbiddenError):
+            client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+
+    assert client.api.authorize_user.call_count == 2
+
+
+def test_any_forbidden_request_invalidates_authorization(client):
+    forbidden = requests.Response()
+    forbidden.status_code = 403
+    forbidden._content = b"forbidden"
+    client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+    client.authenticate("other", course_id=1, course_permission="read")
+    client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+    with patch.object(client.api.session, "get", return_value=forbidden):
+        with pytest.raises(ApiForbiddenError):
+            client.api.get_course(1)
+    client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+    client.authenticate("other", course_id=1, course_permission="read")
+
+    assert client.api.authorize_user.call_count == 3
+
+
+def test_authorization_cache_disabled():
+    client = Client(
+        TEST_CLIENT_ID, TEST_CLIENT_SECRET, TEST_BASE_URL, authorization_ttl=0
+    )
+    client.api.authorize_user = Mock(return_value={"success": True})
+    client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+    client.authenticate(TEST_USER_ID, course_id=1, course_permission="read")
+
+    assert client.api.authorize_user.call_count == 2
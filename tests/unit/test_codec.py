@@ -0,0 +1,106 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from media_management_sdk import codec
+from media_management_sdk.api import API
+from media_management_sdk.codec import (
+    JSONArrayDecoder,
+    JSONCodec,
+    OrjsonCodec,
+    default_codec,
+    iter_json_array,
+)
+from media_management_sdk.exceptions import ApiError
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+@pytest.mark.parametrize("codec_class", [JSONCodec, OrjsonCodec])
+def test_codec_round_trip(codec_class):
+    if codec_class is OrjsonCodec:
+        pytest.importorskip("orjson")
+    data = {"title": "Café", "course_image_ids": [1, 2, 3], "sort_order": None}
+    encoded = codec_class().dumps(data)
+    assert isinstance(encoded, bytes)
+    assert codec_class().loads(encoded) == data
+
+
+def test_default_codec_falls_back_to_stdlib():
+    with patch.object(codec, "orjson", None):
+        assert type(default_codec()) is JSONCodec
+        with pytest.raises(ImportError):
+            OrjsonCodec()
+
+
+def test_json_body_is_encoded_once_with_codec():
+    api_codec = JSONCodec()
+    api_codec.dumps = Mock(wraps=api_codec.dumps)
+    api = API(base_url=TEST_BASE_URL, access_token="token", codec=api_codec)
+    response = Mock(status_code=200, content=b'{"id": 1}')
+    with patch.object(api.session, "put", return_value=response) as mock_put:
+        assert api.update_collection(1, 2, title="Slides") == {"id": 1}
+
+    api_codec.dumps.assert_called_once()
+    kwargs = mock_put.call_args[1]
+    assert "json" not in kwargs
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert api_codec.loads(kwargs["data"])["title"] == "Slides"
+
+
+def test_invalid_response_body_raises_api_error():
+    api = API(base_url=TEST_BASE_URL, codec=JSONCodec())
+    response = Mock(status_code=200, content=b"<html>")
+    with patch.object(api.session, "get", return_value=response):
+        with pytest.raises(ApiError):
+            api.get_course(1)
+
+
+def chunked(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+def test_iter_json_array_decodes_items_across_chunks(chunk_size):
+    items = [{"title": "a,]"}, 123, -1.5e-3, "é", None, True, [], {}]
+    document = json.dumps(items).encode()
+    assert list(iter_json_array(chunked(document, chunk_size))) == items
+
+
+def test_json_array_decoder_returns_items_as_they_complete():
+    decoder = JSONArrayDecoder()
+    assert decoder.feed(b'[{"id": 1}, {"id"') == [{"id": 1}]
+    assert decoder.feed(b": 2}, 3") == [{"id": 2}]
+    assert decoder.feed(b"4]") == [34]
+    assert decoder.close() == []
+
+
+@pytest.mark.parametrize(
+    "document", [b'{"id": 1}', b"[1,", b"[1 2]", b"[1],", b"[1,]", b""]
+)
+def test_iter_json_array_rejects_invalid_documents(document):
+    with pytest.raises(ValueError):
+        list(iter_json_array([document]))
+
+
+def test_api_iterator_streams_response():
+    api = API(base_url=TEST_BASE_URL, access_token="token")
+    response = Mock(status_code=200, links={})
+    response.iter_content = Mock(return_value=chunked(b'[{"id": 1}, {"id": 2}]', 4))
+    with patch.object(api.session, "get", return_value=response) as mock_get:
+        images = api.iter_collection_images(9)
+        mock_get.assert_not_called()
+        assert list(images) == [{"id": 1}, {"id": 2}]
+
+    assert mock_get.call_args[1]["stream"] is True
+    response.close.assert_called_once_with()
+
+
+def test_api_iterator_raises_api_error_for_invalid_response():
+    api = API(base_url=TEST_BASE_URL)
+    response = Mock(status_code=200, links={})
+    response.iter_content = Mock(return_value=[b'{"detail": "oops"}'])
+    with patch.object(api.session, "get", return_value=response):
+        with pytest.raises(ApiError):
+            list(api.iter_courses())
@@ -0,0 +1,146 @@
+import asyncio
+import io
+import json
+from unittest.mock import Mock, patch
+
+import httpx
+
+from media_management_sdk.api import API
+from media_management_sdk.dedup import (
+    MemoryDedupIndex,
+    SQLiteDedupIndex,
+    hash_file,
+)
+from media_management_sdk.models import Image
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+def upload_response(*ids):
+    data = [{"id": i, "title": f"Image {i}"} for i in ids]
+    return Mock(status_code=201, content=json.dumps(data).encode())
+
+
+def test_hash_file_restores_position():
+    fp = io.BytesIO(b"header" + b"x" * 100000)
+    fp.seek(6)
+    digest = hash_file(fp, chunk_size=1024)
+    assert fp.tell() == 6
+    assert digest == hash_file(io.BytesIO(b"x" * 100000))
+
+
+def test_sqlite_index_persists(tmp_path):
+    path = str(tmp_path / "dedup.db")
+    index = SQLiteDedupIndex(path)
+    index.set(1, "abc", {"id": 10, "title": "Cat"})
+    index.set(2, "abc", {"id": 20, "title": "Cat"})
+    index.close()
+
+    index = SQLiteDedupIndex(path)
+    assert index.get("1", "abc") == {"id": 10, "title": "Cat"}
+    index.forget_image(10)
+    assert index.get(1, "abc") is None
+    index.forget_course(2)
+    assert index.get(2, "abc") is None
+
+
+def test_upload_skips_files_already_in_course():
+    api = API(base_url=TEST_BASE_URL, dedup_index=MemoryDedupIndex())
+    with patch.object(
+        api.session, "post", side_effect=[upload_response(1, 2), upload_response(3)]
+    ) as mock_post:
+        first = api.upload_images(
+            1,
+            [
+                ("a.jpg", io.BytesIO(b"a"), "image/jpeg"),
+                ("b.jpg", io.BytesIO(b"b"), "image/jpeg"),
+            ],
+        )
+        second = api.upload_images(
+            1,
+            [
+                ("c.jpg", io.BytesIO(b"c"), "image/jpeg"),
+                ("b2.jpg", io.BytesIO(b"b"), "image/jpeg"),
+                ("c2.jpg", io.BytesIO(b"c"), "image/jpeg"),
+            ],
+        )
+        assert (
+            api.upload_image(1, io.BytesIO(b"a"), "a.jpg", "image/jpeg", "A")[0]["id"]
+            == 1
+        )
+
+    assert [image["id"] for image in first] == [1, 2]
+    assert [image["id"] for image in second] == [3, 2, 3]
+    assert mock_post.call_count == 2
+    files = mock_post.call_args[1]["files"]
+    assert [f[1][0] for f in files] == ["c.jpg"]
+
+
+def test_missing_uploads_keep_their_positions():
+    index = MemoryDedupIndex()
+    index.set(1, hash_file(io.BytesIO(b"a")), {"id": 1, "title": "Image 1"})
+    api = API(base_url=TEST_BASE_URL, dedup_index=index)
+    with patch.object(api.session, "post", return_value=upload_response(2)):
+        images = api.upload_images(
+            1,
+            [
+                ("b.jpg", io.BytesIO(b"b"), "image/jpeg"),
+                ("c.jpg", io.BytesIO(b"c"), "image/jpeg"),
+                ("a.jpg", io.BytesIO(b"a"), "image/jpeg"),
+            ],
+        )
+
+    assert [image and image["id"] for image in images] == [2, None, 1]
+
+
+def test_upload_to_other_course_is_not_skipped():
+    api = API(base_url=TEST_BASE_URL, dedup_index=MemoryDedupIndex())
+    with patch.object(
+        api.session, "post", side_effect=[upload_response(1), upload_response(2)]
+    ) as mock_post:
+        api.upload_image(1, io.BytesIO(b"a"), "a.jpg", "image/jpeg", "A")
+        api.upload_image(2, io.BytesIO(b"a"), "a.jpg", "image/jpeg", "A")
+    assert mock_post.call_count == 2
+
+
+def test_deleted_image_is_uploaded_again():
+    index = MemoryDedupIndex()
+    api = API(base_url=TEST_BASE_URL, dedup_index=index)
+    deleted = Mock(status_code=200, content=b"{}")
+    with patch.object(
+        api.session, "post", side_effect=[upload_response(1), upload_response(2)]
+    ) as mock_post, patch.object(api.session, "delete", return_value=deleted):
+        api.upload_image(1, io.BytesIO(b"a"), "a.jpg", "image/jpeg", "A")
+        api.delete_image(1)
+        assert len(index) == 0
+        api.upload_image(1, io.BytesIO(b"a"), "a.jpg", "image/jpeg", "A")
+    assert mock_post.call_count == 2
+
+
+def test_skipped_files_are_returned_as_models():
+    api = API(
+        base_url=TEST_BASE_URL, dedup_index=MemoryDedupIndex(), return_models=True
+    )
+    with patch.object(api.session, "post", return_value=upload_response(1)):
+        api.upload_image(1, io.BytesIO(b"a"), "a.jpg", "image/jpeg", "A")
+        images = api.upload_image(1, io.BytesIO(b"a"), "a.jpg", "image/jpeg", "A")
+    assert isinstance(images[0], Image)
+    assert images[0].id == 1
+
+
+def test_async_upload_skips_files_already_in_course(make_async_api):
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(201, json=[{"id": len(requests_seen)}])
+
+    async def run():
+        api = make_async_api(handler, dedup_index=MemoryDedupIndex())
+        first = await api.upload_image(1, io.BytesIO(b"a"), "a.jpg", "image/jpeg", "A")
+        second = await api.upload_image(1, io.BytesIO(b"a"), "a.jpg", "image/jpeg", "A")
+        await api.session.aclose()
+        return first, second
+
+    assert asyncio.run(run()) == ([{"id": 1}], [{"id": 1}])
+    assert len(requests_seen) == 1
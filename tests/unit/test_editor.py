@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+import pytest
+
+from media_management_sdk import Client
+from media_management_sdk.api import API
+from media_management_sdk.cache import ObjectCache
+from media_management_sdk.editor import CollectionEditor
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+def test_unchanged_collection_is_not_updated(make_mock_api):
+    api = make_mock_api()
+    editor = CollectionEditor(api, 5)
+    editor.set_images([1, 2, 3])
+    assert editor.commit() is False
+    api.update_collection.assert_not_called()
+    api.get_collection.assert_not_called()
+
+
+def test_edits_are_batched_into_one_update(make_mock_api):
+    api = make_mock_api()
+    with CollectionEditor(api, 5) as editor:
+        editor.add_images([4, 2])
+        editor.remove_images([1])
+        editor.move_image(4, 0)
+        assert editor.images == [4, 2, 3]
+
+    api.get_collection_images.assert_called_once_with(5)
+    api.update_collection.assert_called_once_with(
+        5, course_id=1, title="Week 1", course_image_ids=[4, 2, 3]
+    )
+    assert editor.current == [4, 2, 3]
+
+
+def test_edits_that_cancel_out_are_not_sent(make_mock_api):
+    api = make_mock_api()
+    editor = CollectionEditor(api, 5)
+    editor.add_images([4])
+    editor.remove_images([4])
+    assert not editor.has_changes
+    assert editor.commit() is False
+    api.update_collection.assert_not_called()
+
+
+def test_edits_are_discarded_on_error(make_mock_api):
+    api = make_mock_api()
+    with pytest.raises(RuntimeError):
+        with CollectionEditor(api, 5) as editor:
+            editor.set_images([3, 2, 1])
+            raise RuntimeError("oops")
+    api.update_collection.assert_not_called()
+    assert editor.images == [1, 2, 3]
+
+
+def test_known_state_skips_read(make_mock_api):
+    api = make_mock_api()
+    editor = CollectionEditor(api, 5, course_image_ids=[1, 2])
+    editor.set_images([1, 2])
+    assert editor.commit() is False
+    api.get_collection_images.assert_not_called()
+
+
+def test_client_sync_collection(make_mock_api):
+    client = Client("myapp", "secret", TEST_BASE_URL)
+    client.api = make_mock_api()
+    assert client.sync_collection(5, [1, 2, 3]) is False
+    assert client.sync_collection(5, [3, 1]) is True
+    client.api.update_collection.assert_called_once_with(
+        5, course_id=1, title="Week 1", course_image_ids=[3, 1]
+    )
+
+
+def test_cached_collection_images_are_invalidated_by_update(make_response):
+    api = API(
+        base_url=TEST_BASE_URL,
+        object_cache=ObjectCache(ttls={"get_collection_images": 60}),
+    )
+
+    with patch.object(
+        api.session, "get", return_value=make_response(data=[{"course_image_id": 1}])
+    ) as mock_get, patch.object(api.session, "put", return_value=make_response()):
+        api.get_collection_images(5)
+        api.get_collection_images(5)
+        assert mock_get.call_count == 1
+        api.update_collection(5, course_id=9, title="Week 1", course_image_ids=[1])
+        api.get_collection_images(5)
+        assert mock_get.call_count == 2
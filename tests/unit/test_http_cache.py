@@ -0,0 +1,120 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from media_management_sdk.api import API
+from media_management_sdk.http_cache import (
+    CachedResponse,
+    FileResponseCache,
+    MemoryResponseCache,
+    ResponseCache,
+)
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+def test_conditional_get_returns_cached_body_on_304(make_response):
+    api = API(
+        base_url=TEST_BASE_URL,
+        access_token="token",
+        response_cache=MemoryResponseCache(),
+    )
+    responses = [
+        make_response(200, {"id": 1, "title": "Course"}, {"ETag": '"v1"'}),
+        make_response(304),
+    ]
+    with patch.object(api.session, "get", side_effect=responses) as mock_get:
+        first = api.get_course(1)
+        second = api.get_course(1)
+
+    assert first == second == {"id": 1, "title": "Course"}
+    assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+    assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_changed_response_replaces_cached_body(make_response):
+    api = API(base_url=TEST_BASE_URL, response_cache=MemoryResponseCache())
+    responses = [
+        make_response(200, [1], {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        make_response(200, [1, 2], {"Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"}),
+        make_response(304),
+    ]
+    with patch.object(api.session, "get", side_effect=responses) as mock_get:
+        assert api.get_collection_images(1) == [1]
+        assert api.get_collection_images(1) == [1, 2]
+        assert api.get_collection_images(1) == [1, 2]
+
+    headers = mock_get.call_args_list[2].kwargs["headers"]
+    assert headers["If-Modified-Since"] == "Tue, 02 Jan 2024 00:00:00 GMT"
+
+
+def test_responses_without_validators_are_not_cached(make_response):
+    cache = MemoryResponseCache()
+    api = API(base_url=TEST_BASE_URL, response_cache=cache)
+    with patch.object(api.session, "get", return_value=make_response(200, {"id": 1})):
+        api.get_image(1)
+    assert len(cache) == 0
+
+
+def test_cache_key_depends_on_params_and_authorization():
+    key = ResponseCache.make_key(
+        f"{TEST_BASE_URL}/courses", {"title": "a", "sis_course_id": None}, "Bearer a"
+    )
+    assert key == ResponseCache.make_key(
+        f"{TEST_BASE_URL}/courses", {"title": "a"}, "Bearer a"
+    )
+    assert key != ResponseCache.make_key(
+        f"{TEST_BASE_URL}/courses", {"title": "b"}, "Bearer a"
+    )
+    assert key != ResponseCache.make_key(
+        f"{TEST_BASE_URL}/courses", {"title": "a"}, "Bearer b"
+    )
+
+
+def test_memory_cache_size_limits():
+    cache = MemoryResponseCache(max_entries=2, max_bytes=10)
+    cache.set("a", CachedResponse(b"12345", etag="a"))
+    cache.set("b", CachedResponse(b"12345", etag="b"))
+    cache.set("c", CachedResponse(b"1", etag="c"))
+    assert cache.get("a") is None
+    assert cache.total_bytes == 6
+
+    cache.set("d", CachedResponse(b"x" * 11, etag="d"))
+    assert cache.get("d") is None
+
+
+def test_file_cache_round_trip_and_eviction(tmp_path):
+    cache = FileResponseCache(str(tmp_path), max_bytes=200)
+    cache.set("a", CachedResponse(b"x" * 100, etag='"a"', last_modified="yesterday"))
+
+    cached = FileResponseCache(str(tmp_path)).get("a")
+    assert cached.body == b"x" * 100
+    assert cached.conditional_headers == {
+        "If-None-Match": '"a"',
+        "If-Modified-Since": "yesterday",
+    }
+
+    cache.set("b", CachedResponse(b"y" * 100, etag='"b"'))
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+
+    cache.clear()
+    assert cache.get("b") is None
+
+
+def test_async_conditional_get(make_async_api):
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers)
+        if "If-None-Match" in request.headers:
+            return httpx.Response(304)
+        return httpx.Response(200, json={"id": 1}, headers={"ETag": '"v1"'})
+
+    async def run():
+        api = make_async_api(handler, response_cache=MemoryResponseCache())
+        return [await api.get_collection(1), await api.get_collection(1)]
+
+    assert asyncio.run(run()) == [{"id": 1}, {"id": 1}]
+    assert seen_headers[1]["If-None-Match"] == '"v1"'
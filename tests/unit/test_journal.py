@@ -0,0 +1,123 @@
+import os
+
+from media_management_sdk import Client
+from media_management_sdk.journal import ImportJournal, JournaledImporter
+
+TEST_BASE_URL = "http://localhost:8000/api"
+TEST_CLIENT_ID = "myapp"
+TEST_CLIENT_SECRET = "07c91feb29b393e9418416aef05b433d9de7f638"
+
+
+def make_paths(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"image{i}.png"
+        path.write_bytes(f"data{i}".encode())
+        paths.append(str(path))
+    return paths
+
+
+def test_import_records_each_upload(tmp_path, make_mock_api):
+    paths = make_paths(tmp_path, 5)
+    api = make_mock_api()
+    journal_path = str(tmp_path / "import.jsonl")
+
+    with ImportJournal(journal_path) as journal:
+        report = JournaledImporter(api, journal, batch_size=2).run(1, paths)
+
+    assert len(report.succeeded) == 5
+    assert sorted(api.uploaded) == [f"image{i}.png" for i in range(5)]
+    with ImportJournal(journal_path) as journal:
+        assert len(journal) == 5
+        entry = journal.get(1, paths[3])
+    assert entry["image_id"] == 103
+    assert entry["size"] == 5
+    assert len(entry["sha256"]) == 64
+    assert api.upload_images.call_args_list[0].args[1][0][2] == "image/png"
+
+
+def test_rerun_resumes_after_failure(tmp_path, make_mock_api):
+    paths = make_paths(tmp_path, 6)
+    journal_path = str(tmp_path / "import.jsonl")
+
+    api = make_mock_api(fail_on={"image4.png"})
+    with ImportJournal(journal_path) as journal:
+        report = JournaledImporter(api, journal, batch_size=2, max_workers=1).run(
+            1, paths
+        )
+    assert len(report.failed) == 2
+
+    api = make_mock_api()
+    with ImportJournal(journal_path) as journal:
+        report = JournaledImporter(api, journal, batch_size=2).run(1, paths)
+    assert api.uploaded == ["image4.png", "image5.png"]
+    assert len(report.skipped) == 4
+
+
+def test_missing_files_are_reported_as_failed(tmp_path, make_mock_api):
+    paths = make_paths(tmp_path, 3)
+    journal_path = str(tmp_path / "import.jsonl")
+
+    api = make_mock_api()
+    with ImportJournal(journal_path) as journal:
+        JournaledImporter(api, journal).run(1, paths[:1])
+    os.remove(paths[0])
+    os.remove(paths[1])
+
+    api = make_mock_api()
+    with ImportJournal(journal_path) as journal:
+        report = JournaledImporter(api, journal).run(1, paths)
+
+    assert api.uploaded == ["image2.png"]
+    assert [r.file_name for r in report.results] == [
+        "image0.png",
+        "image1.png",
+        "image2.png",
+    ]
+    assert [r.file_name for r in report.failed] == ["image0.png", "image1.png"]
+    assert isinstance(report.failed[0].error, FileNotFoundError)
+
+
+def test_changed_files_are_uploaded_again(tmp_path, make_mock_api):
+    paths = make_paths(tmp_path, 2)
+    journal_path = str(tmp_path / "import.jsonl")
+    api = make_mock_api()
+    with ImportJournal(journal_path) as journal:
+        JournaledImporter(api, journal).run(1, paths)
+
+    # touched but unchanged: the hash still matches
+    os.utime(paths[0], ns=(0, 0))
+    with open(paths[1], "wb") as f:
+        f.write(b"new data")
+    api = make_mock_api()
+    with ImportJournal(journal_path) as journal:
+        report = JournaledImporter(api, journal).run(1, paths)
+        assert report.skipped == [paths[0]]
+        report = JournaledImporter(api, journal).run(2, paths)
+        assert report.skipped == []
+    assert api.uploaded == ["image1.png", "image0.png", "image1.png"]
+
+
+def test_partial_last_line_is_ignored(tmp_path):
+    journal_path = tmp_path / "import.jsonl"
+    journal_path.write_text(
+        '{"course_id": 1, "path": "/a.png", "image_id": 1}\n{"course_id": 1, "pa'
+    )
+    with ImportJournal(str(journal_path)) as journal:
+        assert len(journal) == 1
+        journal.record([{"course_id": 1, "path": "/b.png", "image_id": 2}])
+    with ImportJournal(str(journal_path)) as journal:
+        assert journal.get(1, "/b.png")["image_id"] == 2
+
+
+def test_client_import_images(tmp_path, make_mock_api):
+    paths = make_paths(tmp_path, 3)
+    client = Client(TEST_CLIENT_ID, TEST_CLIENT_SECRET, TEST_BASE_URL)
+    client.api = make_mock_api()
+    journal_path = str(tmp_path / "import.jsonl")
+
+    report = client.import_images(1, iter(paths), journal_path)
+    assert len(report.succeeded) == 3
+    report = client.import_images(1, iter(paths), journal_path)
+    assert len(report.skipped) == 3
+    assert len(client.api.uploaded) == 3
@@ -0,0 +1,103 @@
+import copy
+from unittest.mock import patch
+
+import pytest
+
+from media_management_sdk.api import API
+from media_management_sdk.cache import ObjectCache
+from media_management_sdk.models import (
+    Collection,
+    Course,
+    Image,
+    ImageMetadata,
+    parse_response,
+)
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+IMAGE = {
+    "id": 7,
+    "url": f"{TEST_BASE_URL}/images/7",
+    "type": "images",
+    "course_id": 1,
+    "title": "Mona Lisa",
+    "metadata": [{"label": "Artist", "value": "Leonardo"}],
+    "thumb_url": "http://example.edu/thumb.jpg",
+    "iiif_custom_field": "kept",
+}
+
+
+def test_models_use_slots():
+    image = Image.from_dict(IMAGE)
+    assert not hasattr(image, "__dict__")
+    with pytest.raises(AttributeError):
+        image.not_a_field = 1
+
+
+def test_nested_fields_are_parsed_on_first_access():
+    image = Image.from_dict(IMAGE)
+    assert isinstance(image._metadata, list)
+    assert image.metadata == (ImageMetadata(label="Artist", value="Leonardo"),)
+    assert image.metadata[0] is image.metadata[0]
+
+
+def test_undeclared_fields_are_kept():
+    image = Image.from_dict(IMAGE)
+    assert image.extra == {"iiif_custom_field": "kept"}
+    assert image.iiif_custom_field == "kept"
+    assert image["iiif_custom_field"] == "kept"
+    with pytest.raises(AttributeError):
+        image.missing
+
+
+def test_item_access_and_to_dict():
+    image = Image.from_dict(IMAGE)
+    assert image["title"] == "Mona Lisa"
+    assert image.get("missing", "default") == "default"
+    assert "thumb_url" in image
+    with pytest.raises(KeyError):
+        image["missing"]
+    data = image.to_dict()
+    assert {k: data[k] for k in IMAGE} == IMAGE
+    assert Image.from_dict(data) == image
+    assert copy.deepcopy(image) == image
+
+
+def test_parse_response_maps_endpoint_to_model():
+    courses = parse_response("list_courses", [{"id": 1}, {"id": 2}])
+    assert [type(course) for course in courses] == [Course, Course]
+    assert isinstance(parse_response("get_collection", {"id": 3}), Collection)
+    assert parse_response("delete_image", {}) == {}
+    assert parse_response("authorize_user", {"success": True}) == {"success": True}
+
+
+def test_api_returns_models_when_enabled(make_response):
+    api = API(base_url=TEST_BASE_URL, return_models=True)
+    with patch.object(api.session, "get", return_value=make_response(data=IMAGE)):
+        image = api.get_image(7)
+    assert isinstance(image, Image)
+    assert image.metadata[0].value == "Leonardo"
+
+    api = API(base_url=TEST_BASE_URL)
+    with patch.object(api.session, "get", return_value=make_response(data=IMAGE)):
+        assert api.get_image(7) == IMAGE
+
+
+def test_cached_reads_are_returned_as_models(make_response):
+    api = API(base_url=TEST_BASE_URL, return_models=True, object_cache=ObjectCache())
+    with patch.object(
+        api.session, "get", return_value=make_response(data=IMAGE)
+    ) as get:
+        first = api.get_image(7)
+        second = api.get_image(7)
+    assert get.call_count == 1
+    assert isinstance(second, Image) and second == first
+
+
+def test_iterators_yield_models(make_response):
+    api = API(base_url=TEST_BASE_URL, return_models=True)
+    response = make_response(data=[IMAGE, IMAGE])
+    with patch.object(api.session, "get", return_value=response):
+        images = list(api.iter_collection_images(3))
+    assert [image.id for image in images] == [7, 7]
+    assert all(isinstance(image, Image) for image in images)
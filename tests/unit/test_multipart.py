@@ -0,0 +1,123 @@
+import asyncio
+import email.parser
+import io
+from unittest.mock import Mock
+
+import httpx
+import requests
+
+from media_management_sdk.api import API
+from media_management_sdk.multipart import MultipartEncoder
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+class UnseekableIO(io.BytesIO):
+    def seekable(self):
+        return False
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation("seek")
+
+    def tell(self):
+        raise io.UnsupportedOperation("tell")
+
+
+def parse_multipart(content_type, body):
+    message = email.parser.BytesParser().parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    return [
+        (
+            part.get_param("name", header="content-disposition"),
+            part.get_filename(),
+            part.get_payload(decode=True),
+        )
+        for part in message.get_payload()
+    ]
+
+
+def test_encoder_produces_multipart_body():
+    files = [
+        ("file", ("a.png", io.BytesIO(b"a" * 1000), "image/png")),
+        ("file", ('b"c.png', io.BytesIO(b"b" * 10), "image/png")),
+    ]
+    encoder = MultipartEncoder(
+        fields={"title": "Test", "skip": None}, files=files, chunk_size=64
+    )
+    body = encoder.read()
+
+    assert encoder.len == len(body)
+    assert parse_multipart(encoder.content_type, body) == [
+        ("title", None, b"Test"),
+        ("file", "a.png", b"a" * 1000),
+        ("file", "b%22c.png", b"b" * 10),
+    ]
+
+
+def test_encoder_reads_files_in_bounded_chunks():
+    fp = io.BytesIO(b"x" * 10000)
+    fp.read = Mock(side_effect=fp.read)
+    encoder = MultipartEncoder(
+        files=[("file", ("x.bin", fp, "application/octet-stream"))], chunk_size=100
+    )
+
+    chunks = list(encoder)
+
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert all(0 < call.args[0] <= 100 for call in fp.read.call_args_list)
+    assert sum(len(chunk) for chunk in chunks) == encoder.len
+
+
+def test_encoder_length_unknown_for_unseekable_files():
+    encoder = MultipartEncoder(
+        files=[("file", ("x.bin", UnseekableIO(b"data"), "application/octet-stream"))]
+    )
+    assert encoder.len is None
+    assert b"data" in encoder.read()
+
+
+def test_requests_streams_encoder_body():
+    encoder = MultipartEncoder(
+        files=[("file", ("x.bin", io.BytesIO(b"data"), "application/octet-stream"))]
+    )
+    request = requests.Request("POST", TEST_BASE_URL, data=encoder).prepare()
+    assert request.body is encoder
+    assert request.headers["Content-Length"] == str(encoder.len)
+
+
+def test_upload_images_with_stream():
+    api = API(base_url=TEST_BASE_URL, access_token="token123")
+    api._do_request = Mock(return_value=[{"id": 1}])
+
+    api.upload_image(
+        1, io.BytesIO(b"data"), "a.png", "image/png", title="A", stream=True
+    )
+
+    kwargs = api._do_request.call_args.kwargs
+    encoder = kwargs["data"]
+    assert isinstance(encoder, MultipartEncoder)
+    assert "files" not in kwargs
+    assert kwargs["headers"] == {
+        "Authorization": "Bearer token123",
+        "Content-Type": encoder.content_type,
+    }
+
+
+def test_async_upload_images_with_stream(make_async_api):
+    received = {}
+
+    def handler(request):
+        received["body"] = request.read()
+        received["headers"] = request.headers
+        return httpx.Response(201, json=[{"id": 1}])
+
+    async def run():
+        api = make_async_api(handler)
+        files = [("a.png", io.BytesIO(b"data"), "image/png")]
+        return await api.upload_images(1, files, title="A", stream=True)
+
+    assert asyncio.run(run()) == [{"id": 1}]
+    assert int(received["headers"]["Content-Length"]) == len(received["body"])
+    parts = parse_multipart(received["headers"]["Content-Type"], received["body"])
+    assert parts == [("title", None, b"A"), ("file", "a.png", b"data")]
@@ -0,0 +1,124 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from media_management_sdk import Client
+from media_management_sdk.api import API
+from media_management_sdk.cache import ObjectCache
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+@pytest.fixture
+def api():
+    return API(base_url=TEST_BASE_URL, access_token="token", object_cache=ObjectCache())
+
+
+@pytest.mark.parametrize(
+    "method,url,expected",
+    [
+        ("get", f"{TEST_BASE_URL}/courses", ("list_courses", {})),
+        ("get", f"{TEST_BASE_URL}/courses/search", ("search_courses", {})),
+        ("get", f"{TEST_BASE_URL}/courses/1", ("get_course", {"course_id": "1"})),
+        ("put", f"{TEST_BASE_URL}/courses/1", ("update_course", {"course_id": "1"})),
+        (
+            "get",
+            f"{TEST_BASE_URL}/collections/2/images",
+            ("get_collection_images", {"collection_id": "2"}),
+        ),
+        (
+            "post",
+            f"{TEST_BASE_URL}/courses/1/images",
+            ("upload_images", {"course_id": "1"}),
+        ),
+        ("get", "http://elsewhere/courses/1", (None, {})),
+        ("post", f"{TEST_BASE_URL}/images/1", (None, {})),
+    ],
+)
+def test_resolve_endpoint(api, method, url, expected):
+    assert api._resolve_endpoint(method, url) == expected
+
+
+def test_reads_are_cached(api, make_response):
+    with patch.object(
+        api.session, "get", return_value=make_response(data={"id": 1, "title": "A"})
+    ) as mock_get:
+        first = api.get_course(1)
+        first["title"] = "changed by caller"
+        second = api.get_course(1)
+        api.get_course(2)
+
+    assert second == {"id": 1, "title": "A"}
+    assert mock_get.call_count == 2
+
+
+def test_reads_are_cached_per_user(api, make_response):
+    with patch.object(
+        api.session, "get", return_value=make_response(data={"id": 1})
+    ) as mock_get:
+        api.get_image(1)
+        api.access_token = "other"
+        api.get_image(1)
+
+    assert mock_get.call_count == 2
+
+
+def test_uncached_endpoints_always_request(api, make_response):
+    with patch.object(
+        api.session, "get", return_value=make_response(data=[])
+    ) as mock_get:
+        api.get_collection_images(1)
+        api.get_collection_images(1)
+
+    assert mock_get.call_count == 2
+
+
+def test_entries_expire(make_response):
+    timer = Mock(return_value=0)
+    api = API(
+        base_url=TEST_BASE_URL,
+        object_cache=ObjectCache(ttls={"get_collection": 10}, timer=timer),
+    )
+    with patch.object(
+        api.session, "get", return_value=make_response(data={"id": 1})
+    ) as mock_get:
+        api.get_collection(1)
+        timer.return_value = 9
+        api.get_collection(1)
+        timer.return_value = 10
+        api.get_collection(1)
+
+    assert mock_get.call_count == 2
+
+
+def test_writes_invalidate_cached_reads(api, make_response):
+    with patch.object(
+        api.session, "get", return_value=make_response(data={"id": 1})
+    ) as mock_get, patch.object(
+        api.session, "put", return_value=make_response(data={"id": 1})
+    ):
+        api.get_course(1)
+        api.list_collections(1)
+        api.get_collection(5)
+        api.get_image(7)
+        api.update_collection(5, course_id=1, title="Updated")
+        api.get_course(1)
+        api.list_collections(1)
+        api.get_collection(5)
+        api.get_image(7)
+
+    requested = [call.args[0] for call in mock_get.call_args_list]
+    assert requested == [
+        f"{TEST_BASE_URL}/courses/1",
+        f"{TEST_BASE_URL}/courses/1/collections",
+        f"{TEST_BASE_URL}/collections/5",
+        f"{TEST_BASE_URL}/images/7",
+        f"{TEST_BASE_URL}/courses/1/collections",
+        f"{TEST_BASE_URL}/collections/5",
+    ]
+
+
+def test_client_passes_api_options():
+    cache = ObjectCache()
+    client = Client("myapp", "secret", TEST_BASE_URL, object_cache=cache)
+    assert client.api.object_cache is cache
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from media_management_sdk.api import API
+from media_management_sdk.codec import JSONPageDecoder
+from media_management_sdk.exceptions import ApiError
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+def paginated(items, next_url=None):
+    return {"count": 5, "next": next_url, "previous": None, "results": items}
+
+
+def test_page_decoder_handles_paginated_objects():
+    decoder = JSONPageDecoder()
+    assert decoder.feed(b'  {"results": [1, 2],') == []
+    assert decoder.feed(b' "next": "/courses?page=2"}') == []
+    assert decoder.close() == [1, 2]
+    assert decoder.next_url == "/courses?page=2"
+
+
+def test_page_decoder_rejects_objects_without_results():
+    decoder = JSONPageDecoder()
+    decoder.feed(b'{"detail": "oops"}')
+    with pytest.raises(ValueError):
+        decoder.close()
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_iterator_follows_next_links(prefetch, make_response):
+    pages = {
+        f"{TEST_BASE_URL}/courses": paginated(
+            [{"id": 1}, {"id": 2}], f"{TEST_BASE_URL}/courses?title=x&page=2"
+        ),
+        f"{TEST_BASE_URL}/courses?title=x&page=2": paginated(
+            [{"id": 3}], "/api/courses?title=x&page=3"
+        ),
+        f"{TEST_BASE_URL}/courses?title=x&page=3": paginated([{"id": 4}]),
+    }
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append((url, kwargs.get("params")))
+        return make_response(data=pages[url])
+
+    api = API(base_url=TEST_BASE_URL)
+    with patch.object(api.session, "get", side_effect=fake_get):
+        courses = list(api.iter_courses(title="x", prefetch=prefetch))
+
+    assert courses == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+    assert [url for (url, _) in calls] == list(pages)
+    assert calls[0][1]["title"] == "x"
+    assert calls[1][1] is None
+
+
+def test_iterator_follows_link_headers(make_response):
+    responses = [
+        make_response(
+            data=[{"id": 1}],
+            headers={
+                "Link": f'<{TEST_BASE_URL}/collections/1/images?offset=1>; rel="next"'
+            },
+        ),
+        make_response(data=[{"id": 2}]),
+    ]
+    api = API(base_url=TEST_BASE_URL)
+    with patch.object(api.session, "get", side_effect=responses) as mock_get:
+        assert list(api.iter_collection_images(1)) == [{"id": 1}, {"id": 2}]
+    assert mock_get.call_args[0][0].endswith("/collections/1/images?offset=1")
+
+
+def test_prefetch_requests_next_page_while_current_page_is_consumed(make_response):
+    second_page_requested = threading.Event()
+
+    def fake_get(url, **kwargs):
+        if url.endswith("page=2"):
+            second_page_requested.set()
+            return make_response(data=paginated([{"id": 2}]))
+        return make_response(data=paginated([{"id": 1}], f"{url}?page=2"))
+
+    api = API(base_url=TEST_BASE_URL)
+    with patch.object(api.session, "get", side_effect=fake_get):
+        courses = api.iter_search_courses("art", prefetch=True)
+        assert next(courses) == {"id": 1}
+        assert second_page_requested.wait(timeout=5)
+        assert list(courses) == [{"id": 2}]
+
+
+def test_prefetched_page_errors_are_raised(make_response):
+    api = API(base_url=TEST_BASE_URL)
+    with patch.object(
+        api.session, "get", return_value=make_response(data={"detail": "oops"})
+    ):
+        with pytest.raises(ApiError):
+            list(api.iter_courses(prefetch=True))
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_async_iterator_follows_next_links(prefetch, make_async_api):
+    def handler(request):
+        if request.url.params.get("page") == "2":
+            return httpx.Response(200, json=paginated([{"id": 2}]))
+        assert request.url.params["q"] == "art"
+        return httpx.Response(
+            200, json=paginated([{"id": 1}], f"{TEST_BASE_URL}/courses/search?page=2")
+        )
+
+    async def run():
+        api = make_async_api(handler)
+        return [
+            course async for course in api.iter_search_courses("art", prefetch=prefetch)
+        ]
+
+    assert asyncio.run(run()) == [{"id": 1}, {"id": 2}]
@@ -0,0 +1,110 @@
+import io
+import threading
+
+import pytest
+
+from media_management_sdk import Client
+from media_management_sdk.pipeline import UploadPipeline
+from media_management_sdk.timeouts import deadline, time_remaining
+
+TEST_BASE_URL = "http://localhost:8000/api"
+TEST_CLIENT_ID = "myapp"
+TEST_CLIENT_SECRET = "07c91feb29b393e9418416aef05b433d9de7f638"
+
+
+def make_items(count):
+    return [
+        (
+            (f"image{i}.png", io.BytesIO(f"data{i}".encode()), "image/png"),
+            {"title": f"image{i}.png", "description": f"Slide {i}"},
+        )
+        for i in range(count)
+    ]
+
+
+def test_pipeline_uploads_updates_and_adds_to_collection(make_mock_api):
+    api = make_mock_api(course_image_ids=[7])
+    report = UploadPipeline(api, batch_size=2).run(1, make_items(5), collection_id=5)
+
+    assert len(report.uploads.succeeded) == 5
+    assert len(report.updates.updated) == 5
+    # the title was set by the upload, so only the description is sent
+    api.update_image.assert_any_call(103, 1, description="Slide 3")
+    api.update_collection.assert_called_once_with(
+        5, course_id=1, title="Week 1", course_image_ids=[7, 100, 101, 102, 103, 104]
+    )
+    assert report.collection_updated
+
+
+def test_updates_overlap_later_uploads(make_mock_api):
+    api = make_mock_api(course_image_ids=[7])
+    first_update = threading.Event()
+    upload_images = api.upload_images.side_effect
+
+    def upload_after_first_update(course_id, upload_files, **kwargs):
+        if upload_files[0][0] != "image0.png":
+            # only passes if the first batch's updates run during the upload
+            assert first_update.wait(timeout=5)
+        return upload_images(course_id, upload_files, **kwargs)
+
+    def update_image(image_id, course_id, **changes):
+        first_update.set()
+        return dict(changes, id=image_id)
+
+    api.upload_images.side_effect = upload_after_first_update
+    api.update_image.side_effect = update_image
+    pipeline = UploadPipeline(api, batch_size=1, max_workers=1)
+    report = pipeline.run(1, make_items(2))
+
+    assert len(report.updates.updated) == 2
+    api.update_collection.assert_not_called()
+
+
+def test_failed_uploads_are_not_updated(make_mock_api):
+    api = make_mock_api(course_image_ids=[7], fail_on={"image1.png"})
+    report = UploadPipeline(api, batch_size=1).run(1, make_items(3), collection_id=5)
+
+    assert [r.file_name for r in report.uploads.failed] == ["image1.png"]
+    assert sorted(r.image_id for r in report.updates.results) == [100, 102]
+    assert api.update_collection.call_args[1]["course_image_ids"] == [7, 100, 102]
+
+
+def test_invalid_changes_are_rejected_before_uploading(make_mock_api):
+    api = make_mock_api(course_image_ids=[7])
+    items = make_items(3)
+    items[2] = (items[2][0], {"course_id": 2})
+
+    with pytest.raises(ValueError):
+        UploadPipeline(api).run(1, items, collection_id=5)
+    api.upload_images.assert_not_called()
+
+
+def test_deadline_applies_to_uploads_and_updates(make_mock_api):
+    api = make_mock_api(course_image_ids=[7])
+    remaining = []
+    upload_images = api.upload_images.side_effect
+    update_image = api.update_image.side_effect
+
+    def upload_with_deadline(*args, **kwargs):
+        remaining.append(time_remaining())
+        return upload_images(*args, **kwargs)
+
+    def update_with_deadline(*args, **kwargs):
+        remaining.append(time_remaining())
+        return update_image(*args, **kwargs)
+
+    api.upload_images.side_effect = upload_with_deadline
+    api.update_image.side_effect = update_with_deadline
+    with deadline(30):
+        UploadPipeline(api, batch_size=1).run(1, make_items(2))
+
+    assert len(remaining) == 4
+    assert None not in remaining
+
+
+def test_client_upload_and_annotate(make_mock_api):
+    client = Client(TEST_CLIENT_ID, TEST_CLIENT_SECRET, TEST_BASE_URL)
+    client.api = make_mock_api(course_image_ids=[7])
+    report = client.upload_and_annotate(1, make_items(2), collection_id=5)
+    assert report.collection_updated
+    assert client.api.update_image.call_count == 2
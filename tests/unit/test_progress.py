@@ -0,0 +1,161 @@
+import asyncio
+import io
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from media_management_sdk.api import API
+from media_management_sdk.multipart import MultipartEncoder
+from media_management_sdk.progress import (
+    ProgressMultipartEncoder,
+    ProgressTracker,
+    UploadProgress,
+)
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+class FakeTimer(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_tracker_reports_throughput_and_eta():
+    timer = FakeTimer()
+    snapshots = []
+    tracker = ProgressTracker(
+        snapshots.append, 1000, [("a.jpg", 1000)], min_interval=1, timer=timer
+    )
+    for now, size in [(0.0, 100), (0.5, 100)]:
+        timer.now = now
+        tracker.file_read(0, size)
+        tracker.body_read(size)
+    assert snapshots == []  # rate limited
+
+    timer.now = 2.0
+    tracker.file_read(0, 200)
+    tracker.body_read(200)
+    progress = snapshots[-1]
+    assert progress.bytes_sent == 400
+    assert progress.file_bytes_sent == 400
+    assert progress.throughput == 200
+    assert progress.average_throughput == 200
+    assert progress.eta == 3.0
+    assert progress.fraction == 0.4
+
+    timer.now = 4.0
+    tracker.file_read(0, 600)
+    tracker.body_read(600)
+    tracker.body_read(0)
+    assert len(snapshots) == 2
+    assert snapshots[-1].done
+    assert snapshots[-1].eta == 0.0
+    assert snapshots[-1].throughput == 300
+
+
+def test_tracker_without_total_has_no_eta():
+    progress = UploadProgress(None, 0, 0, None, 100, None, 1.0, 100.0)
+    assert progress.eta is None
+    assert progress.fraction is None
+
+
+def test_encoder_reports_progress_per_file():
+    snapshots = []
+    files = [
+        ("file", ("a.jpg", io.BytesIO(b"a" * 1000), "image/jpeg")),
+        ("file", ("b.jpg", io.BytesIO(b"b" * 3000), "image/jpeg")),
+    ]
+    encoder = ProgressMultipartEncoder(
+        snapshots.append, fields={"title": "T"}, files=files, chunk_size=512
+    )
+    body = b"".join(iter(lambda: encoder.read(256), b""))
+
+    assert len(body) == encoder.len
+    final = snapshots[-1]
+    assert final.done
+    assert final.bytes_sent == encoder.len
+    assert (final.file_name, final.file_bytes_sent, final.file_size) == (
+        "b.jpg",
+        3000,
+        3000,
+    )
+    # a snapshot is reported when the first file has been read
+    assert any(s.file_name == "a.jpg" and s.file_bytes_sent == 1000 for s in snapshots)
+    assert sum(1 for s in snapshots if s.done) == 1
+
+
+def test_encoder_body_is_unchanged():
+    def make_files():
+        return [("file", ("a.jpg", io.BytesIO(b"data" * 100), "image/jpeg"))]
+
+    plain = MultipartEncoder(fields={"title": "T"}, files=make_files(), boundary="x")
+    tracked = ProgressMultipartEncoder(
+        Mock(), fields={"title": "T"}, files=make_files(), boundary="x"
+    )
+    assert tracked.read() == plain.read()
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_upload_reports_progress(stream):
+    api = API(base_url=TEST_BASE_URL)
+    snapshots = []
+    bodies = []
+
+    def post(url, data=None, **kwargs):
+        bodies.append(data)
+        data.read()
+        return Mock(status_code=201, content=json.dumps([{"id": 1}]).encode())
+
+    with patch.object(api.session, "post", side_effect=post):
+        api.upload_image(
+            1,
+            io.BytesIO(b"x" * 5000),
+            "a.jpg",
+            "image/jpeg",
+            "A",
+            stream=stream,
+            progress=snapshots.append,
+        )
+
+    assert isinstance(bodies[0], ProgressMultipartEncoder)
+    assert snapshots[-1].done
+    assert snapshots[-1].file_bytes_sent == 5000
+
+
+def test_upload_without_callback_uses_plain_encoder():
+    api = API(base_url=TEST_BASE_URL)
+    response = Mock(status_code=201, content=b"[]")
+    with patch.object(api.session, "post", return_value=response) as mock_post:
+        api.upload_image(1, io.BytesIO(b"x"), "a.jpg", "image/jpeg", "A", stream=True)
+    assert type(mock_post.call_args[1]["data"]) is MultipartEncoder
+
+
+def test_async_upload_reports_progress(make_async_api):
+    httpx = pytest.importorskip("httpx")
+
+    snapshots = []
+
+    async def handler(request):
+        body = await request.aread()
+        return httpx.Response(201, json=[{"id": len(body)}])
+
+    async def run():
+        api = make_async_api(handler)
+        images = await api.upload_image(
+            1,
+            io.BytesIO(b"x" * 5000),
+            "a.jpg",
+            "image/jpeg",
+            "A",
+            progress=snapshots.append,
+        )
+        await api.session.aclose()
+        return images
+
+    images = asyncio.run(run())
+    assert snapshots[-1].done
+    assert snapshots[-1].bytes_sent == images[0]["id"]
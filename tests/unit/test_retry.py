@@ -0,0 +1,117 @@
+import asyncio
+import io
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+import requests
+
+from media_management_sdk.api import API
+from media_management_sdk.exceptions import ApiError, ApiHTTPError
+from media_management_sdk.retry import RetryPolicy
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+@pytest.fixture
+def sleep():
+    with patch("time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+def test_get_delay_grows_exponentially():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.get_delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_get_delay_with_jitter():
+    policy = RetryPolicy(backoff_factor=1, rand=lambda: 0.25)
+    assert policy.get_delay(3) == 1
+
+
+def test_get_delay_respects_retry_after():
+    policy = RetryPolicy(max_backoff=10)
+    assert policy.get_delay(1, "3") == 3
+    assert policy.get_delay(1, "120") == 10
+    assert policy.get_delay(1, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert RetryPolicy(jitter=False, respect_retry_after=False).get_delay(1, "3") == 0.5
+
+
+def test_should_retry():
+    policy = RetryPolicy(max_attempts=2)
+    assert policy.should_retry("get", 1, 503)
+    assert policy.should_retry("delete", 1)
+    assert not policy.should_retry("get", 1, 404)
+    assert not policy.should_retry("post", 1, 503)
+    assert not policy.should_retry("get", 2, 503)
+
+
+def test_transient_errors_are_retried(sleep, make_response):
+    api = API(base_url=TEST_BASE_URL, retry_policy=RetryPolicy(max_attempts=3))
+    responses = [
+        requests.exceptions.ConnectionError("connection reset"),
+        make_response(503, headers={"Retry-After": "2"}),
+        make_response(200, content=b'{"id": 1}'),
+    ]
+    with patch.object(api.session, "get", side_effect=responses) as mock_get:
+        assert api.get_course(1) == {"id": 1}
+
+    assert mock_get.call_count == 3
+    assert sleep.call_args_list[1].args == (2,)
+
+
+def test_retries_are_exhausted(sleep, make_response):
+    api = API(base_url=TEST_BASE_URL, retry_policy=RetryPolicy(max_attempts=2))
+    with patch.object(api.session, "get", return_value=make_response(500)) as mock_get:
+        with pytest.raises(ApiHTTPError):
+            api.get_course(1)
+
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda api: api.get_course(1),
+        lambda api: api.create_collection(1, title="Test"),
+        lambda api: api.upload_image(1, io.BytesIO(b"data"), "a.png", "image/png", "A"),
+    ],
+)
+def test_non_retryable_requests(sleep, call, make_response):
+    api = API(base_url=TEST_BASE_URL)
+    for method in ("get", "post"):
+        setattr(
+            api.session,
+            method,
+            Mock(return_value=make_response(404 if method == "get" else 503)),
+        )
+
+    with pytest.raises(ApiHTTPError):
+        call(api)
+
+    assert api.session.get.call_count + api.session.post.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_non_transient_request_errors_are_not_retried(sleep):
+    api = API(base_url=TEST_BASE_URL)
+    with patch.object(
+        api.session, "get", side_effect=requests.exceptions.InvalidURL("bad")
+    ) as mock_get:
+        with pytest.raises(ApiError):
+            api.get_course(1)
+
+    assert mock_get.call_count == 1
+
+
+def test_async_transient_errors_are_retried(make_async_api):
+    responses = [httpx.Response(502), httpx.Response(200, json={"id": 1})]
+
+    async def run():
+        api = make_async_api(
+            lambda request: responses.pop(0), retry_policy=RetryPolicy(backoff_factor=0)
+        )
+        return await api.get_image(1)
+
+    assert asyncio.run(run()) == {"id": 1}
+    assert responses == []
@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+
+from media_management_sdk import Client
+from media_management_sdk.exceptions import ApiNotFoundError
+from media_management_sdk.snapshot import fetch_course_snapshot
+
+TEST_BASE_URL = "http://localhost:8000/api"
+TEST_CLIENT_ID = "myapp"
+TEST_CLIENT_SECRET = "07c91feb29b393e9418416aef05b433d9de7f638"
+
+
+def test_snapshot_contains_course_collections_and_images(make_mock_api):
+    api = make_mock_api(course_image_ids=[1])
+    snapshot = fetch_course_snapshot(api, 1)
+
+    assert snapshot.course == {"id": 1, "title": "Art History"}
+    assert [c["id"] for c in snapshot.collections] == [1, 2, 3]
+    assert snapshot.images == {
+        i: [{"id": i * 100 + 1, "collection_id": i, "course_image_id": 1}]
+        for i in (1, 2, 3)
+    }
+    assert set(snapshot.timings) == {
+        "get_course",
+        "list_collections",
+        "get_collection_images",
+        "total",
+    }
+    assert set(snapshot.timings["get_collection_images"]) == {1, 2, 3}
+
+
+def test_collection_images_are_requested_concurrently(make_mock_api):
+    num_collections = 4
+    barrier = threading.Barrier(num_collections, timeout=5)
+    api = make_mock_api(num_collections=num_collections)
+
+    def get_collection_images(collection_id):
+        barrier.wait()  # only passes if every request is in flight at once
+        return []
+
+    api.get_collection_images.side_effect = get_collection_images
+    snapshot = fetch_course_snapshot(api, 1, max_workers=num_collections)
+    assert len(snapshot.images) == num_collections
+
+
+def test_snapshot_raises_first_error(make_mock_api):
+    api = make_mock_api()
+    api.get_collection_images.side_effect = ApiNotFoundError("gone")
+    with pytest.raises(ApiNotFoundError):
+        fetch_course_snapshot(api, 1)
+
+
+def test_client_get_course_snapshot(make_mock_api):
+    client = Client(TEST_CLIENT_ID, TEST_CLIENT_SECRET, TEST_BASE_URL)
+    api = make_mock_api(course_image_ids=[1], num_collections=1)
+    client.api = api
+    snapshot = client.get_course_snapshot(1, max_workers=2)
+    api.get_course.assert_called_once_with(1)
+    assert snapshot.images == {
+        1: [{"id": 101, "collection_id": 1, "course_image_id": 1}]
+    }
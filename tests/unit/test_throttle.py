@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from media_management_sdk.api import API
+from media_management_sdk.throttle import Throttle
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    timer = Mock(return_value=0)
+    throttle = Throttle(rate=2, burst=2, timer=timer)
+
+    assert [throttle.reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+
+    timer.return_value = 10
+    assert throttle.reserve() == 0
+
+
+def test_acquire_sleeps_for_reserved_delay():
+    sleep = Mock()
+    throttle = Throttle(rate=10, burst=1, timer=Mock(return_value=0), sleep=sleep)
+    with throttle:
+        pass
+    with throttle:
+        pass
+
+    sleep.assert_called_once_with(pytest.approx(0.1))
+
+
+def test_no_rate_limit():
+    assert Throttle(max_in_flight=1).reserve() == 0
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        Throttle(rate=0)
+    with pytest.raises(ValueError):
+        Throttle(max_in_flight=0)
+
+
+def test_max_in_flight_is_shared_across_threads():
+    throttle = Throttle(max_in_flight=2)
+    lock = threading.Lock()
+    state = {"current": 0, "peak": 0}
+
+    def fake_get(url, **kwargs):
+        with lock:
+            state["current"] += 1
+            state["peak"] = max(state["peak"], state["current"])
+        time.sleep(0.01)
+        with lock:
+            state["current"] -= 1
+        response = Mock(status_code=200, content=b"{}")
+        return response
+
+    apis = [API(base_url=TEST_BASE_URL, throttle=throttle) for _ in range(2)]
+    for api in apis:
+        api.session.get = fake_get
+    threads = [
+        threading.Thread(target=apis[i % 2].get_image, args=(i,)) for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert state["peak"] == 2
+
+
+def test_async_max_in_flight(make_async_api):
+    state = {"current": 0, "peak": 0}
+
+    async def handler(request):
+        state["current"] += 1
+        state["peak"] = max(state["peak"], state["current"])
+        await asyncio.sleep(0.01)
+        state["current"] -= 1
+        return httpx.Response(200, json={})
+
+    async def run():
+        api = make_async_api(handler, throttle=Throttle(max_in_flight=3))
+        await asyncio.gather(*[api.get_image(i) for i in range(10)])
+
+    asyncio.run(run())
+    assert state["peak"] == 3
+
+
+def test_async_max_in_flight_is_shared_across_event_loops():
+    throttle = Throttle(max_in_flight=2)
+    lock = threading.Lock()
+    state = {"current": 0, "peak": 0}
+
+    async def request():
+        async with throttle:
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            await asyncio.sleep(0.01)
+            with lock:
+                state["current"] -= 1
+
+    async def run():
+        await asyncio.gather(*[request() for _ in range(5)])
+
+    asyncio.run(run())
+    threads = [threading.Thread(target=asyncio.run, args=(run(),)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert state["peak"] == 2
+
+
+def test_max_in_flight_is_shared_by_blocking_and_async_requests():
+    throttle = Throttle(max_in_flight=1)
+    throttle.acquire()
+    acquired = threading.Event()
+
+    async def run():
+        await throttle.acquire_async()
+        acquired.set()
+        throttle.release_async()
+
+    thread = threading.Thread(target=asyncio.run, args=(run(),))
+    thread.start()
+    assert not acquired.wait(0.05), "async request waits for the blocking one"
+    throttle.release()
+    thread.join()
+
+    assert acquired.is_set()
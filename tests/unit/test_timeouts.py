@@ -0,0 +1,123 @@
+import asyncio
+import io
+from unittest.mock import Mock, patch
+
+import pytest
+
+from media_management_sdk.api import API
+from media_management_sdk.exceptions import ApiDeadlineExceededError, ApiHTTPError
+from media_management_sdk.retry import RetryPolicy
+from media_management_sdk.throttle import Throttle
+from media_management_sdk.timeouts import (
+    DEFAULT_LONG_READ_TIMEOUT,
+    Timeout,
+    TimeoutConfig,
+    deadline,
+    time_remaining,
+)
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+def test_timeout_config_overrides():
+    config = TimeoutConfig(
+        default=5, overrides={"get_image": Timeout(connect=1, read=2)}
+    )
+    assert config.for_endpoint("get_image") == Timeout(connect=1, read=2)
+    assert config.for_endpoint("get_course") == Timeout(connect=5, read=5)
+    assert config.for_endpoint(None) == Timeout(connect=5, read=5)
+    assert config.for_endpoint("upload_images").read == DEFAULT_LONG_READ_TIMEOUT
+
+
+def test_requests_use_endpoint_timeouts(make_response):
+    api = API(
+        base_url=TEST_BASE_URL,
+        timeouts=TimeoutConfig(default=Timeout(connect=2, read=5)),
+    )
+    with patch.object(
+        api.session, "get", return_value=make_response(200)
+    ) as mock_get, patch.object(
+        api.session, "post", return_value=make_response(201, content=b"[]")
+    ) as mock_post:
+        api.get_image(1)
+        api.upload_image(1, io.BytesIO(b"data"), "a.png", "image/png", "A")
+
+    assert mock_get.call_args.kwargs["timeout"] == (2, 5)
+    assert mock_post.call_args.kwargs["timeout"] == (2, DEFAULT_LONG_READ_TIMEOUT)
+
+
+def test_deadline_reduces_timeouts(make_response):
+    api = API(base_url=TEST_BASE_URL)
+    with patch.object(api.session, "get", return_value=make_response(200)) as mock_get:
+        with deadline(3):
+            api.get_course(1)
+
+    connect, read = mock_get.call_args.kwargs["timeout"]
+    assert 2 < connect <= 3
+    assert 2 < read <= 3
+
+
+def test_nested_deadlines_only_shorten():
+    assert time_remaining() is None
+    with deadline(5):
+        with deadline(60):
+            assert time_remaining() <= 5
+        with deadline(1):
+            assert time_remaining() <= 1
+    assert time_remaining() is None
+
+
+def test_expired_deadline_raises():
+    api = API(base_url=TEST_BASE_URL)
+    api.session.get = Mock()
+    with deadline(0):
+        with pytest.raises(ApiDeadlineExceededError):
+            api.get_course(1)
+
+    api.session.get.assert_not_called()
+
+
+def test_deadline_that_expires_while_throttled_raises(make_response):
+    api = API(base_url=TEST_BASE_URL, throttle=Throttle(rate=5, burst=1))
+    api.session.get = Mock(return_value=make_response(200))
+    with deadline(0.1):
+        api.get_image(1)
+        with pytest.raises(ApiDeadlineExceededError):
+            api.get_image(2)
+
+    assert api.session.get.call_count == 1
+
+
+def test_async_deadline_that_expires_while_throttled_raises(make_async_api):
+    httpx = pytest.importorskip("httpx")
+    requests_sent = []
+
+    def handler(request):
+        requests_sent.append(request)
+        return httpx.Response(200, json={})
+
+    async def run():
+        api = make_async_api(handler, throttle=Throttle(rate=5, burst=1))
+        with deadline(0.1):
+            await api.get_image(1)
+            with pytest.raises(ApiDeadlineExceededError):
+                await api.get_image(2)
+
+    asyncio.run(run())
+    assert len(requests_sent) == 1
+
+
+def test_retries_that_would_miss_the_deadline_are_skipped(make_response):
+    api = API(
+        base_url=TEST_BASE_URL,
+        retry_policy=RetryPolicy(backoff_factor=10, jitter=False),
+    )
+    with patch.object(
+        api.session, "get", return_value=make_response(503)
+    ) as mock_get, patch("time.sleep") as mock_sleep:
+        with deadline(5):
+            with pytest.raises(ApiHTTPError):
+                api.get_course(1)
+
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
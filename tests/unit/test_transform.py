@@ -0,0 +1,140 @@
+import concurrent.futures
+import io
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from media_management_sdk import transform
+from media_management_sdk.api import API
+from media_management_sdk.dedup import MemoryDedupIndex
+from media_management_sdk.transform import (
+    ImageTransform,
+    ImageTransformer,
+    TransformResult,
+    transform_image,
+)
+
+TEST_BASE_URL = "http://localhost:8000/api"
+
+
+def make_image(format, size=(400, 300), mode="RGB", exif=None):
+    Image = pytest.importorskip("PIL.Image")
+    image = Image.new(mode, size, color="red")
+    output = io.BytesIO()
+    options = {"exif": exif} if exif is not None else {}
+    image.save(output, format=format, **options)
+    return output.getvalue()
+
+
+def open_image(data):
+    Image = pytest.importorskip("PIL.Image")
+    return Image.open(io.BytesIO(data))
+
+
+def test_large_image_is_downscaled():
+    data = make_image("JPEG", size=(4000, 3000))
+    result = transform_image(
+        data, "photo.jpg", "image/jpeg", ImageTransform(max_width=1000)
+    )
+    assert open_image(result.data).size == (1000, 750)
+    assert result.file_name == "photo.jpg"
+    assert result.bytes_saved > 0
+
+
+def test_image_is_converted_to_webp():
+    data = make_image("PNG", mode="RGBA")
+    result = transform_image(
+        data, "scan.png", "image/png", ImageTransform(format="webp")
+    )
+    assert result.file_name == "scan.webp"
+    assert result.content_type == "image/webp"
+    assert open_image(result.data).format == "WEBP"
+
+
+def test_exif_is_stripped():
+    Image = pytest.importorskip("PIL.Image")
+    exif = Image.Exif()
+    exif[0x010F] = "Camera Maker"
+    data = make_image("JPEG", exif=exif.tobytes())
+    result = transform_image(data, "photo.jpg", "image/jpeg", ImageTransform())
+    assert "exif" not in open_image(result.data).info
+
+    kept = transform_image(
+        data, "photo.jpg", "image/jpeg", ImageTransform(strip_exif=False)
+    )
+    assert "exif" in open_image(kept.data).info
+
+
+def test_other_files_are_unchanged():
+    pytest.importorskip("PIL.Image")
+    data = make_image("GIF")
+    assert transform_image(data, "a.gif", "image/gif", ImageTransform()).data == data
+    result = transform_image(b"not an image", "a.txt", "text/plain", ImageTransform())
+    assert result.data == b"not an image"
+    assert result.bytes_saved == 0
+
+
+def test_decompression_bombs_are_unchanged(monkeypatch):
+    Image = pytest.importorskip("PIL.Image")
+    data = make_image("PNG", size=(400, 300))
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100 * 75 // 2)
+    result = transform_image(
+        data, "huge.png", "image/png", ImageTransform(max_width=100)
+    )
+    assert result.data == data
+
+
+def test_files_are_transformed_in_process_pool():
+    data = make_image("PNG", size=(800, 800))
+    with ImageTransformer(ImageTransform(max_width=100), max_workers=2) as transformer:
+        files = transformer.transform_files(
+            [("a.png", io.BytesIO(data), "image/png") for _ in range(2)]
+        )
+    assert [open_image(fp.read()).size for (name, fp, content_type) in files] == [
+        (100, 100),
+        (100, 100),
+    ]
+    assert transformer.files == 2
+    assert transformer.bytes_saved > 0
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        ImageTransform(format="BMP")
+    with pytest.raises(ValueError):
+        ImageTransform(quality=0)
+
+
+def test_transformer_requires_pillow(monkeypatch):
+    monkeypatch.setattr(transform, "Image", None)
+    with pytest.raises(ImportError):
+        ImageTransformer(ImageTransform())
+
+
+def fake_transform_image(data, file_name, content_type, settings):
+    return TransformResult("small-" + file_name, "image/webp", data[:1], len(data))
+
+
+def test_upload_sends_transformed_files(monkeypatch):
+    monkeypatch.setattr(transform, "Image", object())
+    monkeypatch.setattr(transform, "transform_image", fake_transform_image)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    transformer = ImageTransformer(ImageTransform(), executor=executor)
+    api = API(
+        base_url=TEST_BASE_URL,
+        transformer=transformer,
+        dedup_index=MemoryDedupIndex(),
+    )
+    response = Mock(status_code=201, content=json.dumps([{"id": 1}]).encode())
+
+    with patch.object(api.session, "post", return_value=response) as mock_post:
+        api.upload_image(1, io.BytesIO(b"abcd"), "a.jpg", "image/jpeg", "A")
+        api.upload_image(1, io.BytesIO(b"abcd"), "a.jpg", "image/jpeg", "A")
+    executor.shutdown()
+
+    assert mock_post.call_count == 1  # the duplicate was not transformed again
+    name, fp, content_type = mock_post.call_args[1]["files"][0][1]
+    assert (name, fp.read(), content_type) == ("small-a.jpg", b"a", "image/webp")
+    assert transformer.files == 1
+    assert transformer.bytes_saved == 3